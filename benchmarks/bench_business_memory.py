@@ -0,0 +1,50 @@
+"""Per-instance memory and construction time of Business, against the old dict-backed layout"""
+import os
+import sys
+import timeit
+import tracemalloc
+from types import SimpleNamespace
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+sys.path.insert(0, ROOT)
+
+from entities.business import Business, BusinessType
+
+COUNT = 10_000
+TYPES = list(BusinessType)
+
+def legacy_business(business_type: BusinessType, floor: int):
+    """The pre-spec layout: a __dict__ per instance with its own copies of the type tables"""
+    spec = Business(business_type, floor).spec
+    return SimpleNamespace(
+        type=business_type, floor=floor, name="", category=spec.category, popularity=50,
+        income=spec.base_income, actual_income=0, maintenance_cost=spec.maintenance,
+        staff=spec.staff, customers=[], size=spec.size, is_open=True, satisfaction=100,
+        events=[], event_duration=0, nearby_businesses=[], synergy_bonus=0.0,
+        active_combos=set(), peak_hours=[tuple(p) for p in spec.peak_hours],
+        customer_types=list(spec.customer_types))
+
+def measure(factory) -> float:
+    """Bytes allocated per instance when building COUNT businesses"""
+    tracemalloc.start()
+    start = tracemalloc.take_snapshot()
+    businesses = [factory(TYPES[i % len(TYPES)], i) for i in range(COUNT)]
+    end = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in end.compare_to(start, 'filename'))
+    del businesses
+    return total / COUNT
+
+def main():
+    print(f"{COUNT} businesses")
+    legacy = measure(legacy_business)
+    slotted = measure(Business)
+    print(f"  dict-backed layout: {legacy:8.1f} bytes/instance")
+    print(f"  __slots__ + spec:   {slotted:8.1f} bytes/instance ({legacy / slotted:.2f}x smaller)")
+    
+    seconds = timeit.timeit(lambda: Business(BusinessType.HOTEL, 0), number=COUNT)
+    print(f"  construction:       {seconds / COUNT * 1e6:8.2f} us/instance")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""Compare the heap-backed event queue against the old sorted-list queue"""
+import os
+import random
+import sys
+import timeit
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+sys.path.insert(0, ROOT)
+
+from core.time_system import EventQueue, GameEvent, EventPriority
+
+SIZES = (1000, 5000, 50000)
+LIST_LIMIT = 5000  # The sorted list gets too slow to wait for beyond this
+
+def make_events(count: int):
+    rng = random.Random(1)
+    priorities = list(EventPriority)
+    return [GameEvent(rng.randrange(86400 * 30), None,
+                      priority=rng.choice(priorities)) for _ in range(count)]
+
+def sorted_list(events):
+    """Schedule with append+sort and drain with pop(0), as TimeSystem used to"""
+    queue = []
+    for event in events:
+        queue.append(event)
+        queue.sort()
+    while queue:
+        queue.pop(0)
+
+def heap(events):
+    queue = EventQueue()
+    for event in events:
+        queue.push(event)
+    while queue:
+        queue.pop()
+
+def main():
+    for count in SIZES:
+        events = make_events(count)
+        new = timeit.timeit(lambda: heap(events), number=1)
+        if count <= LIST_LIMIT:
+            old = timeit.timeit(lambda: sorted_list(events), number=1)
+            print(f"{count:6} events: sorted list {old:.3f}s  heap {new:.3f}s  ({old / new:.0f}x)")
+        else:
+            print(f"{count:6} events: heap {new:.3f}s")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""Run the headless simulation for many game days and report throughput"""
+import os
+import sys
+import time
+from datetime import timedelta
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+sys.path.insert(0, ROOT)
+
+from core.simulation import Simulation
+from entities.business import BusinessType
+
+DAYS = 10
+SEED = 1  # Fixed so runs are comparable
+FLOORS = 300
+
+def build(columnar: bool = False) -> Simulation:
+    """A tall tower filled with a repeating mix of businesses"""
+    sim = Simulation(map_name=None, columnar=columnar, seed=SEED)
+    while len(sim.tower.floors) < FLOORS:
+        sim.tower.add_floor()
+    types = list(BusinessType)
+    floor = 0
+    while floor < FLOORS:
+        business_type = types[floor % len(types)]
+        sim.tower.add_business(business_type, floor)
+        floor += 1
+    return sim
+
+def main():
+    for columnar in (False, True):
+        sim = build(columnar)
+        start = time.perf_counter()
+        sim.run_days(DAYS)
+        elapsed = time.perf_counter() - start
+        label = 'columnar' if columnar else 'scalar'
+        print(f"{label:8}: {len(sim.tower.businesses)} businesses, {DAYS} days, "
+              f"{sim.ticks} ticks in {elapsed:.2f}s ({sim.ticks / elapsed:,.0f} ticks/s)")
+        
+        sim = build(columnar)
+        start = time.perf_counter()
+        jumps = sim.fast_forward(timedelta(days=DAYS))
+        elapsed = time.perf_counter() - start
+        print(f"{label:8}: fast-forward {DAYS} days in {jumps} jumps, {elapsed * 1000:.0f}ms")
+    print('kivy imported:', 'kivy' in sys.modules)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""Compare OccupancyIndex placement checks against the per-tile grid scan"""
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.occupancy import OccupancyIndex
+
+FLOORS = 300
+WIDTH = 20
+SIZES = [(3, 2), (2, 1), (4, 2), (3, 1)]
+
+def build(fill: float = 0.6):
+    """Build a grid and an index holding the same random layout"""
+    grid = [[None] * WIDTH for _ in range(FLOORS)]
+    index = OccupancyIndex(WIDTH, FLOORS)
+    for _ in range(FLOORS):
+        index.add_floor()
+    rng = random.Random(42)
+    for _ in range(int(FLOORS * fill * 4)):
+        w, h = rng.choice(SIZES)
+        x, y = rng.randrange(WIDTH - w + 1), rng.randrange(FLOORS - h + 1)
+        if index.fits(x, y, w, h):
+            index.occupy(x, y, w, h)
+            for dy in range(h):
+                for dx in range(w):
+                    grid[y + dy][x + dx] = 1
+    return grid, index
+
+def scan_fits(grid, x, y, w, h):
+    """Placement check as done by the old Tower.can_place_building"""
+    for dx in range(w):
+        for dy in range(h):
+            cx, cy = x + dx, y + dy
+            if not (0 <= cy < len(grid) and 0 <= cx < WIDTH) or grid[cy][cx] is not None:
+                return False
+    return True
+
+def scan_free_span(grid, size):
+    """First run of `size` empty floors by walking every floor"""
+    run = 0
+    for f, row in enumerate(grid):
+        run = run + 1 if all(t is None for t in row) else 0
+        if run == size:
+            return f - size + 1
+    return None
+
+def main():
+    grid, index = build()
+    rng = random.Random(7)
+    queries = [(rng.randrange(WIDTH), rng.randrange(FLOORS)) + rng.choice(SIZES)
+               for _ in range(10000)]
+    
+    assert all(scan_fits(grid, *q) == index.fits(*q) for q in queries)
+    assert scan_free_span(grid, 2) == index.next_free_span(2)
+    
+    scan = timeit.timeit(lambda: [scan_fits(grid, *q) for q in queries], number=5)
+    fast = timeit.timeit(lambda: [index.fits(*q) for q in queries], number=5)
+    print(f"fits x{len(queries)}:       scan {scan:.4f}s  index {fast:.4f}s  ({scan / fast:.1f}x)")
+    
+    scan = timeit.timeit(lambda: scan_free_span(grid, 2), number=200)
+    fast = timeit.timeit(lambda: index.next_free_span(2), number=200)
+    print(f"free span (k=2) x200: scan {scan:.4f}s  index {fast:.4f}s  ({scan / fast:.1f}x)")
+
+if __name__ == '__main__':
+    main()
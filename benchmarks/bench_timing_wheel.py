@@ -0,0 +1,49 @@
+"""Compare the heap and timing wheel TimeSystem backends with 10k recurring timers"""
+import os
+import random
+import sys
+import time
+from datetime import timedelta
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+sys.path.insert(0, ROOT)
+
+from core.config import Config
+from core.time_system import TimeSystem, EventPriority
+
+TIMERS = (10000, 100000)
+HOURS = 6
+# Shift changes, rent and inspections at a mix of periods
+INTERVALS = (timedelta(minutes=15), timedelta(hours=1), timedelta(hours=8), timedelta(days=1))
+
+def run(backend: str, timers: int):
+    rng = random.Random(1)
+    time_system = TimeSystem(Config, backend=backend)
+    fired = [0]
+    
+    def tick(data):
+        fired[0] += 1
+    
+    start = time.perf_counter()
+    for _ in range(timers):
+        interval = rng.choice(INTERVALS)
+        first = time_system.current_time + timedelta(seconds=rng.randrange(int(interval.total_seconds())))
+        time_system.schedule_recurring_event(tick, first, interval, EventPriority.LOW)
+    scheduled = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    time_system.advance(timedelta(hours=HOURS))
+    elapsed = time.perf_counter() - start
+    return scheduled, elapsed, fired[0]
+
+def main():
+    for timers in TIMERS:
+        print(f"{timers} recurring timers over {HOURS} game hours")
+        for backend in ('heap', 'wheel'):
+            scheduled, elapsed, fired = run(backend, timers)
+            print(f"  {backend:6}: schedule {scheduled * 1000:.0f}ms  run {elapsed:.2f}s  "
+                  f"({fired:,} firings, {fired / elapsed:,.0f}/s)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,225 @@
+import numpy as np
+from typing import Dict, List, Optional
+from entities.business import Business, BusinessType, BUSINESS_SPECS, DEFAULT_SPEC
+
+
+class BusinessStore:
+    """Columnar storage for business state.
+
+    Each business gets a row id; its hot fields live in NumPy arrays so the
+    whole tower can be updated with a few vectorized expressions per tick.
+    """
+
+    FLOAT_COLUMNS = ('popularity', 'satisfaction', 'synergy_bonus', 'income',
+                     'actual_income', 'maintenance_cost', 'event_duration')
+    INT_COLUMNS = ('size', 'customers', 'type_code')
+    BOOL_COLUMNS = ('is_open', 'has_combo', 'active')
+
+    def __init__(self, capacity: int = 64):
+        self.capacity = 0
+        self.columns: Dict[str, np.ndarray] = {}
+        for name in self.FLOAT_COLUMNS:
+            self.columns[name] = np.zeros(0, dtype=np.float64)
+        for name in self.INT_COLUMNS:
+            self.columns[name] = np.zeros(0, dtype=np.int64)
+        for name in self.BOOL_COLUMNS:
+            self.columns[name] = np.zeros(0, dtype=bool)
+        self.businesses: List[Optional[Business]] = []
+        self.free_ids: List[int] = []
+        self.count = 0  # Rows handed out so far, including freed ones
+        self.type_codes = {t: i for i, t in enumerate(BusinessType)}
+        # Time-of-day modifier by (type code, hour), so a tick gathers every row's in one index
+        self.hour_table = np.array([BUSINESS_SPECS.get(t, DEFAULT_SPEC).hour_modifiers
+                                    for t in BusinessType])
+        self._grow(capacity)
+
+    def __getattr__(self, name):
+        try:
+            return self.__dict__['columns'][name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def _grow(self, capacity: int) -> None:
+        """Resize every column to the given capacity"""
+        for name, column in self.columns.items():
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:self.capacity] = column
+            self.columns[name] = grown
+        self.businesses.extend([None] * (capacity - self.capacity))
+        self.capacity = capacity
+
+    def allocate(self, business: Business) -> int:
+        """Reserve a row for a business"""
+        if self.free_ids:
+            sid = self.free_ids.pop()
+        else:
+            sid = self.count
+            self.count += 1
+            if sid >= self.capacity:
+                self._grow(max(64, self.capacity * 2))
+        for column in self.columns.values():
+            column[sid] = 0
+        self.columns['active'][sid] = True
+        self.columns['is_open'][sid] = True
+        self.businesses[sid] = business
+        return sid
+
+    def register_type(self, sid: int, business_type: BusinessType) -> None:
+        """Record a row's business type"""
+        self.columns['type_code'][sid] = self.type_codes.get(business_type, 0)
+
+    def release(self, sid: int) -> None:
+        """Free a row so it can be reused"""
+        self.columns['active'][sid] = False
+        self.businesses[sid] = None
+        self.free_ids.append(sid)
+
+    def _time_modifiers(self, rows: np.ndarray, current_hour: float) -> np.ndarray:
+        """Time-of-day modifier for the given rows"""
+        return self.hour_table[self.type_code[rows], int(current_hour) % 24]
+
+    def apply_combo_effects(self) -> None:
+        """Vectorized Business.apply_combo_effects"""
+        rows = self.active & self.has_combo
+        self.satisfaction[rows] = np.minimum(100, self.satisfaction[rows] + 0.2)
+        self.popularity[rows] = np.minimum(100, self.popularity[rows] + 0.1)
+
+    def update(self, dt: float, current_hour: float, visitor_rate: float = 1.0) -> None:
+        """Vectorized Business.update for every open business"""
+        rows = self.active & self.is_open
+
+        # Count down events and let the owning objects clear their event lists
+        timed = rows & (self.event_duration > 0)
+        self.event_duration[timed] -= dt
+        for sid in np.flatnonzero(timed & (self.event_duration <= 0)):
+            self.businesses[sid].events.clear()
+
+        time_modifier = self._time_modifiers(rows, current_hour)
+        popularity = self.popularity[rows]
+        satisfaction = self.satisfaction[rows]
+
+        # Income with all modifiers
+        base_modifier = (popularity + satisfaction) / 200
+        self.actual_income[rows] = (self.income[rows] * base_modifier *
+                                    (1 + self.synergy_bonus[rows]) * time_modifier)
+
+        # Move customer counts toward their target, at most 5 per tick
+        capacity = self.size[rows] * 20
+        target = (capacity * time_modifier * visitor_rate * (popularity / 100)).astype(np.int64)
+        customers = self.customers[rows]
+        customers += np.clip(target - customers, -5, 5)
+        self.customers[rows] = customers
+
+        # Satisfaction from overcrowding and maintenance
+        satisfaction = np.where(customers / capacity > 1,
+                                np.maximum(0, satisfaction - 0.5), satisfaction)
+        satisfaction = np.where(self.maintenance_cost[rows] > 0,
+                                np.minimum(100, satisfaction + 0.1),
+                                np.maximum(0, satisfaction - 0.2))
+        self.satisfaction[rows] = satisfaction
+
+    def integrate(self, ticks: float, current_hour: float, seconds: float,
+                  visitor_rate: float = 1.0) -> None:
+        """Vectorized Business.integrate over every open business"""
+        rows = self.active & self.is_open
+
+        timed = rows & (self.event_duration > 0)
+        self.event_duration[timed] -= seconds
+        for sid in np.flatnonzero(timed & (self.event_duration <= 0)):
+            self.businesses[sid].events.clear()
+
+        combos = rows & self.has_combo
+        self.satisfaction[combos] = np.minimum(100, self.satisfaction[combos] + 0.2 * ticks)
+        self.popularity[combos] = np.minimum(100, self.popularity[combos] + 0.1 * ticks)
+
+        time_modifier = self._time_modifiers(rows, current_hour)
+        popularity = self.popularity[rows]
+        capacity = self.size[rows] * 20
+        target = (capacity * time_modifier * visitor_rate * (popularity / 100)).astype(np.int64)
+        customers = self.customers[rows]
+        step = int(5 * ticks)
+        customers += np.clip(target - customers, -step, step)
+        self.customers[rows] = customers
+
+        drift = np.where(self.maintenance_cost[rows] > 0, 0.1, -0.2) - np.where(customers > capacity, 0.5, 0)
+        satisfaction = np.clip(self.satisfaction[rows] + drift * ticks, 0, 100)
+        self.satisfaction[rows] = satisfaction
+
+        self.actual_income[rows] = (self.income[rows] * (popularity + satisfaction) / 200 *
+                                    (1 + self.synergy_bonus[rows]) * time_modifier)
+
+    def mean(self, column: str) -> float:
+        """Mean of a column over live businesses"""
+        values = self.columns[column][self.active]
+        return float(values.mean()) if len(values) else 0.0
+
+    def total(self, column: str) -> float:
+        """Sum of a column over live businesses"""
+        return float(self.columns[column][self.active].sum())
+
+
+def _column(name: str, cast=float):
+    """Property that reads and writes a BusinessStore column"""
+    def getter(self):
+        return cast(self._store.columns[name][self._sid])
+
+    def setter(self, value):
+        self._store.columns[name][self._sid] = value
+
+    return property(getter, setter)
+
+
+class ColumnarBusiness(Business):
+    """Business whose hot state lives in a BusinessStore row"""
+    __slots__ = ('_store', '_sid')
+
+    popularity = _column('popularity')
+    satisfaction = _column('satisfaction')
+    synergy_bonus = _column('synergy_bonus')
+    income = _column('income')
+    actual_income = _column('actual_income')
+    maintenance_cost = _column('maintenance_cost')
+    event_duration = _column('event_duration')
+    size = _column('size', int)
+    is_open = _column('is_open', bool)
+
+    def __init__(self, type: BusinessType, floor: int, store: BusinessStore):
+        self._store = store
+        self._sid = store.allocate(self)
+        super().__init__(type, floor)
+        store.register_type(self._sid, type)
+
+    @property
+    def customers(self) -> list:
+        """Customers are only counted in columnar mode"""
+        return [None] * int(self._store.columns['customers'][self._sid])
+
+    @customers.setter
+    def customers(self, value) -> None:
+        self._store.columns['customers'][self._sid] = len(value)
+
+    def add_customer(self, customer):
+        """Add a new customer to the business"""
+        self._store.columns['customers'][self._sid] += 1
+        return True
+
+    def remove_customer(self, customer):
+        """Remove a customer from the business"""
+        if self._store.columns['customers'][self._sid] <= 0:
+            return False
+        self._store.columns['customers'][self._sid] -= 1
+        return True
+
+    def _adjust_customers(self, change: int) -> None:
+        """Change the customer count column; the scalar update paths go through here"""
+        count = self._store.columns['customers'][self._sid] + change
+        self._store.columns['customers'][self._sid] = max(0, count)
+
+    def set_synergy(self, bonus: float, active_combos: set) -> None:
+        """Store synergy and record whether a combo is active"""
+        super().set_synergy(bonus, active_combos)
+        self._store.columns['has_combo'][self._sid] = bool(active_combos)
+
+    def release(self) -> None:
+        """Give the storage row back to the store"""
+        self._store.release(self._sid)
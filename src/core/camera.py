@@ -0,0 +1,55 @@
+from typing import Tuple
+
+
+class Camera:
+    """Vertical viewport over the tower.
+
+    Tracks which floor sits at the bottom of the view and the zoom level, and
+    works out which floors are visible and how much detail to draw them with.
+    """
+
+    MIN_ZOOM = 0.02
+    MAX_ZOOM = 4.0
+    DETAIL_PIXELS = 8  # Below this many pixels per floor, floors collapse into bands
+    BAND_PIXELS = 4  # Minimum on-screen height of one collapsed band
+
+    def __init__(self, max_floors: int = 300):
+        self.max_floors = max_floors
+        self.scroll_y = 0.0  # Floor number at the bottom edge of the view
+        self.zoom = 1.0
+
+    def floor_pixels(self, grid_size: float) -> float:
+        """On-screen height of one floor"""
+        return grid_size * self.zoom
+
+    def scroll(self, floors: float) -> None:
+        """Move the view up or down by a number of floors"""
+        self.scroll_y = min(max(0.0, self.scroll_y + floors), float(self.max_floors - 1))
+
+    def set_zoom(self, zoom: float) -> None:
+        """Set the zoom level, clamped to the allowed range"""
+        self.zoom = min(max(zoom, self.MIN_ZOOM), self.MAX_ZOOM)
+
+    def zoom_by(self, factor: float) -> None:
+        """Multiply the zoom level by a factor"""
+        self.set_zoom(self.zoom * factor)
+
+    def visible_floors(self, view_height: float, grid_size: float) -> Tuple[int, int]:
+        """Return the (first, last) floors intersecting a view of the given height"""
+        first = max(0, int(self.scroll_y))
+        last = int(self.scroll_y + view_height / self.floor_pixels(grid_size))
+        return first, min(last, self.max_floors - 1)
+
+    def lod_block(self, grid_size: float) -> int:
+        """Number of floors merged into one band; 1 means full detail"""
+        pixels = self.floor_pixels(grid_size)
+        if pixels >= self.DETAIL_PIXELS:
+            return 1
+        block = 2
+        while block * pixels < self.BAND_PIXELS:
+            block *= 2
+        return block
+
+    def screen_to_floor(self, y: float, grid_size: float) -> int:
+        """Convert a y offset inside the view to a floor number"""
+        return int(self.scroll_y + y / self.floor_pixels(grid_size))
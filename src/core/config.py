@@ -28,6 +28,8 @@ class Config:
     WINDOW_WIDTH = 1280
     WINDOW_HEIGHT = 720
     FPS = 60
+    SIM_TICK_RATE = 10  # Simulation ticks per second, independent of FPS
+    MAX_FRAME_TIME = 0.25  # Longest stall (seconds) the simulation catches up on in one frame
     
     # Game settings
     TILE_SIZE = 32
@@ -1,6 +1,9 @@
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 from datetime import datetime
+from core.ledger import TransactionLedger, DAY
+from core.modifiers import ModifierStack
+from core.time_system import to_datetime
 
 @dataclass
 class RevenueStream:
@@ -22,26 +25,53 @@ class ExpenseItem:
 
 class Economy:
     """Manages the game's economy, including revenue, expenses, and upgrades."""
+    REVENUE_CATEGORIES = ('businesses', 'mini_games', 'events')
+    EXPENSE_CATEGORIES = ('maintenance', 'salaries')
+
     def __init__(self):
         self.balance = 1000  # Starting balance
-        self.revenue_streams: Dict[str, float] = {
-            'businesses': 0,
-            'mini_games': 0,
-            'events': 0
-        }
-        self.expenses: Dict[str, float] = {
-            'maintenance': 0,
-            'salaries': 0
-        }
+        # Every revenue and expense is booked here; daily figures are reads of its totals
+        self.ledger = TransactionLedger(self.REVENUE_CATEGORIES + self.EXPENSE_CATEGORIES)
+        self.now = 0  # Game ticks stamped on transactions booked without a time
         self.upgrades: List[Dict] = []  # List of active upgrades
+        # Keyed effects on business income and running costs, e.g. events, sales and upgrades
+        self.income_modifiers = ModifierStack()
+        self.expense_modifiers = ModifierStack()
+
+    def _day_totals(self, categories) -> Dict[str, float]:
+        return {category: self.ledger.total('day', (category,), self.now) for category in categories}
+
+    @property
+    def revenue_streams(self) -> Dict[str, float]:
+        """Today's revenue by source"""
+        return self._day_totals(self.REVENUE_CATEGORIES)
+
+    @property
+    def expenses(self) -> Dict[str, float]:
+        """Today's expenses by category"""
+        return self._day_totals(self.EXPENSE_CATEGORIES)
 
     def calculate_daily_revenue(self) -> float:
         """Calculate total daily revenue."""
-        return sum(self.revenue_streams.values())
+        return self.ledger.total('day', self.REVENUE_CATEGORIES, self.now)
 
     def calculate_daily_expenses(self) -> float:
         """Calculate total daily expenses."""
-        return sum(self.expenses.values())
+        return self.ledger.total('day', self.EXPENSE_CATEGORIES, self.now)
+
+    def get_current_income(self) -> float:
+        return self.calculate_daily_revenue()
+
+    def get_current_expenses(self) -> float:
+        return self.calculate_daily_expenses()
+
+    def get_financial_report(self) -> Dict[str, float]:
+        """Balance plus revenue and expenses for the current hour, day and week."""
+        report = {'balance': self.balance}
+        for period in ('hour', 'day', 'week'):
+            report[f'{period}ly_revenue'] = self.ledger.total(period, self.REVENUE_CATEGORIES, self.now)
+            report[f'{period}ly_expenses'] = self.ledger.total(period, self.EXPENSE_CATEGORIES, self.now)
+        return report
 
     def update_balance(self) -> None:
         """Update the balance based on revenue and expenses."""
@@ -49,29 +79,71 @@ class Economy:
         daily_expenses = self.calculate_daily_expenses()
         self.balance += daily_revenue - daily_expenses
 
-    def add_revenue(self, source: str, amount: float) -> None:
+    def _book(self, category: str, amount: float, source: str, time: Optional[int]) -> None:
+        if time is not None:
+            self.now = time
+        self.ledger.record(self.now, amount, category, source)
+
+    def add_revenue(self, source: str, amount: float, time: Optional[int] = None) -> None:
         """Add revenue to a specific source."""
-        if source in self.revenue_streams:
-            self.revenue_streams[source] += amount
+        if source in self.REVENUE_CATEGORIES:
+            self._book(source, amount, source, time)
 
-    def add_expense(self, category: str, amount: float) -> None:
+    def add_expense(self, category: str, amount: float, time: Optional[int] = None) -> None:
         """Add an expense to a specific category."""
-        if category in self.expenses:
-            self.expenses[category] += amount
+        if category in self.EXPENSE_CATEGORIES:
+            self._book(category, amount, category, time)
+
+    def accrue(self, daily_revenue: float, daily_expenses: float, seconds: float,
+               time: Optional[int] = None) -> None:
+        """Accrue business revenue and maintenance for a slice of game time."""
+        if time is not None:
+            self.income_modifiers.expire(time)
+            self.expense_modifiers.expire(time)
+        fraction = seconds / 86400
+        self._book('businesses', self.income_modifiers.apply(daily_revenue) * fraction, 'accrual', time)
+        self._book('maintenance', self.expense_modifiers.apply(daily_expenses) * fraction, 'accrual', time)
+
+    def add_modifier(self, source, multiplier: float, expires: Optional[int] = None) -> None:
+        """Scale business income while a source is active."""
+        self.income_modifiers.set(source, multiplier, expires=expires)
+
+    def remove_modifier(self, source) -> bool:
+        """Undo a source's effect on business income."""
+        return self.income_modifiers.remove(source)
+
+    def apply_multiplier(self, multiplier: float, source='multiplier') -> None:
+        """Set an income multiplier for a source; 1.0 clears it."""
+        if multiplier == 1.0:
+            self.income_modifiers.remove(source)
+        else:
+            self.income_modifiers.set(source, multiplier)
+
+    def set_price_multiplier(self, multiplier: float) -> None:
+        """Set the price level, e.g. for a sale; 1.0 is full price."""
+        self.apply_multiplier(multiplier, 'price')
 
     def apply_upgrade(self, upgrade: Dict) -> None:
         """Apply an upgrade to the economy system."""
+        source = ('upgrade', len(self.upgrades))
         self.upgrades.append(upgrade)
         if 'revenue_multiplier' in upgrade:
-            for source in self.revenue_streams:
-                self.revenue_streams[source] *= upgrade['revenue_multiplier']
+            self.income_modifiers.set(source, upgrade['revenue_multiplier'])
         if 'expense_reduction' in upgrade:
-            for category in self.expenses:
-                self.expenses[category] *= (1 - upgrade['expense_reduction'])
+            self.expense_modifiers.set(source, 1 - upgrade['expense_reduction'])
 
     def reset_daily_values(self) -> None:
         """Reset daily revenue and expenses for a new day."""
-        for key in self.revenue_streams:
-            self.revenue_streams[key] = 0
-        for key in self.expenses:
-            self.expenses[key] = 0
+        # Later bookings without a time go into the next day's totals
+        self.now = (self.now // DAY + 1) * DAY
+
+    def transactions(self, start: int = 0) -> List:
+        """Stored ledger rows from a game time on, as RevenueStream and ExpenseItem records."""
+        records = []
+        for time, amount, category, source in self.ledger.rows(start):
+            if category in self.REVENUE_CATEGORIES:
+                records.append(RevenueStream(source, amount, source_type=category,
+                                             timestamp=to_datetime(time)))
+            else:
+                records.append(ExpenseItem(source, amount, category, timestamp=to_datetime(time)))
+        return records
@@ -1,15 +1,18 @@
 from kivy.uix.widget import Widget
 from kivy.graphics import Rectangle, Color, Line
+from kivy.clock import mainthread
 from kivy.properties import NumericProperty, BooleanProperty, StringProperty, ObjectProperty, ListProperty
 from core.tower import Tower
-from core.economy import Economy
-from core.time_system import TimeSystem
+from core.simulation import Simulation
+from core.sim_thread import SimulationThread
 from core.config import Config, EventType
+from core.camera import Camera
+from core.notifications import NotificationPipeline
 from utils.asset_manager import AssetManager
 from datetime import timedelta
 from typing import Dict, Any, List, Optional
-import random
 from entities.business import BusinessType
+from core.rng import RNGService
 
 class Game(Widget):
     money = NumericProperty(1000000)
@@ -22,17 +25,34 @@ class Game(Widget):
     population = NumericProperty(0)
     star_rating = NumericProperty(1)
     
-    def __init__(self, map_name: str = "tokyo_tower", **kwargs):
+    def __init__(self, map_name: str = "tokyo_tower", threaded: bool = False,
+                 seed: Optional[int] = None, **kwargs):
         super(Game, self).__init__(**kwargs)
         
         # Initialize asset manager
         self.asset_manager = AssetManager()
         
-        # Initialize game systems
-        self.tower = Tower(map_name=map_name)
-        self.economy = Economy()
-        self.time_system = TimeSystem(Config)
+        # Initialize game systems; the widgets are views over the headless simulation
+        self.sim = Simulation(map_name=map_name, config=Config, seed=seed)
+        self.rng = self.sim.rng
+        self.tower = Tower(core=self.sim.tower)
+        self.camera = Camera(Tower.MAX_FLOORS)
+        self.economy = self.sim.economy
+        self.time_system = self.sim.time_system
+        self.notifications = NotificationPipeline()
         self.active_events = {}
+        self._event_effects = None  # Result of the last event-effects pass, a Future when threaded
+        
+        # Optionally tick the simulation on a worker thread; the UI then only reads its snapshots
+        self.sim_thread = None
+        if threaded:
+            self.sim_thread = SimulationThread(self.sim)
+            # Callbacks fired by the worker must touch widgets on the Kivy thread
+            self.sim.tower.on_floors_changed = mainthread(self.tower.redraw_floors)
+            self.sim.tower.on_layout_reset = mainthread(self.tower._reset_graphics)
+            self.sim.tower.on_theme_changed = mainthread(self.tower.redraw_all)
+            self._add_notification = mainthread(self._add_notification)
+            self._adjust_money = mainthread(self._adjust_money)
         
         # Load theme based on map
         if self.tower.current_map and self.tower.current_map.metadata.theme:
@@ -47,6 +67,9 @@ class Game(Widget):
         # Initial graphics setup
         self.setup_graphics()
         
+        if self.sim_thread:
+            self.sim_thread.start()
+        
     def _setup_event_callbacks(self):
         """Set up callbacks for different event types"""
         # Map-specific event handlers
@@ -80,7 +103,7 @@ class Game(Widget):
             # Check each event's probability
             for event_type in special_events:
                 prob = Config.EVENT_PROBABILITIES.get(event_type, 0)
-                if random.random() < prob:
+                if self.rng.stream(RNGService.MAP_EVENTS).random() < prob:
                     self._trigger_event(event_type)
     
     def _trigger_event(self, event_type: EventType) -> None:
@@ -97,40 +120,59 @@ class Game(Widget):
             }
             
             # Apply immediate effects
-            self._apply_event_effects(event_type, True)
+            self._apply_map_event_effects(event_type, True)
             
             # Add notification
             self._add_event_notification(event_type)
             
-            # Schedule event end
-            self.time_system.schedule_event(
+            # Schedule event end, keeping the handle so it can be ended early
+            self.active_events[event_type]['end_handle'] = self.time_system.schedule_event(
                 self._end_event,
                 timedelta(days=duration),
                 {'event_type': event_type}
             )
     
-    def _apply_event_effects(self, event_type: EventType, start: bool = True) -> None:
-        """Apply or remove event effects"""
-        if event_type in self.active_events:
-            effects = self.active_events[event_type]['effects']
-            multiplier = 1 if start else (1 / effects.get('revenue_multiplier', 1))
-            
-            # Apply economic effects
-            self.economy.apply_multiplier(multiplier)
-            
-            # Apply visitor effects
-            if 'visitor_multiplier' in effects:
-                self._adjust_visitor_rate(effects['visitor_multiplier'] if start else 1)
-            
-            # Handle special effects
-            if event_type == EventType.KAIJU_ATTACK and start:
-                self._handle_kaiju_damage()
+    def _end_event(self, data: Dict[str, Any]) -> None:
+        """Handle the scheduled end of an event"""
+        self._apply_map_event_effects(data['event_type'], False)
+        self.active_events.pop(data['event_type'], None)
+    
+    def end_event_early(self, event_type: EventType) -> bool:
+        """End an active event now; a Future of the result when threaded"""
+        return self._command(self._end_event_early, event_type)
+    
+    def _end_event_early(self, event_type: EventType) -> bool:
+        """End an active event and drop its pending end timer"""
+        event = self.active_events.get(event_type)
+        if not event:
+            return False
+        event['end_handle'].cancel()
+        self._end_event({'event_type': event_type})
+        return True
+    
+    def _apply_map_event_effects(self, event_type: EventType, start: bool = True) -> None:
+        """Apply or undo a map event's effects, keyed by the event so they undo exactly"""
+        if not start:
+            self.economy.remove_modifier(event_type)
+            self.tower.remove_visitor_modifier(event_type)
+            return
+        
+        effects = Config.EVENT_EFFECTS.get(event_type, {})
+        if 'revenue_multiplier' in effects:
+            self.economy.add_modifier(event_type, effects['revenue_multiplier'])
+        if 'visitor_multiplier' in effects:
+            self.tower.add_visitor_modifier(event_type, effects['visitor_multiplier'])
+        
+        # Handle special effects
+        if event_type == EventType.KAIJU_ATTACK:
+            self._handle_kaiju_damage()
     
     def _handle_kaiju_damage(self) -> None:
         """Handle potential damage from kaiju attacks"""
-        if random.random() < Config.EVENT_EFFECTS[EventType.KAIJU_ATTACK]['damage_chance']:
+        rng = self.rng.stream(RNGService.MAP_EVENTS)
+        if rng.random() < Config.EVENT_EFFECTS[EventType.KAIJU_ATTACK]['damage_chance']:
             # Select random floor for damage
-            floor = random.randint(0, len(self.tower.floors) - 1)
+            floor = rng.randint(0, len(self.tower.floors) - 1)
             # Apply damage (implement damage system)
             self._damage_floor(floor)
             
@@ -142,11 +184,8 @@ class Game(Widget):
     def update(self, dt: float) -> None:
         """Update game state"""
         if not self.paused:
-            # Update time system
-            self.time_system.update(dt)
-            
-            # Update economy
-            self.economy.update(dt)
+            # Advance time, businesses and economy in fixed ticks
+            self.sim.frame(dt)
             
             # Check population milestones
             self._check_population_milestones()
@@ -182,7 +221,7 @@ class Game(Widget):
             'time': self.time_system.current_time,
             'theme_color': theme_colors.get(event_type, (1, 1, 1, 1))
         }
-        self.active_notifications.append(notification)
+        self._add_notification(notification)
         
         # Play theme-specific sound if available
         sound_file = self.asset_manager.get_theme_sound(event_type.name.lower())
@@ -249,52 +288,90 @@ class Game(Widget):
         self.draw_tower()
     
     def draw_tower(self):
-        """Draw the tower and all its businesses"""
+        """Draw the tower floors that are inside the camera view"""
         if hasattr(self, 'tower'):
-            self.tower.draw()
+            self._apply_camera()
+    
+    def _apply_camera(self) -> None:
+        """Push the camera's visible range and detail level to the tower"""
+        first, last = self.camera.visible_floors(self.height, self.grid_size)
+        self.tower.set_view(first, last, self.camera.lod_block(self.grid_size),
+                            self.camera.zoom, self.camera.scroll_y)
+    
+    def scroll_view(self, floors: float) -> None:
+        """Scroll the camera up or down by a number of floors"""
+        self.camera.scroll(floors)
+        self._apply_camera()
+    
+    def zoom_view(self, factor: float) -> None:
+        """Zoom the camera in (factor > 1) or out (factor < 1)"""
+        self.camera.zoom_by(factor)
+        self._apply_camera()
     
     def update(self, dt):
         """Update game state"""
         if not self.paused:
-            self.time_system.update(dt)
+            # Advance time, businesses and economy in fixed ticks; rendering blends between them
+            if self.sim_thread:
+                view = self.sim_thread.interpolated()
+            else:
+                view = self.sim.interpolate(self.sim.frame(dt))
             
             # Process any new notifications
-            self._process_notifications()
+            self._process_notifications(dt)
             
-            # Get active events and apply their effects
-            active_events = self.time_system.get_active_events()
-            self._apply_event_effects(active_events)
-            
-            # Update game systems
-            spawn_multiplier = self._calculate_spawn_multiplier(active_events)
-            self.tower.update(dt, spawn_multiplier)
-            self.economy.update(dt)
+            # Event effects write modifier stacks the worker iterates, so when threaded they
+            # run between its ticks; one pending run at a time is enough
+            if self._event_effects is None or self._event_effects.done():
+                self._event_effects = self._command(self._update_event_effects)
             
             # Update UI
-            self.current_time = self.time_system.get_time_string()
-    
-    def _process_notifications(self):
-        """Process and update notifications"""
-        new_notifications = self.time_system.get_notifications(unread_only=True)
-        for notification in new_notifications:
-            self._add_notification(notification)
+            self.current_time = self.time_system.get_time_string(view['time'])
+            self.population = int(view['visitors'])
+    
+    def _new_notifications(self) -> list:
+        """Notifications the simulation posted since the last frame"""
+        if self.sim_thread:
+            return self.sim_thread.drain_notifications()
+        notifications = self.time_system.get_notifications(unread_only=True)
+        for notification in notifications:
             self.time_system.mark_notification_read(notification)
         
         # Remove old notifications
         self.time_system.clear_old_notifications()
+        return notifications
     
-    def _add_notification(self, notification):
-        """Add a new notification to the UI"""
-        self.active_notifications.append({
-            'message': notification.message,
-            'priority': notification.priority.value,
-            'time': notification.time,
-            'type': notification.event_type,
-            'data': notification.data
-        })
-        # Keep only last 5 notifications
-        if len(self.active_notifications) > 5:
-            self.active_notifications.pop(0)
+    def _process_notifications(self, dt: float):
+        """Process and update notifications"""
+        for notification in self._new_notifications():
+            self._add_notification({
+                'message': notification.message,
+                'priority': notification.priority.value,
+                'time': notification.time,
+                'type': notification.event_type,
+                'data': notification.data
+            })
+        
+        # Hand the UI at most one merged batch per frame
+        batch = self.notifications.flush(dt)
+        if batch:
+            # Keep only last 5 notifications; one assignment fires observers once
+            self.active_notifications = (self.active_notifications + batch)[-5:]
+    
+    def _adjust_money(self, amount: float) -> None:
+        """Change the player's money; the property has UI observers, so this runs on the Kivy thread"""
+        self.money += amount
+    
+    def _add_notification(self, notification: dict):
+        """Queue a notification for the UI, merged and rate-limited by the pipeline"""
+        self.notifications.submit(notification)
+    
+    def _update_event_effects(self) -> None:
+        """Apply active time-system events and set the spawn rate for the next simulation step"""
+        active_events = self.time_system.get_active_events()
+        self._apply_event_effects(active_events)
+        # Sales and map events scale the spawn rate further through the tower's visitor modifiers
+        self.sim.tower.spawn_multiplier = self._calculate_spawn_multiplier(active_events)
     
     def _calculate_spawn_multiplier(self, active_events):
         """Calculate customer spawn rate multiplier based on active events"""
@@ -304,8 +381,6 @@ class Game(Widget):
             multiplier *= 2.0
         if not active_events['business_hours']:
             multiplier *= 0.2
-        if active_events['sale']:
-            multiplier *= 1.5
         if active_events['weather'] == 'rainy':
             multiplier *= 0.7
         if active_events['vip']:
@@ -357,7 +432,7 @@ class Game(Widget):
         if requirements_met:
             reward = self.config.EVENT_TYPES['vip_visit']['reward']
             reward *= config['reward_multiplier']
-            self.money += reward
+            self._adjust_money(reward)
             self._add_notification({
                 'message': f"VIP {vip_type.replace('_', ' ').title()} satisfied! Received ${reward:,}",
                 'priority': 2,
@@ -374,7 +449,7 @@ class Game(Widget):
         self.tower.remove_satisfaction_modifier('vip_visit')
     
     def _handle_maintenance_start(self, data):
-        self.money -= data.get('cost', 0)
+        self._adjust_money(-data.get('cost', 0))
         self.tower.add_satisfaction_modifier('maintenance', -1)
     
     def _handle_maintenance_end(self, data):
@@ -410,9 +485,14 @@ class Game(Widget):
     def on_touch_down(self, touch):
         """Handle touch/click events"""
         if self.collide_point(*touch.pos):
+            # Mouse wheel scrolls the camera
+            if touch.is_mouse_scrolling:
+                self.scroll_view(-3 if touch.button == 'scrollup' else 3)
+                return True
+            
             # Convert touch position to grid coordinates
-            grid_x = int((touch.x - self.x) // self.grid_size)
-            grid_y = int((touch.y - self.y) // self.grid_size)
+            grid_x = int((touch.x - self.x) // self.camera.floor_pixels(self.grid_size))
+            grid_y = self.camera.screen_to_floor(touch.y - self.y, self.grid_size)
             
             if self.selected_tool:
                 self.try_place_building(grid_x, grid_y)
@@ -452,8 +532,27 @@ class Game(Widget):
         # Update UI
         self.current_time = self.time_system.get_time_string()
     
+    def _command(self, command, *args):
+        """Run a player command against the simulation.
+        
+        Returns the command's result, or a Future of it when the simulation
+        runs on a worker thread.
+        """
+        if self.sim_thread:
+            return self.sim_thread.submit(command, *args)
+        return command(*args)
+    
+    def stop_simulation(self) -> None:
+        """Stop the simulation worker thread, if any"""
+        if self.sim_thread:
+            self.sim_thread.stop()
+    
     def add_business(self, business_type: BusinessType, floor: int) -> bool:
-        """Add a new business to the tower"""
+        """Add a new business to the tower; a Future of the result when threaded"""
+        return self._command(self._place_business, business_type, floor)
+    
+    def _place_business(self, business_type: BusinessType, floor: int) -> bool:
+        """Pay for and place a business"""
         business_costs = {
             BusinessType.RESTAURANT: 50000,
             BusinessType.HOTEL: 200000,
@@ -482,7 +581,13 @@ class Game(Widget):
     
     def remove_business(self, floor: int) -> bool:
         """Remove a business from the tower"""
-        return self.tower.remove_business(floor)
+        return self._command(self.sim.tower.remove_business, floor)
+    
+    def get_floor_stats(self) -> List[Dict]:
+        """Stats for every floor, bottom first; from the latest snapshot when threaded"""
+        if self.sim_thread:
+            return list(self.sim_thread.latest().floors)
+        return [self.tower.get_floor_stats(number) for number in range(len(self.tower.floors))]
     
     def get_game_state(self) -> Dict:
         """Get current game state"""
@@ -501,6 +606,7 @@ class Game(Widget):
     def toggle_pause(self):
         """Toggle game pause state"""
         self.paused = not self.paused
+        self._command(setattr, self.time_system, 'paused', self.paused)
     
     def set_game_speed(self, speed: float):
         """Set game simulation speed"""
@@ -0,0 +1,30 @@
+import numpy as np
+from typing import Tuple
+from entities.business import BusinessInteraction
+
+# Dense NumPy forms of the BusinessInteraction tables; row = business type, column = nearby type
+SYNERGY = np.array(BusinessInteraction.SYNERGY_MATRIX)
+COMPETITION = np.array(BusinessInteraction.COMPETITION_MATRIX)
+COMBO_MASKS = np.array([mask for mask, _, _ in BusinessInteraction.COMBO_MASKS], dtype=np.int64)
+COMBO_BONUSES = np.array([bonus for _, bonus, _ in BusinessInteraction.COMBO_MASKS])
+
+
+def window_effects(weighted_counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Synergy and competition felt by each business type from a floor window.
+
+    weighted_counts[j] is the number of nearby businesses of type j, each
+    scaled by its distance modifier, so one matrix-vector product per table
+    gives the effect on every type at once.
+    """
+    return SYNERGY @ weighted_counts, COMPETITION @ weighted_counts
+
+
+def active_combos(masks: np.ndarray) -> np.ndarray:
+    """Which special combinations each type mask completes, one column per combo"""
+    masks = np.asarray(masks, dtype=np.int64)[..., None]
+    return (masks & COMBO_MASKS) == COMBO_MASKS
+
+
+def special_bonus(masks: np.ndarray) -> np.ndarray:
+    """Highest combo bonus each type mask earns, 0 where none is complete"""
+    return np.where(active_combos(masks), COMBO_BONUSES, 0.0).max(axis=-1)
@@ -0,0 +1,152 @@
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+HOUR = 3600
+DAY = 86400
+WEEK = 7 * DAY
+
+
+class TransactionLedger:
+    """Append-only columnar ledger of money movements with rolling totals.
+
+    Transactions are stored as parallel typed arrays (time, amount, category,
+    source) grown a chunk at a time. Transactions in the same hour with the
+    same category and source merge into one row, so a tick-by-tick accrual
+    costs one row per hour rather than one per tick. Every insert also adds to
+    ring buffers of hourly, daily and weekly totals per category, which makes
+    period totals O(1) reads. Rows older than RETENTION are dropped when
+    the columns fill, which bounds memory to about one game year of rows.
+    """
+
+    CHUNK = 4096  # Rows added per growth step
+    RETENTION = 366 * DAY  # Raw rows kept; older totals survive in the rings
+    # (period length in seconds, buckets kept)
+    PERIODS = {
+        'hour': (HOUR, 7 * 24),
+        'day': (DAY, 366),
+        'week': (WEEK, 53),
+    }
+
+    def __init__(self, categories: Iterable[str] = ()):
+        self.times = array('q', bytes(8 * self.CHUNK))
+        self.amounts = array('d', bytes(8 * self.CHUNK))
+        self.categories = array('B', bytes(self.CHUNK))
+        self.sources = array('H', bytes(2 * self.CHUNK))
+        self._size = 0
+        self._category_ids: Dict[str, int] = {}
+        self._source_ids: Dict[str, int] = {}
+        self._source_names: List[str] = []
+        self._category_names: List[str] = []
+        self._open_rows: Dict[Tuple[int, int], int] = {}  # Latest row per (category, source)
+        # Per period: bucket ids in the ring, plus one ring of totals per category
+        self._bucket_ids = {name: array('q', [-1]) * slots for name, (_, slots) in self.PERIODS.items()}
+        self._totals: Dict[str, List[array]] = {name: [] for name in self.PERIODS}
+        self.latest = 0  # Time of the newest transaction
+        for category in categories:
+            self.category_id(category)
+
+    def category_id(self, name: str) -> int:
+        """Index of a category, registering it on first use"""
+        index = self._category_ids.get(name)
+        if index is None:
+            index = len(self._category_names)
+            self._category_ids[name] = index
+            self._category_names.append(name)
+            for period, (_, slots) in self.PERIODS.items():
+                self._totals[period].append(array('d', bytes(8 * slots)))
+        return index
+
+    def _source_id(self, name: str) -> int:
+        index = self._source_ids.get(name)
+        if index is None:
+            index = len(self._source_names)
+            self._source_ids[name] = index
+            self._source_names.append(name)
+        return index
+
+    def _grow(self) -> None:
+        """Make room for more rows, dropping expired ones before growing"""
+        self.trim(self.latest - self.RETENTION)
+        if self._size * 2 <= len(self.times):
+            return
+        self.times.extend(array('q', bytes(8 * self.CHUNK)))
+        self.amounts.extend(array('d', bytes(8 * self.CHUNK)))
+        self.categories.extend(array('B', bytes(self.CHUNK)))
+        self.sources.extend(array('H', bytes(2 * self.CHUNK)))
+
+    def trim(self, before: int) -> None:
+        """Drop raw rows older than a time; the rolling totals are unaffected"""
+        size = self._size
+        keep = 0
+        while keep < size and self.times[keep] < before:
+            keep += 1
+        if not keep:
+            return
+        for column in (self.times, self.amounts, self.categories, self.sources):
+            column[:size - keep] = column[keep:size]
+        self._size -= keep
+        self._open_rows = {key: row - keep for key, row in self._open_rows.items() if row >= keep}
+
+    def record(self, time: int, amount: float, category: str, source: str = '') -> None:
+        """Append a transaction and add it to the rolling totals"""
+        category_index = self.category_id(category)
+        source_index = self._source_id(source)
+        key = (category_index, source_index)
+        last = self._open_rows.get(key)
+        if last is not None and self.times[last] // HOUR == time // HOUR:
+            self.amounts[last] += amount
+        else:
+            if self._size == len(self.times):
+                self._grow()
+            row = self._size
+            self.times[row] = time
+            self.amounts[row] = amount
+            self.categories[row] = category_index
+            self.sources[row] = source_index
+            self._open_rows[key] = row
+            self._size += 1
+        self.latest = max(self.latest, time)
+
+        for period, (length, slots) in self.PERIODS.items():
+            bucket = time // length
+            slot = bucket % slots
+            ids = self._bucket_ids[period]
+            if ids[slot] != bucket:
+                if ids[slot] > bucket:
+                    continue  # Older than the ring reaches
+                ids[slot] = bucket
+                for totals in self._totals[period]:
+                    totals[slot] = 0.0
+            self._totals[period][category_index][slot] += amount
+
+    def total(self, period: str, categories: Optional[Iterable[str]] = None,
+              time: Optional[int] = None) -> float:
+        """Sum of the given categories over the period containing a time"""
+        length, slots = self.PERIODS[period]
+        bucket = (self.latest if time is None else time) // length
+        slot = bucket % slots
+        if self._bucket_ids[period][slot] != bucket:
+            return 0.0
+        totals = self._totals[period]
+        names = self._category_names if categories is None else categories
+        return sum(totals[self._category_ids[name]][slot] for name in names if name in self._category_ids)
+
+    def series(self, period: str, categories: Optional[Iterable[str]] = None,
+               count: Optional[int] = None, end: Optional[int] = None) -> List[float]:
+        """Totals for the last `count` periods up to and including `end`, oldest first"""
+        length, slots = self.PERIODS[period]
+        count = slots if count is None else min(count, slots)
+        last = (self.latest if end is None else end) // length
+        categories = list(self._category_names if categories is None else categories)
+        return [self.total(period, categories, bucket * length)
+                for bucket in range(last - count + 1, last + 1)]
+
+    def rows(self, start: int = 0) -> Iterator[Tuple[int, float, str, str]]:
+        """Stored (time, amount, category, source) rows from a time on"""
+        for row in range(self._size):
+            if self.times[row] >= start:
+                yield (self.times[row], self.amounts[row],
+                       self._category_names[self.categories[row]], self._source_names[self.sources[row]])
+
+    def __len__(self) -> int:
+        return self._size
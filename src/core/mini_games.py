@@ -1,5 +1,6 @@
 from enum import Enum, auto
 from typing import Dict, Any, List, Optional, Callable
+import random
 from kivy.uix.widget import Widget
 from kivy.properties import NumericProperty, BooleanProperty, StringProperty
 from kivy.clock import Clock
@@ -34,9 +35,11 @@ class BaseMiniGame(Widget):
     is_active = BooleanProperty(False)
     difficulty = StringProperty('MEDIUM')
     
-    def __init__(self, difficulty: MiniGameDifficulty = MiniGameDifficulty.MEDIUM, **kwargs):
+    def __init__(self, difficulty: MiniGameDifficulty = MiniGameDifficulty.MEDIUM, *,
+                 rng: random.Random, **kwargs):
         super(BaseMiniGame, self).__init__(**kwargs)
         self.difficulty = difficulty.name
+        self.rng = rng
         self.callbacks = {
             'on_complete': None,
             'on_fail': None,
@@ -1,5 +1,4 @@
 from typing import List, Tuple
-from random import randint, choice
 from kivy.graphics import Color, Rectangle, Line, Ellipse
 from kivy.properties import ListProperty, NumericProperty, BooleanProperty
 from kivy.vector import Vector
@@ -38,9 +37,9 @@ class CleaningGame(BaseMiniGame):
         num_spots = self.spots_to_clean
         
         for _ in range(num_spots):
-            x = randint(50, int(self.width - 50))
-            y = randint(50, int(self.height - 50))
-            size = randint(20, 40)
+            x = self.rng.randint(50, int(self.width - 50))
+            y = self.rng.randint(50, int(self.height - 50))
+            size = self.rng.randint(20, 40)
             spots.append((x, y, size))
             
         return spots
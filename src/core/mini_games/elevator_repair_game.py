@@ -1,5 +1,4 @@
 from typing import List, Dict, Tuple
-from random import randint, shuffle
 from kivy.graphics import Color, Rectangle, Line
 from kivy.properties import ListProperty, NumericProperty, BooleanProperty, DictProperty
 from core.mini_games import BaseMiniGame, MiniGameDifficulty
@@ -72,7 +71,7 @@ class ElevatorRepairGame(BaseMiniGame):
             
         # Right side nodes (outputs)
         output_ids = list(range(node_pairs))
-        shuffle(output_ids)  # Randomize connections
+        self.rng.shuffle(output_ids)  # Randomize connections
         
         for i in range(node_pairs):
             y = margin + (self.height - 2 * margin) * (i / (node_pairs - 1))
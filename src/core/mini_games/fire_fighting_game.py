@@ -1,5 +1,4 @@
 from typing import List, Dict, Tuple
-from random import randint, random
 from kivy.graphics import Color, Rectangle, Ellipse
 from kivy.properties import ListProperty, NumericProperty, BooleanProperty
 from kivy.vector import Vector
@@ -61,11 +60,11 @@ class FireFightingGame(BaseMiniGame):
     def _create_fire(self, x: float = None, y: float = None, intensity: float = None) -> Dict:
         """Create a new fire"""
         if x is None:
-            x = randint(50, int(self.width - 50))
+            x = self.rng.randint(50, int(self.width - 50))
         if y is None:
-            y = randint(50, int(self.height - 50))
+            y = self.rng.randint(50, int(self.height - 50))
         if intensity is None:
-            intensity = random() * 0.5 + 0.5  # 0.5 to 1.0
+            intensity = self.rng.random() * 0.5 + 0.5  # 0.5 to 1.0
             
         return {
             'pos': [x, y],
@@ -85,9 +84,9 @@ class FireFightingGame(BaseMiniGame):
         
         for _ in range(num_items):
             item = {
-                'pos': [randint(50, int(self.width - 50)),
-                       randint(50, int(self.height - 50))],
-                'value': randint(500, 2000),
+                'pos': [self.rng.randint(50, int(self.width - 50)),
+                       self.rng.randint(50, int(self.height - 50))],
+                'value': self.rng.randint(500, 2000),
                 'saved': False,
                 'damaged': False
             }
@@ -124,9 +123,9 @@ class FireFightingGame(BaseMiniGame):
         # Spread to new locations
         new_fires = []
         for fire in self.fires:
-            if random() < fire['intensity'] * 0.3:
-                angle = random() * 2 * math.pi
-                distance = randint(50, 100)
+            if self.rng.random() < fire['intensity'] * 0.3:
+                angle = self.rng.random() * 2 * math.pi
+                distance = self.rng.randint(50, 100)
                 x = fire['pos'][0] + math.cos(angle) * distance
                 y = fire['pos'][1] + math.sin(angle) * distance
                 
@@ -1,5 +1,4 @@
 from typing import List, Dict, Tuple
-from random import randint, choice, random
 from kivy.graphics import Color, Rectangle, Ellipse
 from kivy.properties import ListProperty, NumericProperty, BooleanProperty
 from kivy.vector import Vector
@@ -61,15 +60,15 @@ class PestControlGame(BaseMiniGame):
     def _create_pest(self, x: float = None, y: float = None) -> Dict:
         """Create a new pest"""
         if x is None:
-            x = randint(50, int(self.width - 50))
+            x = self.rng.randint(50, int(self.width - 50))
         if y is None:
-            y = randint(50, int(self.height - 50))
+            y = self.rng.randint(50, int(self.height - 50))
             
         return {
             'pos': [x, y],
-            'velocity': [random() * 2 - 1, random() * 2 - 1],
-            'size': randint(10, 15),
-            'type': choice(['cockroach', 'rat', 'spider'])
+            'velocity': [self.rng.random() * 2 - 1, self.rng.random() * 2 - 1],
+            'size': self.rng.randint(10, 15),
+            'type': self.rng.choice(['cockroach', 'rat', 'spider'])
         }
         
     def _get_pest_speed(self) -> float:
@@ -124,8 +123,8 @@ class PestControlGame(BaseMiniGame):
             pest['pos'] = [new_x, new_y]
             
             # Random direction changes
-            if random() < 0.02:
-                pest['velocity'] = [random() * 2 - 1, random() * 2 - 1]
+            if self.rng.random() < 0.02:
+                pest['velocity'] = [self.rng.random() * 2 - 1, self.rng.random() * 2 - 1]
                 
     def _reproduce_pests(self, dt: float) -> None:
         """Handle pest reproduction"""
@@ -136,7 +135,7 @@ class PestControlGame(BaseMiniGame):
         for i, pest1 in enumerate(self.pests):
             for pest2 in self.pests[i+1:]:
                 if (Vector(pest1['pos']).distance(Vector(pest2['pos'])) < 30 and
-                    random() < 0.3):
+                    self.rng.random() < 0.3):
                     x = (pest1['pos'][0] + pest2['pos'][0]) / 2
                     y = (pest1['pos'][1] + pest2['pos'][1]) / 2
                     self.pests.append(self._create_pest(x, y))
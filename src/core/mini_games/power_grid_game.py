@@ -1,5 +1,5 @@
+import random
 from typing import List, Dict, Tuple, Set
-from random import randint, choice, random
 from kivy.graphics import Color, Rectangle, Line
 from kivy.properties import ListProperty, NumericProperty, DictProperty
 from kivy.vector import Vector
@@ -9,12 +9,12 @@ import math
 
 class PowerNode:
     """Represents a node in the power grid"""
-    def __init__(self, x: float, y: float, node_type: str):
+    def __init__(self, x: float, y: float, node_type: str, rng: random.Random):
         self.pos = (x, y)
         self.type = node_type  # 'generator', 'consumer', 'junction'
         self.connected_to = set()
         self.power_level = 0.0
-        self.demand = 0.0 if node_type != 'consumer' else random() * 50 + 50
+        self.demand = 0.0 if node_type != 'consumer' else rng.random() * 50 + 50
         self.supply = 100.0 if node_type == 'generator' else 0.0
         self.overloaded = False
         self.active = True
@@ -81,19 +81,19 @@ class PowerGridGame(BaseMiniGame):
         for i in range(num_generators):
             x = margin
             y = margin + (self.height - 2 * margin) * (i / (num_generators - 1))
-            nodes.append(PowerNode(x, y, 'generator'))
+            nodes.append(PowerNode(x, y, 'generator', self.rng))
             
         # Place consumers on the right side
         for i in range(num_consumers):
             x = self.width - margin
             y = margin + (self.height - 2 * margin) * (i / (num_consumers - 1))
-            nodes.append(PowerNode(x, y, 'consumer'))
+            nodes.append(PowerNode(x, y, 'consumer', self.rng))
             
         # Place junction nodes in the middle
         for _ in range(num_junctions):
-            x = randint(int(self.width * 0.3), int(self.width * 0.7))
-            y = randint(margin, int(self.height - margin))
-            nodes.append(PowerNode(x, y, 'junction'))
+            x = self.rng.randint(int(self.width * 0.3), int(self.width * 0.7))
+            y = self.rng.randint(margin, int(self.height - margin))
+            nodes.append(PowerNode(x, y, 'junction', self.rng))
             
         return nodes
         
@@ -1,5 +1,4 @@
 from typing import List, Tuple, Optional
-from random import randint, choice
 from kivy.graphics import Color, Rectangle, Line
 from kivy.properties import ListProperty, NumericProperty
 from kivy.vector import Vector
@@ -69,8 +68,8 @@ class ThiefGame(BaseMiniGame):
         }.get(self.difficulty, 8)
         
         for _ in range(num_obstacles):
-            x = randint(1, width-2)
-            y = randint(1, height-2)
+            x = self.rng.randint(1, width-2)
+            y = self.rng.randint(1, height-2)
             # Create small wall segments
             for dx, dy in [(0,0), (1,0), (0,1), (1,1)]:
                 if 0 <= x+dx < width and 0 <= y+dy < height:
@@ -89,8 +88,8 @@ class ThiefGame(BaseMiniGame):
         self.movement_patterns = []
         for _ in range(num_patterns):
             pattern = []
-            duration = randint(2, 4)  # seconds per pattern
-            points = randint(3, 6)    # points in the pattern
+            duration = self.rng.randint(2, 4)  # seconds per pattern
+            points = self.rng.randint(3, 6)    # points in the pattern
             
             # Generate random points for the pattern
             for _ in range(points):
@@ -105,8 +104,8 @@ class ThiefGame(BaseMiniGame):
         pos = [0, 0]
         while not valid:
             pos = [
-                randint(0, int(self.width)),
-                randint(0, int(self.height))
+                self.rng.randint(0, int(self.width)),
+                self.rng.randint(0, int(self.height))
             ]
             valid = self._is_valid_position(pos)
         return pos
@@ -1,5 +1,4 @@
 from typing import List, Dict, Tuple
-from random import randint, choice, random
 from kivy.graphics import Color, Rectangle, Line, Ellipse
 from kivy.properties import ListProperty, NumericProperty, BooleanProperty, StringProperty
 from kivy.vector import Vector
@@ -74,7 +73,7 @@ class VIPEscortGame(BaseMiniGame):
         
         for i in range(num_points - 2):
             x = start_x + (end_x - start_x) * ((i + 1) / (num_points - 1))
-            y = randint(100, int(self.height - 100))
+            y = self.rng.randint(100, int(self.height - 100))
             points.append((x, y))
             
         points.append((end_x, self.height/2))
@@ -91,9 +90,9 @@ class VIPEscortGame(BaseMiniGame):
         
         for _ in range(num_npcs):
             npc = {
-                'pos': [randint(50, int(self.width - 50)),
-                       randint(50, int(self.height - 50))],
-                'velocity': [random() * 2 - 1, random() * 2 - 1],
+                'pos': [self.rng.randint(50, int(self.width - 50)),
+                       self.rng.randint(50, int(self.height - 50))],
+                'velocity': [self.rng.random() * 2 - 1, self.rng.random() * 2 - 1],
                 'state': 'walking'  # 'walking' or 'excited'
             }
             npcs.append(npc)
@@ -111,8 +110,8 @@ class VIPEscortGame(BaseMiniGame):
         
         for _ in range(num_paparazzi):
             pap = {
-                'pos': [randint(50, int(self.width - 50)),
-                       randint(50, int(self.height - 50))],
+                'pos': [self.rng.randint(50, int(self.width - 50)),
+                       self.rng.randint(50, int(self.height - 50))],
                 'velocity': [0, 0],
                 'state': 'searching'  # 'searching' or 'pursuing'
             }
@@ -135,9 +134,9 @@ class VIPEscortGame(BaseMiniGame):
         
         for _ in range(num_power_ups):
             power_up = {
-                'type': choice(power_up_types),
-                'pos': [randint(start_x, end_x),
-                       randint(100, int(self.height - 100))],
+                'type': self.rng.choice(power_up_types),
+                'pos': [self.rng.randint(start_x, end_x),
+                       self.rng.randint(100, int(self.height - 100))],
                 'active': True
             }
             power_ups.append(power_up)
@@ -217,8 +216,8 @@ class VIPEscortGame(BaseMiniGame):
             npc['velocity'] = [vel.x, vel.y]
             
             # Random direction changes
-            if random() < 0.02:
-                npc['velocity'] = [random() * 2 - 1, random() * 2 - 1]
+            if self.rng.random() < 0.02:
+                npc['velocity'] = [self.rng.random() * 2 - 1, self.rng.random() * 2 - 1]
                 
         # Update paparazzi
         vip_vec = Vector(self.vip_pos)
@@ -239,8 +238,8 @@ class VIPEscortGame(BaseMiniGame):
             else:
                 pap['state'] = 'searching'
                 # Random movement when searching
-                if random() < 0.05:
-                    pap['velocity'] = [random() * 2 - 1, random() * 2 - 1]
+                if self.rng.random() < 0.05:
+                    pap['velocity'] = [self.rng.random() * 2 - 1, self.rng.random() * 2 - 1]
                     
                 vel = Vector(pap['velocity'])
                 new_pos = pap_vec + vel * 80 * dt
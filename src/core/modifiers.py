@@ -0,0 +1,78 @@
+from dataclasses import dataclass
+from typing import Dict, Hashable, Optional
+
+
+@dataclass(frozen=True)
+class Modifier:
+    """One keyed effect on a value"""
+    multiplier: float = 1.0
+    additive: float = 0.0
+    expires: Optional[int] = None  # Game tick after which it no longer applies
+
+
+class ModifierStack:
+    """Keyed multipliers and offsets with the combined effect cached.
+
+    Each source (an event, an upgrade, a sale) holds at most one modifier, so
+    applying an effect twice replaces it and removing it undoes it exactly.
+    There is no dividing back out a multiplier. The combined multiplier and
+    offset are recomputed only when the set of modifiers changes, so reads
+    are O(1).
+    """
+
+    def __init__(self):
+        self._modifiers: Dict[Hashable, Modifier] = {}
+        self.multiplier = 1.0
+        self.additive = 0.0
+        self._next_expiry: Optional[int] = None
+
+    def _recompute(self) -> None:
+        multiplier, additive = 1.0, 0.0
+        for modifier in self._modifiers.values():
+            multiplier *= modifier.multiplier
+            additive += modifier.additive
+        self.multiplier, self.additive = multiplier, additive
+        expiries = [m.expires for m in self._modifiers.values() if m.expires is not None]
+        self._next_expiry = min(expiries) if expiries else None
+
+    def set(self, source: Hashable, multiplier: float = 1.0, additive: float = 0.0,
+            expires: Optional[int] = None) -> None:
+        """Add or replace the modifier from a source"""
+        modifier = Modifier(multiplier, additive, expires)
+        if self._modifiers.get(source) == modifier:
+            return
+        self._modifiers[source] = modifier
+        self._recompute()
+
+    def remove(self, source: Hashable) -> bool:
+        """Drop the modifier from a source; False if it had none"""
+        if self._modifiers.pop(source, None) is None:
+            return False
+        self._recompute()
+        return True
+
+    def clear(self) -> None:
+        self._modifiers.clear()
+        self._recompute()
+
+    def expire(self, now: int) -> bool:
+        """Drop modifiers whose expiry has passed; True if any were dropped"""
+        if self._next_expiry is None or now < self._next_expiry:
+            return False
+        self._modifiers = {source: m for source, m in self._modifiers.items()
+                           if m.expires is None or m.expires > now}
+        self._recompute()
+        return True
+
+    def apply(self, value: float) -> float:
+        """A value with every modifier applied"""
+        return value * self.multiplier + self.additive
+
+    def get(self, source: Hashable) -> Optional[Modifier]:
+        return self._modifiers.get(source)
+
+    def __contains__(self, source: Hashable) -> bool:
+        return source in self._modifiers
+
+    def __len__(self) -> int:
+        return len(self._modifiers)
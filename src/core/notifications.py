@@ -0,0 +1,88 @@
+from typing import Any, Dict, List, Optional
+
+
+class NotificationPipeline:
+    """Merges, rate-limits and batches notifications on their way to the UI.
+
+    Notifications with the same type and subject (e.g. every equipment failure)
+    collect into one pending group until their type's interval has passed,
+    then go out as a single summary such as "3 equipment failures on floors
+    12-40". Each flush hands back at most MAX_PER_FLUSH items, highest
+    priority first, so the UI sees at most one small batch per frame.
+    """
+
+    MAX_PER_FLUSH = 3
+    DEFAULT_INTERVAL = 1.0  # Seconds between notifications of one type
+    INTERVALS = {
+        'business_event': 5.0,
+        'rush_hour': 30.0,
+    }
+    URGENT_PRIORITY = 3  # EventPriority.CRITICAL skips rate limiting
+
+    def __init__(self, max_per_flush: int = MAX_PER_FLUSH, intervals: Optional[Dict[Any, float]] = None):
+        self.max_per_flush = max_per_flush
+        self.intervals = dict(self.INTERVALS, **(intervals or {}))
+        self.clock = 0.0
+        self._pending: Dict[tuple, dict] = {}  # Groups in arrival order
+        self._last_sent: Dict[Any, float] = {}
+
+    @staticmethod
+    def _type_of(notification: dict) -> Any:
+        return notification.get('event_type') or notification.get('type')
+
+    def submit(self, notification: dict) -> None:
+        """Queue a notification, merging it into a pending group of the same kind"""
+        data = notification.get('data') or {}
+        key = (self._type_of(notification), data.get('event'))
+        floor = data.get('floor')
+        group = self._pending.get(key)
+        if group is None:
+            group = dict(notification, count=0, floors=None)
+            self._pending[key] = group
+        group['count'] += 1
+        group['priority'] = max(group.get('priority', 1), notification.get('priority', 1))
+        if floor is not None:
+            low, high = group['floors'] or (floor, floor)
+            group['floors'] = (min(low, floor), max(high, floor))
+
+    def _ready(self, group: dict) -> bool:
+        """Whether a group's type is outside its rate limit"""
+        kind = self._type_of(group)
+        if group.get('priority', 1) >= self.URGENT_PRIORITY or kind not in self._last_sent:
+            return True
+        interval = self.intervals.get(kind, self.DEFAULT_INTERVAL)
+        return self.clock - self._last_sent[kind] >= interval
+
+    @staticmethod
+    def _summary(group: dict) -> str:
+        """Message for a merged group"""
+        count = group['count']
+        if count == 1:
+            return group.get('message', '')
+        subject = (group.get('data') or {}).get('event') or 'event'
+        message = f"{count} {str(subject).replace('_', ' ')}s"
+        if group['floors']:
+            low, high = group['floors']
+            message += f" on floor {low}" if low == high else f" on floors {low}-{high}"
+        return message
+
+    def flush(self, dt: float) -> List[dict]:
+        """Advance the pipeline clock and return the next batch for the UI"""
+        self.clock += dt
+        ready = [key for key, group in self._pending.items() if self._ready(group)]
+        ready.sort(key=lambda key: -self._pending[key].get('priority', 1))
+
+        batch = []
+        for key in ready:
+            if len(batch) == self.max_per_flush:
+                break
+            if not self._ready(self._pending[key]):
+                continue  # Another group of this type went out in this batch
+            group = self._pending.pop(key)
+            group['message'] = self._summary(group)
+            self._last_sent[self._type_of(group)] = self.clock
+            batch.append(group)
+        return batch
+
+    def __len__(self) -> int:
+        return len(self._pending)
@@ -0,0 +1,143 @@
+from typing import List, Optional
+
+
+class OccupancyIndex:
+    """Per-floor tile bitsets used for fast placement checks.
+
+    Each floor is stored as an integer whose bit ``x`` is set when tile ``x``
+    is taken. A second integer keeps one bit per floor that has anything on it,
+    so floor-span queries work a machine word at a time instead of per tile.
+    """
+
+    def __init__(self, floor_width: int, max_floors: int):
+        self.floor_width = floor_width
+        self.max_floors = max_floors
+        self.full_row = (1 << floor_width) - 1
+        self.rows: List[int] = []
+        self.floor_bits = 0  # bit f set when floor f has any occupied tile
+        self.floor_count = 0
+
+    def add_floor(self) -> bool:
+        """Extend the index by one empty floor"""
+        if self.floor_count >= self.max_floors:
+            return False
+        self.rows.append(0)
+        self.floor_count += 1
+        return True
+
+    def clear(self) -> None:
+        """Remove all floors and occupancy"""
+        self.rows.clear()
+        self.floor_bits = 0
+        self.floor_count = 0
+
+    @staticmethod
+    def _runs(mask: int, length: int) -> int:
+        """Return a mask with bit i set when bits i..i+length-1 are all set"""
+        span = 1
+        while span < length and mask:
+            step = min(span, length - span)
+            mask &= mask >> step
+            span += step
+        return mask
+
+    @staticmethod
+    def _lowest_bit(mask: int, start: int = 0) -> Optional[int]:
+        """Index of the lowest set bit at or above start"""
+        mask >>= start
+        if not mask:
+            return None
+        return start + (mask & -mask).bit_length() - 1
+
+    def _span_mask(self, x: int, width: int) -> int:
+        return ((1 << width) - 1) << x
+
+    def _rows_mask(self, y: int, height: int) -> int:
+        """OR together the rows of floors y..y+height-1"""
+        occupied = 0
+        for row in self.rows[y:y + height]:
+            occupied |= row
+        return occupied
+
+    def fits(self, x: int, y: int, width: int, height: int) -> bool:
+        """Check whether a width x height block fits with its corner at (x, y)"""
+        if width <= 0 or height <= 0:
+            return False
+        if x < 0 or y < 0 or x + width > self.floor_width or y + height > self.floor_count:
+            return False
+        return not self._rows_mask(y, height) & self._span_mask(x, width)
+
+    def is_tile_free(self, x: int, y: int) -> bool:
+        """Check a single tile"""
+        if not (0 <= x < self.floor_width and 0 <= y < self.floor_count):
+            return False
+        return not self.rows[y] >> x & 1
+
+    def is_floor_free(self, floor: int) -> bool:
+        """Check whether a floor has no occupied tiles"""
+        return 0 <= floor < self.floor_count and not self.floor_bits >> floor & 1
+
+    def is_span_free(self, floor: int, size: int) -> bool:
+        """Check whether floors floor..floor+size-1 are all empty"""
+        if size <= 0 or floor < 0 or floor + size > self.floor_count:
+            return False
+        return not self.floor_bits & (((1 << size) - 1) << floor)
+
+    def occupy(self, x: int, y: int, width: int, height: int) -> None:
+        """Mark a block of tiles as taken"""
+        mask = self._span_mask(x, width) & self.full_row
+        for f in range(y, y + height):
+            self.rows[f] |= mask
+            self.floor_bits |= 1 << f
+
+    def release(self, x: int, y: int, width: int, height: int) -> None:
+        """Mark a block of tiles as free again"""
+        mask = self._span_mask(x, width)
+        for f in range(y, y + height):
+            self.rows[f] &= ~mask
+            if not self.rows[f]:
+                self.floor_bits &= ~(1 << f)
+
+    def occupy_floors(self, floor: int, size: int) -> None:
+        """Mark whole floors as taken"""
+        self.occupy(0, floor, self.floor_width, size)
+
+    def release_floors(self, floor: int, size: int) -> None:
+        """Mark whole floors as free again"""
+        self.release(0, floor, self.floor_width, size)
+
+    def next_free_span(self, size: int, start: int = 0) -> Optional[int]:
+        """Find the lowest floor >= start that begins `size` consecutive empty floors"""
+        if size <= 0 or size > self.floor_count:
+            return None
+        free = ~self.floor_bits & ((1 << self.floor_count) - 1)
+        runs = self._runs(free, size)
+        return self._lowest_bit(runs, start)
+
+    def free_spans(self, size: int) -> List[int]:
+        """List every floor that begins `size` consecutive empty floors"""
+        if size <= 0 or size > self.floor_count:
+            return []
+        free = ~self.floor_bits & ((1 << self.floor_count) - 1)
+        runs = self._runs(free, size)
+        floors = []
+        while runs:
+            low = runs & -runs
+            floors.append(low.bit_length() - 1)
+            runs ^= low
+        return floors
+
+    def next_free_block(self, width: int, height: int, start_floor: int = 0) -> Optional[tuple]:
+        """Find the lowest (x, y) where a width x height block fits"""
+        if width <= 0 or width > self.floor_width:
+            return None
+        for y in range(max(0, start_floor), self.floor_count - height + 1):
+            free = ~self._rows_mask(y, height) & self.full_row
+            x = self._lowest_bit(self._runs(free, width))
+            if x is not None:
+                return x, y
+        return None
+
+    def occupied_floor_count(self) -> int:
+        """Number of floors with at least one occupied tile"""
+        return self.floor_bits.bit_count()
@@ -0,0 +1,107 @@
+import math
+import random
+from heapq import heappop, heappush
+from itertools import accumulate
+from typing import Dict, List, Optional, Tuple
+from entities.business import Business, BusinessEvent
+
+# Chance per tick that a business rolls for an event, then the chance of each
+# event in turn; the first success wins, as in the original per-tick coin flips
+EVENT_RATE = 0.01
+EVENT_CHANCES = (
+    (BusinessEvent.SPECIAL_PROMOTION, 0.3),
+    (BusinessEvent.CELEBRITY_VISIT, 0.1),
+    (BusinessEvent.STAFF_SHORTAGE, 0.2),
+    (BusinessEvent.EQUIPMENT_FAILURE, 0.2),
+    (BusinessEvent.HEALTH_INSPECTION, 0.15),
+    (BusinessEvent.RENOVATION, 0.05),
+)
+
+
+def event_probabilities(rate: float = EVENT_RATE, chances=EVENT_CHANCES) -> Dict[str, float]:
+    """Per-tick probability of each event under the ordered coin-flip rules"""
+    probabilities = {}
+    remaining = rate
+    for event, chance in chances:
+        probabilities[event] = remaining * chance
+        remaining *= 1 - chance
+    return probabilities
+
+
+class BusinessEventSampler:
+    """Schedules random business events without a coin flip per business per tick.
+
+    Each business's events form a Bernoulli process, so the gap to its next
+    event is geometric. The sampler draws that gap once and files the business
+    under the tick it falls due. Each tick then only touches the businesses
+    with an event. The event itself is picked from the same per-tick
+    probabilities the ordered coin flips produce.
+    """
+
+    def __init__(self, rate: float = EVENT_RATE, chances=EVENT_CHANCES,
+                 rng: Optional[random.Random] = None):
+        self.rng = rng or random.Random()
+        probabilities = event_probabilities(rate, chances)
+        self.events = list(probabilities)
+        self.cum_weights = list(accumulate(probabilities.values()))
+        self.trigger_chance = self.cum_weights[-1]  # Chance any event fires on a tick
+        self.tick = 0
+        self._due: Dict[int, List[Business]] = {}
+        self._due_ticks: List[int] = []  # Heap of the keys of _due
+        self._live = set()
+
+    def _gap(self) -> int:
+        """Ticks until the next event, geometric on 1, 2, ..."""
+        if self.trigger_chance <= 0:
+            return -1
+        if self.trigger_chance >= 1:
+            return 1
+        return 1 + int(math.log(1.0 - self.rng.random()) / math.log(1.0 - self.trigger_chance))
+
+    def _schedule(self, business: Business, now: Optional[int] = None) -> None:
+        gap = self._gap()
+        if gap <= 0:
+            return
+        due = (self.tick if now is None else now) + gap
+        if due not in self._due:
+            self._due[due] = []
+            heappush(self._due_ticks, due)
+        self._due[due].append(business)
+
+    def add(self, business: Business) -> None:
+        """Start generating events for a business"""
+        self._live.add(business)
+        self._schedule(business)
+
+    def remove(self, business: Business) -> None:
+        """Stop generating events for a business; its pending entry is skipped"""
+        self._live.discard(business)
+
+    def clear(self) -> None:
+        self._due.clear()
+        self._due_ticks.clear()
+        self._live.clear()
+
+    def advance(self) -> List[Tuple[Business, str]]:
+        """Move on one tick and return the (business, event) pairs that fire"""
+        return self.advance_by(1)
+
+    def advance_by(self, ticks: int) -> List[Tuple[Business, str]]:
+        """Move on several ticks and return the (business, event) pairs that fire, in order.
+
+        Only the due ticks in the window are visited, so skipping time costs
+        O(events) rather than O(ticks). Draws happen in the same order as
+        calling advance() once per tick, so both replay identically.
+        """
+        end = self.tick + ticks
+        fired = []
+        while self._due_ticks and self._due_ticks[0] <= end:
+            due = heappop(self._due_ticks)
+            for business in self._due.pop(due):
+                if business not in self._live:
+                    continue
+                event = self.rng.choices(self.events, cum_weights=self.cum_weights)[0]
+                fired.append((business, event))
+                self._schedule(business, due)
+        self.tick = end
+        return fired
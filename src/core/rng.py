@@ -0,0 +1,49 @@
+import hashlib
+import os
+import random
+from typing import Dict, Optional
+
+
+class RNGService:
+    """Seeded random number streams, one per subsystem.
+
+    Each stream is seeded from the session seed plus its own name. Subsystems
+    therefore draw independently: an extra draw in one never shifts another,
+    and the same seed replays a whole session. NumPy Generator streams for
+    batched draws come from the same seed and are only created on request.
+    """
+
+    TOWER_EVENTS = 'tower_events'
+    MAP_EVENTS = 'map_events'
+    CUSTOMERS = 'customers'
+    MINI_GAMES = 'mini_games'
+
+    def __init__(self, seed: Optional[int] = None):
+        self.seed = seed if seed is not None else int.from_bytes(os.urandom(8), 'little')
+        self._streams: Dict[str, random.Random] = {}
+        self._generators: Dict[str, object] = {}
+
+    def _stream_seed(self, name: str) -> int:
+        """Stable per-stream seed; hash() is salted per process so it can't be used"""
+        digest = hashlib.sha256(f"{self.seed}:{name}".encode()).digest()
+        return int.from_bytes(digest[:16], 'little')
+
+    def stream(self, name: str) -> random.Random:
+        """The random.Random stream for a subsystem"""
+        if name not in self._streams:
+            self._streams[name] = random.Random(self._stream_seed(name))
+        return self._streams[name]
+
+    def generator(self, name: str):
+        """A NumPy Generator stream for a subsystem's batched draws"""
+        if name not in self._generators:
+            import numpy as np  # Optional dependency, only needed for batched draws
+            self._generators[name] = np.random.default_rng(self._stream_seed(name))
+        return self._generators[name]
+
+    def reseed(self, seed: int) -> None:
+        """Restart every stream from a new session seed"""
+        self.seed = seed
+        for name, stream in self._streams.items():
+            stream.seed(self._stream_seed(name))
+        self._generators.clear()
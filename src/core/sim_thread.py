@@ -0,0 +1,165 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+from core.simulation import Simulation
+from core.time_system import EventNotification
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only copy of nested dicts and lists"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@dataclass(frozen=True)
+class SimSnapshot:
+    """Read-only simulation state published after a tick"""
+    tick: int
+    published_at: float  # time.perf_counter() when published
+    state: Mapping[str, Any]  # Shaped like Simulation.get_state()
+    render: Mapping[str, float]  # Simulation._render_state() after this tick
+    previous_render: Mapping[str, float]  # ...and after the tick before
+    floors: Tuple[Mapping[str, Any], ...] = ()  # TowerCore.get_floor_stats for each floor, bottom first
+
+
+class SimulationThread:
+    """Runs a Simulation on a worker thread at its fixed tick rate.
+
+    Player commands go through a deque, whose append and popleft are atomic,
+    and run between ticks. Their results come back as Futures. After each tick
+    the worker writes a SimSnapshot into the back slot of a double buffer and
+    flips the front index, so the UI thread only ever reads finished
+    snapshots. Notifications go through an outbox deque so none are lost when
+    the UI reads less often than the simulation ticks.
+
+    If a tick raises, the worker stops and keeps the exception: pending and
+    later commands fail with it, and latest() and interpolated() re-raise it
+    so the UI does not keep showing a frozen simulation.
+    """
+
+    def __init__(self, sim: Simulation):
+        self.sim = sim
+        self._commands = deque()
+        self._outbox = deque()
+        self._buffers: List[Optional[SimSnapshot]] = [None, None]
+        self._front = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.error: Optional[Exception] = None  # What stopped the worker, if a tick raised
+        self._publish()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start ticking on the worker thread"""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='simulation', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """Stop the worker after its current tick"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def submit(self, command: Callable, *args, **kwargs) -> Future:
+        """Queue a command to run on the simulation thread before its next tick"""
+        future = Future()
+        self._commands.append((future, command, args, kwargs))
+        if self.error is not None:
+            self._fail_commands()  # The worker is gone; don't leave the Future hanging
+        return future
+
+    def latest(self) -> SimSnapshot:
+        """The most recently published snapshot; raises the worker's error if a tick failed"""
+        if self.error is not None:
+            raise self.error
+        return self._buffers[self._front]
+
+    def interpolated(self, now: Optional[float] = None) -> Dict[str, float]:
+        """Render values blended between the last two ticks by wall-clock time"""
+        snapshot = self.latest()
+        now = time.perf_counter() if now is None else now
+        alpha = min(1.0, max(0.0, (now - snapshot.published_at) * self.sim.tick_rate))
+        return {key: previous + (snapshot.render[key] - previous) * alpha
+                for key, previous in snapshot.previous_render.items()}
+
+    def drain_notifications(self) -> List[EventNotification]:
+        """Take every notification the simulation has posted since the last call"""
+        notifications = []
+        while self._outbox:
+            notifications.append(self._outbox.popleft())
+        return notifications
+
+    def _run_commands(self) -> None:
+        while self._commands:
+            future, command, args, kwargs = self._commands.popleft()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(command(*args, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+
+    def _fail_commands(self) -> None:
+        """Fail every queued command with the worker's error"""
+        while self._commands:
+            future, _, _, _ = self._commands.popleft()
+            if future.set_running_or_notify_cancel():
+                future.set_exception(self.error)
+
+    def _collect_notifications(self) -> None:
+        time_system = self.sim.time_system
+        for notification in time_system.get_notifications(unread_only=True):
+            time_system.mark_notification_read(notification)
+            self._outbox.append(notification)
+        time_system.clear_old_notifications()
+
+    def _publish(self) -> None:
+        """Write a snapshot to the back buffer, then make it the front"""
+        previous = self._buffers[self._front]
+        render = MappingProxyType(self.sim._render_state())
+        back = 1 - self._front
+        self._buffers[back] = SimSnapshot(
+            tick=self.sim.ticks,
+            published_at=time.perf_counter(),
+            state=_freeze(self.sim.get_state()),
+            render=render,
+            previous_render=previous.render if previous else render,
+            floors=tuple(_freeze(self.sim.tower.get_floor_stats(number))
+                         for number in range(len(self.sim.tower.floors))),
+        )
+        self._front = back
+
+    def _run(self) -> None:
+        tick = 1.0 / self.sim.tick_rate
+        next_tick = time.perf_counter()
+        while not self._stop.is_set():
+            self._run_commands()
+            try:
+                self.sim.step(tick)
+                self._collect_notifications()
+                self._publish()
+            except Exception as e:
+                self.error = e
+                self._fail_commands()
+                return
+
+            next_tick += tick
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                self._stop.wait(delay)
+            elif -delay > self.sim.config.MAX_FRAME_TIME:
+                next_tick = time.perf_counter()  # Too far behind; drop the backlog
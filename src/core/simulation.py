@@ -0,0 +1,155 @@
+from datetime import timedelta
+from typing import Dict, Optional
+from core.tower_core import TowerCore
+from core.economy import Economy
+from core.time_system import TimeSystem, EventPriority, SECONDS_PER_DAY
+from core.config import Config
+from core.rng import RNGService
+from entities.business import BusinessEvent
+
+
+class Simulation:
+    """Headless game simulation: tower, economy and time with no Kivy dependency.
+
+    The Game widget drives one of these from the Kivy clock, but it can also be
+    stepped directly for balance runs and benchmarks as fast as the CPU allows.
+    """
+
+    # Business events worth more than a passing mention
+    DISRUPTIVE_EVENTS = (BusinessEvent.STAFF_SHORTAGE, BusinessEvent.EQUIPMENT_FAILURE,
+                         BusinessEvent.HEALTH_INSPECTION)
+
+    def __init__(self, map_name: Optional[str] = "tokyo_tower", config=Config,
+                 columnar: bool = False, seed: Optional[int] = None):
+        self.config = config
+        # Every random draw comes from a stream of this service, so a seed replays a session
+        self.rng = RNGService(seed)
+        self.tower = TowerCore(map_name, config=config, columnar=columnar,
+                               rng=self.rng.stream(RNGService.TOWER_EVENTS))
+        self.economy = Economy()
+        self.time_system = TimeSystem(config)
+        self.economy.now = self.time_system.ticks
+        self.tower.time_system = self.time_system
+        self.time_system.on_time_skipped = self._integrate_skipped
+        self.tower.on_business_event = self._notify_business_event
+        self.ticks = 0
+        self._current_day = self.time_system.current_day
+        
+        # Fixed-timestep loop state
+        self.tick_rate = config.SIM_TICK_RATE
+        self._accumulator = 0.0  # Real seconds not yet simulated
+        self._tower_seconds = 0  # Game seconds not yet covered by a tower update
+        self._previous = self._current = self._render_state()
+
+    def frame(self, dt: float) -> float:
+        """Run however many fixed ticks fit in a rendered frame of dt real seconds.
+        
+        Time left over carries into the next frame, so the tick rate holds
+        regardless of frame rate; long stalls are capped at MAX_FRAME_TIME.
+        Returns how far (0-1) the frame sits between the last two ticks.
+        """
+        tick = 1.0 / self.tick_rate
+        self._accumulator += min(dt, self.config.MAX_FRAME_TIME)
+        # The epsilon keeps float drift from dropping a tick when frames divide a tick exactly
+        while self._accumulator >= tick - 1e-9:
+            self.step(tick)
+            self._previous, self._current = self._current, self._render_state()
+            self._accumulator -= tick
+        return max(0.0, self._accumulator) / tick
+
+    def _render_state(self) -> Dict[str, float]:
+        """Values the UI shows that change continuously between ticks"""
+        return {
+            'time': self.time_system.ticks,
+            'balance': self.economy.balance,
+            'visitors': self.tower.total_visitors,
+        }
+
+    def interpolate(self, alpha: float) -> Dict[str, float]:
+        """Render values blended between the last two ticks"""
+        return {key: previous + (self._current[key] - previous) * alpha
+                for key, previous in self._previous.items()}
+
+    def step(self, dt: float) -> None:
+        """Advance the simulation by dt seconds of real time"""
+        if self.time_system.paused:
+            return
+        if self.time_system.fast_forward:
+            # The jump integrates businesses and income through _integrate_skipped
+            self.time_system.update(dt)
+            self.ticks += 1
+            return
+        
+        before = self.time_system.ticks
+        self.time_system.update(dt)
+        game_seconds = self.time_system.ticks - before
+        
+        # The tower steps once per TICK_SECONDS of game time whatever the speed and tick
+        # rate, so customers, drift and random events keep the rate integrate() assumes
+        self._tower_seconds += game_seconds
+        tick_seconds = self.tower.TICK_SECONDS
+        while self._tower_seconds >= tick_seconds:
+            self._tower_seconds -= tick_seconds
+            self.tower.update(tick_seconds)
+        self._accrue_income(game_seconds, before)
+        self._check_day_rollover()
+        self.ticks += 1
+
+    def _accrue_income(self, game_seconds: float, start: int) -> None:
+        """Book business income and maintenance for game time elapsed since start"""
+        income, maintenance = self.tower.get_daily_totals()
+        self.economy.accrue(income, maintenance, game_seconds, start)
+
+    def _integrate_skipped(self, start: int, seconds: int) -> None:
+        """Integrate businesses and income over a clock jump, one hour of day at a time"""
+        now = start
+        end = start + seconds
+        while now < end:
+            span = min(end, now - now % 3600 + 3600) - now
+            self.tower.integrate(span, (now % SECONDS_PER_DAY) / 3600)
+            self._accrue_income(span, now)
+            now += span
+            self._check_day_rollover(now // SECONDS_PER_DAY)
+
+    def _notify_business_event(self, business, event: str) -> None:
+        """Post a notification for a random business event"""
+        name = event.replace('_', ' ')
+        priority = EventPriority.MEDIUM if event in self.DISRUPTIVE_EVENTS else EventPriority.LOW
+        self.time_system.notify('business_event', f"{name.capitalize()} on floor {business.floor}",
+                                priority, {'event': event, 'floor': business.floor})
+
+    def fast_forward(self, duration: timedelta) -> int:
+        """Jump through a span of game time event by event"""
+        return self.time_system.advance(duration)
+
+    def _check_day_rollover(self, today: Optional[int] = None) -> None:
+        """Settle the books when the game date changes"""
+        if today is None:
+            today = self.time_system.current_day
+        if today != self._current_day:
+            self._current_day = today
+            self.economy.update_balance()
+            self.economy.reset_daily_values()
+
+    def run(self, game_seconds: float, tick: float = 60.0) -> None:
+        """Run for a span of game time using fixed ticks of `tick` game seconds"""
+        dt = tick / (self.time_system.speed_multiplier or 1.0)
+        for _ in range(int(game_seconds // tick)):
+            self.step(dt)
+
+    def run_days(self, days: int, tick: float = 60.0) -> None:
+        """Run for a number of game days"""
+        self.run(days * 86400, tick)
+
+    def get_state(self) -> Dict:
+        """Snapshot of the main simulation numbers"""
+        return {
+            'time': self.time_system.current_time,
+            'ticks': self.ticks,
+            'tower': self.tower.get_tower_stats(),
+            'economy': {
+                'balance': self.economy.balance,
+                'daily_revenue': self.economy.calculate_daily_revenue(),
+                'daily_expenses': self.economy.calculate_daily_expenses()
+            }
+        }
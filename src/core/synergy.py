@@ -0,0 +1,186 @@
+from dataclasses import dataclass
+from typing import Optional, Sequence, Set, Tuple
+from entities.business import TYPE_INDEX
+
+
+class SynergyCache:
+    """Tracks which floors need their synergy recomputed.
+
+    Synergy only depends on the tower layout, so it is computed once per
+    layout change instead of every tick. Each add/remove bumps the layout
+    version and marks the floors inside the interaction radius as dirty.
+    """
+
+    RADIUS = 5  # Floors within this distance affect each other
+
+    def __init__(self):
+        self.layout_version = 0
+        self.dirty_floors: Set[int] = set()
+
+    def invalidate(self, floor: int, size: int = 1) -> None:
+        """Mark every floor that can see floors floor..floor+size-1 as dirty"""
+        self.layout_version += 1
+        start = max(0, floor - self.RADIUS)
+        self.dirty_floors.update(range(start, floor + size + self.RADIUS))
+
+    def invalidate_all(self, floor_count: int) -> None:
+        """Mark the whole tower as dirty, e.g. after loading a save"""
+        self.layout_version += 1
+        self.dirty_floors.update(range(floor_count))
+
+    def take_dirty(self) -> Set[int]:
+        """Return and clear the set of dirty floors"""
+        dirty, self.dirty_floors = self.dirty_floors, set()
+        return dirty
+
+    @property
+    def is_clean(self) -> bool:
+        return not self.dirty_floors
+
+
+def _neighbour_windows(anchors, types, sizes, floor_count: int):
+    """Falloff-weighted neighbour counts by type, and the types seen at each anchor offset.
+
+    Both are indexed by floor and describe what a business anchored there
+    would see, as in Business.update_synergy: every occupied floor within
+    RADIUS except its own, weighted by the falloff on the distance between
+    anchors. For each floor k above the anchors, this is a correlation of a
+    floor-by-type one-hot matrix with a fixed kernel over sliding windows.
+    """
+    import numpy as np  # Optional dependency, only needed for bulk queries
+    from numpy.lib.stride_tricks import sliding_window_view
+
+    radius = SynergyCache.RADIUS
+    span = 2 * radius + 1
+    type_count = len(TYPE_INDEX)
+    # Window position j holds the anchor at F + j - radius
+    offsets = np.arange(span) - radius
+    falloff = np.maximum(0, (radius - np.abs(offsets)) / radius)
+
+    counts = np.zeros((floor_count, type_count))
+    seen = np.zeros((floor_count, type_count, span), dtype=bool)
+    for k in range(int(sizes.max(initial=0))):
+        occupied = sizes > k
+        onehot = np.zeros((floor_count + 2 * radius, type_count))
+        onehot[anchors[occupied] + radius, types[occupied]] = 1
+        windows = sliding_window_view(onehot, span, axis=0)  # (floor, type, offset)
+        # Floor anchor + k must be in the window and not the floor itself
+        visible = (np.abs(offsets + k) <= radius) & (offsets + k != 0)
+        counts += windows @ (falloff * visible)
+        seen |= (windows > 0) & visible
+    return counts, seen
+
+
+def _combos(seen, types):
+    """(business, combo) matrix of combos completed within one distance group"""
+    import numpy as np
+    from core.interactions import COMBO_MASKS
+
+    radius = SynergyCache.RADIUS
+    # A distance group is the anchors at -d and +d, plus the business itself
+    by_distance = seen[:, :, radius:] | seen[:, :, radius::-1]  # (business, type, distance)
+    bits = np.left_shift(1, np.arange(seen.shape[1], dtype=np.int64))
+    masks = (by_distance * bits[None, :, None]).sum(axis=1) | np.left_shift(1, types)[:, None]
+    present = by_distance.any(axis=1)
+    return (((masks[..., None] & COMBO_MASKS) == COMBO_MASKS) & present[..., None]).any(axis=1)
+
+
+def bulk_synergy(placements: Sequence[Tuple[int, int, int]], floor_count: int):
+    """Synergy, competition and combos for every business in one vectorized pass.
+
+    placements holds (anchor floor, type index, size) per business. Returns
+    per-business arrays of synergy, competition and special bonus, plus a
+    (business, combo) bool matrix ordered like BusinessInteraction.COMBO_MASKS.
+    """
+    import numpy as np
+    from core.interactions import SYNERGY, COMPETITION, COMBO_BONUSES
+
+    placements = np.asarray(placements, dtype=np.int64).reshape(-1, 3)
+    anchors, types, sizes = placements.T
+    counts, seen = _neighbour_windows(anchors, types, sizes, floor_count)
+    synergy = (counts[anchors] * SYNERGY[types]).sum(axis=1)
+    competition = (counts[anchors] * COMPETITION[types]).sum(axis=1)
+    combos = _combos(seen[anchors], types)
+    special = np.where(combos, COMBO_BONUSES, 0.0).max(axis=1, initial=0.0)
+    return synergy, competition, special, combos
+
+
+@dataclass
+class PlacementScores:
+    """Expected effects of placing one business type on each candidate floor.
+
+    Values are raw bonuses before the 75% cap in Business.set_synergy.
+    """
+    floors: "np.ndarray"  # Candidate anchor floors
+    synergy: "np.ndarray"  # Synergy the new business would get
+    competition: "np.ndarray"  # ...and competition (negative)
+    special: "np.ndarray"  # ...and its best special combo bonus
+    neighbour_effect: "np.ndarray"  # Synergy plus competition it adds to existing businesses
+    neighbour_special: "np.ndarray"  # Combo bonus existing businesses gain
+
+    @property
+    def total(self) -> "np.ndarray":
+        return (self.synergy + self.competition + self.special +
+                self.neighbour_effect + self.neighbour_special)
+
+    def best(self) -> Optional[int]:
+        """Floor with the highest total score"""
+        if not len(self.floors):
+            return None
+        return int(self.floors[self.total.argmax()])
+
+
+def placement_scores(placements: Sequence[Tuple[int, int, int]], floor_count: int,
+                     type_index: int, size: int, candidates: Sequence[int]) -> PlacementScores:
+    """Score placing a business of one type on every candidate floor at once.
+
+    The new business's own effects are the existing layout's neighbour
+    windows read at each candidate floor. Its effect on its neighbours is one
+    more correlation over the floor axis, of each existing business's
+    interaction with the new type.
+    """
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+    from core.interactions import SYNERGY, COMPETITION, COMBO_MASKS, COMBO_BONUSES
+
+    radius = SynergyCache.RADIUS
+    span = 2 * radius + 1
+    offsets = np.arange(span) - radius
+    falloff = np.maximum(0, (radius - np.abs(offsets)) / radius)
+    placements = np.asarray(placements, dtype=np.int64).reshape(-1, 3)
+    anchors, types, sizes = placements.T
+    floors = np.asarray(candidates, dtype=np.int64)
+    counts, seen = _neighbour_windows(anchors, types, sizes, floor_count)
+
+    # The new business sees the existing layout, plus its own upper floors at distance 0
+    own_floors = min(size, radius + 1) - 1
+    synergy = counts[floors] @ SYNERGY[type_index] + own_floors * SYNERGY[type_index, type_index]
+    competition = counts[floors] @ COMPETITION[type_index] + own_floors * COMPETITION[type_index, type_index]
+    candidate_seen = seen[floors]
+    if own_floors:
+        candidate_seen[:, type_index, radius] = True
+    combos = _combos(candidate_seen, np.full(len(floors), type_index))
+    special = np.where(combos, COMBO_BONUSES, 0.0).max(axis=1, initial=0.0)
+
+    # An existing business at offset d from the candidate sees `multiplicity[d]` of its floors
+    k = np.arange(size)[:, None]
+    multiplicity = ((np.abs(k - offsets) <= radius) & (k != offsets)).sum(axis=0)
+    effect = np.zeros(floor_count + 2 * radius)
+    effect[anchors + radius] = SYNERGY[types, type_index] + COMPETITION[types, type_index]
+    neighbour_effect = sliding_window_view(effect, span)[floors] @ (falloff * multiplicity)
+
+    # Combo bonus each existing business would gain if the new type joined its group at distance d
+    _, _, old_special, _ = bulk_synergy(placements, floor_count)
+    existing_seen = seen[anchors]
+    existing_seen[:, type_index, :] = True  # Each group in turn is the one it would join
+    by_distance = existing_seen[:, :, radius:] | existing_seen[:, :, radius::-1]
+    bits = np.left_shift(1, np.arange(seen.shape[1], dtype=np.int64))
+    masks = (by_distance * bits[None, :, None]).sum(axis=1) | np.left_shift(1, types)[:, None]
+    completed = (masks[..., None] & COMBO_MASKS) == COMBO_MASKS  # (business, distance, combo)
+    best = np.where(completed, COMBO_BONUSES, 0.0).max(axis=2, initial=0.0)
+    gain = np.zeros((floor_count + 2 * radius, radius + 1))
+    gain[anchors + radius] = np.maximum(0.0, best - old_special[:, None])
+    windows = sliding_window_view(gain, span, axis=0)[floors]  # (candidate, distance, offset)
+    neighbour_special = windows[:, np.abs(offsets), np.arange(span)] @ (multiplicity > 0)
+
+    return PlacementScores(floors, synergy, competition, special, neighbour_effect, neighbour_special)
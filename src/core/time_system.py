@@ -1,8 +1,25 @@
 from typing import Callable, List, Dict, Any, Optional
 from datetime import datetime, timedelta
-import random
+import heapq
+import itertools
 from enum import Enum
 from src.core.config import EventType
+from src.core.timing_wheel import TimingWheel
+
+EPOCH = datetime(2025, 1, 1)  # Tick 0 of the game clock
+SECONDS_PER_DAY = 86400
+
+def to_ticks(time: datetime) -> int:
+    """Convert a datetime to game ticks (whole game seconds since EPOCH)"""
+    return int((time - EPOCH).total_seconds())
+
+def to_datetime(ticks: int) -> datetime:
+    """Convert game ticks back to a datetime, for display only"""
+    return EPOCH + timedelta(seconds=ticks)
+
+def to_seconds(delta: timedelta) -> int:
+    """Convert a timedelta to a whole number of ticks"""
+    return int(delta.total_seconds())
 
 class EventPriority(Enum):
     LOW = 0      # Regular events like weather changes
@@ -17,8 +34,9 @@ class EventStatus(Enum):
     CANCELLED = 'cancelled'
 
 class GameEvent:
-    def __init__(self, time: datetime, callback: Callable, repeating: bool = False, 
-                 repeat_interval: timedelta = None, data: Dict[str, Any] = None,
+    """A scheduled callback; time and repeat_interval are in game ticks"""
+    def __init__(self, time: int, callback: Callable, repeating: bool = False, 
+                 repeat_interval: int = None, data: Dict[str, Any] = None,
                  priority: EventPriority = EventPriority.MEDIUM):
         self.time = time
         self.callback = callback
@@ -28,6 +46,7 @@ class GameEvent:
         self.priority = priority
         self.status = EventStatus.SCHEDULED
         self.notification_sent = False
+        self._entry = None  # Live EventQueue entry while pending
         
     def __lt__(self, other):
         # Sort by time first, then by priority
@@ -35,6 +54,101 @@ class GameEvent:
             return self.priority.value > other.priority.value
         return self.time < other.time
 
+class EventQueue:
+    """Binary heap of pending events, ordered like GameEvent.__lt__.
+
+    Entries are [time, -priority, sequence, event] so ties on time and
+    priority keep their scheduling order, as the old sorted list did.
+    Cancelling blanks the entry's event slot; blanked entries are skipped
+    when they reach the top and swept out once they make up most of the heap.
+    """
+    COMPACT_MIN = 64  # Don't bother compacting small heaps
+    
+    def __init__(self):
+        self._heap = []
+        self._counter = itertools.count()
+        self.cancelled = 0  # Tombstoned entries still in the heap
+        
+    def push(self, event: GameEvent) -> None:
+        """Add an event to the queue"""
+        entry = [event.time, -event.priority.value, next(self._counter), event]
+        event._entry = entry
+        heapq.heappush(self._heap, entry)
+        
+    def remove(self, event: GameEvent) -> bool:
+        """Lazily remove a pending event in O(1)"""
+        entry = getattr(event, '_entry', None)
+        if entry is None:
+            return False
+        entry[3] = None
+        event._entry = None
+        self.cancelled += 1
+        if self.cancelled > self.COMPACT_MIN and self.cancelled * 2 > len(self._heap):
+            self.compact()
+        return True
+    
+    def compact(self) -> None:
+        """Drop all tombstones and rebuild the heap"""
+        self._heap = [entry for entry in self._heap if entry[3] is not None]
+        heapq.heapify(self._heap)
+        self.cancelled = 0
+        
+    def _skip_cancelled(self) -> None:
+        while self._heap and self._heap[0][3] is None:
+            heapq.heappop(self._heap)
+            self.cancelled -= 1
+        
+    def peek(self) -> Optional[GameEvent]:
+        """Return the next event without removing it"""
+        self._skip_cancelled()
+        return self._heap[0][3] if self._heap else None
+    
+    def pop(self) -> GameEvent:
+        """Remove and return the next event"""
+        self._skip_cancelled()
+        event = heapq.heappop(self._heap)[3]
+        event._entry = None
+        return event
+    
+    def next_time(self) -> Optional[int]:
+        """Time of the next pending event"""
+        self._skip_cancelled()
+        return self._heap[0][0] if self._heap else None
+    
+    def __len__(self) -> int:
+        return len(self._heap) - self.cancelled
+    
+    def __iter__(self):
+        """Iterate over pending events in due order"""
+        return (entry[3] for entry in sorted(self._heap) if entry[3] is not None)
+
+class EventHandle:
+    """Handle returned when scheduling, used to cancel or move a pending event"""
+    def __init__(self, time_system: 'TimeSystem', event: GameEvent):
+        self._time_system = time_system
+        self.event = event
+        
+    @property
+    def pending(self) -> bool:
+        return self.event.status == EventStatus.SCHEDULED
+    
+    def cancel(self) -> bool:
+        """Cancel the event; returns False if it already fired or was cancelled"""
+        if not self.pending:
+            return False
+        self.event.status = EventStatus.CANCELLED
+        self._time_system.events.remove(self.event)
+        return True
+    
+    def reschedule(self, delay: timedelta) -> bool:
+        """Move the event to `delay` after the current time; returns False if it already fired or was cancelled"""
+        if not self.pending:
+            return False
+        self._time_system.events.remove(self.event)
+        self.event.time = self._time_system.ticks + to_seconds(delay)
+        self._time_system.events.push(self.event)
+        return True
+
 class EventNotification:
     def __init__(self, event_type: str, message: str, time: datetime, 
                  priority: EventPriority, data: Dict[str, Any] = None):
@@ -44,15 +158,98 @@ class EventNotification:
         self.priority = priority
         self.data = data or {}
         self.read = False
+        self.seq = 0  # Arrival order, set by NotificationBuffer
+
+class NotificationBuffer:
+    """Bounded notification store with one ring buffer per EventPriority.
+
+    Each priority gets its own fixed-size ring so a flood of low-priority
+    messages can't evict critical ones. Ring positions are running sequence
+    numbers; per priority, `_tail` is the oldest kept entry and `_unread` the
+    first one not yet read, so fetching new notifications only touches the
+    entries added since the last read.
+    """
+    def __init__(self, capacity: int = 64):
+        self.capacity = capacity  # Per priority
+        self._rings = {p: [None] * capacity for p in EventPriority}
+        self._head = dict.fromkeys(EventPriority, 0)  # Next sequence to write
+        self._tail = dict.fromkeys(EventPriority, 0)  # Oldest kept sequence
+        self._unread = dict.fromkeys(EventPriority, 0)  # First unread sequence
+        self._order = itertools.count()
+        
+    def push(self, notification: EventNotification) -> None:
+        """Add a notification, overwriting the oldest of its priority when full"""
+        priority = notification.priority
+        head = self._head[priority]
+        notification.seq = next(self._order)
+        self._rings[priority][head % self.capacity] = notification
+        self._head[priority] = head + 1
+        if head + 1 - self._tail[priority] > self.capacity:
+            self._tail[priority] += 1
+            self._unread[priority] = max(self._unread[priority], self._tail[priority])
+            
+    def _entries(self, priority: EventPriority, start: int) -> List[EventNotification]:
+        ring = self._rings[priority]
+        return [ring[seq % self.capacity] for seq in range(start, self._head[priority])]
+    
+    def unread(self, min_priority: EventPriority = EventPriority.LOW) -> List[EventNotification]:
+        """Unread notifications at or above a priority, oldest first"""
+        buckets = [[n for n in self._entries(p, self._unread[p]) if not n.read]
+                   for p in EventPriority if p.value >= min_priority.value]
+        return list(heapq.merge(*buckets, key=lambda n: n.seq))
+    
+    def all(self) -> List[EventNotification]:
+        """Every kept notification, oldest first"""
+        buckets = [self._entries(p, self._tail[p]) for p in EventPriority]
+        return list(heapq.merge(*buckets, key=lambda n: n.seq))
+    
+    def mark_read(self, notification: EventNotification) -> None:
+        """Mark a notification read and move its priority's unread cursor past read entries"""
+        notification.read = True
+        priority = notification.priority
+        ring = self._rings[priority]
+        cursor = self._unread[priority]
+        while cursor < self._head[priority] and ring[cursor % self.capacity].read:
+            cursor += 1
+        self._unread[priority] = cursor
+        
+    def clear_before(self, cutoff: datetime) -> int:
+        """Drop notifications older than cutoff; returns how many were dropped"""
+        dropped = 0
+        for priority, ring in self._rings.items():
+            tail = self._tail[priority]
+            while tail < self._head[priority] and ring[tail % self.capacity].time < cutoff:
+                ring[tail % self.capacity] = None
+                tail += 1
+            dropped += tail - self._tail[priority]
+            self._tail[priority] = tail
+            self._unread[priority] = max(self._unread[priority], tail)
+        return dropped
+    
+    def __len__(self) -> int:
+        return sum(self._head[p] - self._tail[p] for p in EventPriority)
 
 class TimeSystem:
-    def __init__(self, config):
+    # Event queue implementations; 'wheel' suits many long-lived recurring timers
+    QUEUE_BACKENDS = {
+        'heap': EventQueue,
+        'wheel': TimingWheel,
+    }
+    NOTIFICATION_CAPACITY = 64  # Kept per priority level
+    NOTIFICATION_MAX_AGE = timedelta(hours=6)  # Game time before a notification is cleared
+    
+    def __init__(self, config, backend: str = 'heap'):
         self.config = config
-        self.current_time = datetime(2025, 1, 1, hour=self.config.OPENING_HOUR)
-        self.events = []
-        self.notifications = []
+        # The clock is an integer count of game seconds; datetimes are only built for display
+        self.ticks = to_ticks(datetime(2025, 1, 1, hour=self.config.OPENING_HOUR))
+        self._tick_fraction = 0.0  # Sub-second remainder carried between updates
+        if backend not in self.QUEUE_BACKENDS:
+            raise ValueError(f"Unknown event queue backend: {backend}")
+        self.events = self.QUEUE_BACKENDS[backend]()
+        self.notifications = NotificationBuffer(self.NOTIFICATION_CAPACITY)
         self.speed_multiplier = 1.0
         self.paused = False
+        self.fast_forward = False  # Jump straight to the next due event each update
         
         # Event callbacks
         self.on_event_check = None
@@ -60,6 +257,7 @@ class TimeSystem:
         self.on_festival_end = None
         self.on_kaiju_attack = None
         self.on_emergency_drill = None
+        self.on_time_skipped = None  # Called with (start_tick, seconds) before a jump
         
         # Initialize recurring events
         self._setup_recurring_events()
@@ -93,31 +291,31 @@ class TimeSystem:
     
     def schedule_recurring_event(self, callback: Callable, start_time: datetime,
                                interval: timedelta, priority: EventPriority,
-                               data: Dict[str, Any] = None) -> None:
+                               data: Dict[str, Any] = None) -> EventHandle:
         """Schedule a recurring event"""
         event = GameEvent(
-            time=start_time,
+            time=to_ticks(start_time),
             callback=callback,
             repeating=True,
-            repeat_interval=interval,
+            repeat_interval=to_seconds(interval),
             data=data,
             priority=priority
         )
-        self.events.append(event)
-        self.events.sort()  # Keep events sorted by time and priority
+        self.events.push(event)
+        return EventHandle(self, event)
     
     def schedule_event(self, callback: Callable, delay: timedelta,
                       data: Dict[str, Any] = None, 
-                      priority: EventPriority = EventPriority.MEDIUM) -> None:
+                      priority: EventPriority = EventPriority.MEDIUM) -> EventHandle:
         """Schedule a one-time event"""
         event = GameEvent(
-            time=self.current_time + delay,
+            time=self.ticks + to_seconds(delay),
             callback=callback,
             data=data,
             priority=priority
         )
-        self.events.append(event)
-        self.events.sort()
+        self.events.push(event)
+        return EventHandle(self, event)
     
     def _daily_event_check(self, data: Dict[str, Any] = None) -> None:
         """Perform daily check for random events"""
@@ -127,43 +325,116 @@ class TimeSystem:
     def _trigger_rush_hour(self, data: Dict[str, Any]) -> None:
         """Handle rush hour events"""
         rush_type = data.get('rush_type', 'morning')
-        # Implement rush hour logic
+        self.notify('rush_hour', f"{rush_type.title()} rush hour", EventPriority.LOW, data)
+        
+    def notify(self, event_type: str, message: str,
+               priority: EventPriority = EventPriority.MEDIUM,
+               data: Dict[str, Any] = None) -> EventNotification:
+        """Post a notification stamped with the current game time"""
+        notification = EventNotification(event_type, message, self.current_time, priority, data)
+        self.notifications.push(notification)
+        return notification
+    
+    def get_notifications(self, unread_only: bool = False) -> List[EventNotification]:
+        """Get kept notifications, oldest first"""
+        if unread_only:
+            return self.notifications.unread()
+        return self.notifications.all()
+    
+    def mark_notification_read(self, notification: EventNotification) -> None:
+        """Mark a notification as shown"""
+        self.notifications.mark_read(notification)
+        
+    def clear_old_notifications(self, max_age: Optional[timedelta] = None) -> int:
+        """Drop notifications older than max_age of game time"""
+        return self.notifications.clear_before(self.current_time - (max_age or self.NOTIFICATION_MAX_AGE))
         
     def update(self, dt: float) -> None:
         """Update the time system"""
         if self.paused:
             return
             
-        # Update current time
-        time_delta = timedelta(seconds=dt * self.speed_multiplier)
-        self.current_time += time_delta
+        if self.fast_forward:
+            self.skip_to_next_event()
+            return
+            
+        # Advance whole ticks, carrying the fractional second to the next update
+        elapsed = dt * self.speed_multiplier + self._tick_fraction
+        whole = int(elapsed)
+        self._tick_fraction = elapsed - whole
+        self.ticks += whole
         
         # Process events
         self._process_events()
         
+    def skip_to_next_event(self, limit: Optional[int] = None) -> int:
+        """Jump the clock to the next due event (or limit, if sooner) and process it.
+        
+        Returns the number of ticks skipped. Listeners on
+        on_time_skipped integrate continuous processes over the gap.
+        """
+        target = self.events.next_time()
+        if target is None or (limit is not None and target > limit):
+            target = limit
+        if target is None or target <= self.ticks:
+            self._process_events()
+            return 0
+        
+        seconds = target - self.ticks
+        if self.on_time_skipped:
+            self.on_time_skipped(self.ticks, seconds)
+        self.ticks = target
+        self._process_events()
+        return seconds
+    
+    def advance(self, duration: timedelta) -> int:
+        """Fast-forward through a span of game time event by event; returns the number of jumps"""
+        end = self.ticks + to_seconds(duration)
+        jumps = 0
+        while self.ticks < end:
+            self.skip_to_next_event(end)
+            jumps += 1
+        return jumps
+        
     def _process_events(self) -> None:
         """Process all pending events"""
         # Process events that are due
-        while self.events and self.events[0].time <= self.current_time:
-            event = self.events.pop(0)
+        while self.events and self.events.next_time() <= self.ticks:
+            event = self.events.pop()
             if event.status != EventStatus.CANCELLED:
                 # Execute event callback
                 event.callback(event.data)
+                
+                # Callbacks may cancel or reschedule their own event
+                if event.status == EventStatus.CANCELLED or event._entry is not None:
+                    continue
                 event.status = EventStatus.COMPLETED
                 
-                # If event is recurring, schedule next occurrence
+                # If event is recurring, re-arm it for its next occurrence
                 if event.repeating and event.repeat_interval:
-                    next_time = event.time + event.repeat_interval
-                    new_event = GameEvent(
-                        time=next_time,
-                        callback=event.callback,
-                        repeating=True,
-                        repeat_interval=event.repeat_interval,
-                        data=event.data,
-                        priority=event.priority
-                    )
-                    self.events.append(new_event)
-                    self.events.sort()
+                    event.time += event.repeat_interval
+                    event.status = EventStatus.SCHEDULED
+                    self.events.push(event)
+    
+    @property
+    def current_time(self) -> datetime:
+        """Current game time as a datetime, for display and notifications"""
+        return to_datetime(self.ticks)
+    
+    @property
+    def current_day(self) -> int:
+        """Whole days elapsed since EPOCH"""
+        return self.ticks // SECONDS_PER_DAY
+    
+    @property
+    def current_hour(self) -> float:
+        """Current hour of day as a fraction, e.g. 13.5 for 1:30 PM"""
+        return (self.ticks % SECONDS_PER_DAY) / 3600
+    
+    def get_time_string(self, ticks: Optional[float] = None) -> str:
+        """Get the current (or given) game time formatted for display"""
+        time = self.current_time if ticks is None else to_datetime(int(ticks))
+        return time.strftime("%Y-%m-%d %H:%M")
     
     def set_speed(self, speed: str) -> None:
         """Set game speed"""
@@ -171,7 +442,9 @@ class TimeSystem:
             'pause': 0.0,
             'normal': 1.0,
             'fast': 2.0,
-            'ultra': 5.0
+            'ultra': 5.0,
+            'skip': 5.0
         }
         self.speed_multiplier = speeds.get(speed, 1.0)
         self.paused = (speed == 'pause')
+        self.fast_forward = (speed == 'skip')
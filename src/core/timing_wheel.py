@@ -0,0 +1,159 @@
+import heapq
+import itertools
+from typing import List, Optional
+
+
+class TimingWheel:
+    """Hierarchical timing wheel with the same interface as EventQueue.
+
+    Pending entries sit in minute/hour/day buckets relative to a cursor, so
+    scheduling is an append and finding the next due bucket is a bit scan per
+    level. A bucket is cascaded into the finer levels when the cursor reaches
+    it; entries in the cursor's own minute (or earlier) go into a small heap
+    that keeps EventQueue's (time, priority, sequence) ordering. Entries
+    beyond the day wheel wait in an overflow heap.
+    """
+    LEVELS = ((60, 60), (3600, 24), (86400, 64))  # (seconds per slot, slots)
+    COMPACT_MIN = 64  # Don't bother compacting small wheels
+
+    def __init__(self, start: int = 0):
+        self._spans = [width * slots for width, slots in self.LEVELS]
+        self._set_cursor(start)
+        self._wheels: List[List[list]] = [[[] for _ in range(slots)] for _, slots in self.LEVELS]
+        self._masks = [0] * len(self.LEVELS)  # bit i set when slot i is non-empty
+        self._ready = []  # Heap of entries due before the end of the cursor's minute
+        self._overflow = []  # Heap of entries past the last wheel
+        self._counter = itertools.count()
+        self._size = 0  # Entries held, including tombstones
+        self.cancelled = 0
+
+    def _set_cursor(self, current: int) -> None:
+        self.current = current
+        width = self.LEVELS[0][0]
+        self._ready_end = (current // width + 1) * width  # Everything in the wheels is at or after this
+        # End of the cursor's rotation of each wheel; placement compares against these
+        self._bounds = [(current // span + 1) * span for span in self._spans]
+
+    def _place(self, entry: list) -> None:
+        """Put an entry in the ready heap or the finest wheel that covers it"""
+        time = entry[0]
+        if time < self._ready_end:
+            heapq.heappush(self._ready, entry)
+            return
+        for level, bound in enumerate(self._bounds):
+            if time < bound:
+                width, slots = self.LEVELS[level]
+                slot = time // width % slots
+                self._wheels[level][slot].append(entry)
+                self._masks[level] |= 1 << slot
+                return
+        heapq.heappush(self._overflow, entry)
+
+    def push(self, event) -> None:
+        """Add an event to the wheel"""
+        entry = [event.time, -event.priority.value, next(self._counter), event]
+        event._entry = entry
+        self._size += 1
+        self._place(entry)
+
+    def remove(self, event) -> bool:
+        """Lazily remove a pending event in O(1)"""
+        entry = getattr(event, '_entry', None)
+        if entry is None:
+            return False
+        entry[3] = None
+        event._entry = None
+        self.cancelled += 1
+        if self.cancelled > self.COMPACT_MIN and self.cancelled * 2 > self._size:
+            self.compact()
+        return True
+
+    def compact(self) -> None:
+        """Drop all tombstones from every bucket"""
+        for level, wheel in enumerate(self._wheels):
+            self._masks[level] = 0
+            for slot, bucket in enumerate(wheel):
+                bucket[:] = [entry for entry in bucket if entry[3] is not None]
+                if bucket:
+                    self._masks[level] |= 1 << slot
+        self._ready = [entry for entry in self._ready if entry[3] is not None]
+        heapq.heapify(self._ready)
+        self._overflow = [entry for entry in self._overflow if entry[3] is not None]
+        heapq.heapify(self._overflow)
+        self._size -= self.cancelled
+        self.cancelled = 0
+
+    def _cascade(self, level: int, slot: int) -> None:
+        """Move the cursor to the start of a bucket and redistribute its entries"""
+        width, slots = self.LEVELS[level]
+        span = self._spans[level]
+        self._set_cursor(self.current // span * span + slot * width)
+        bucket = self._wheels[level][slot]
+        self._wheels[level][slot] = []
+        self._masks[level] &= ~(1 << slot)
+        for entry in bucket:
+            if entry[3] is None:
+                self._size -= 1
+                self.cancelled -= 1
+            else:
+                self._place(entry)
+
+    def _fill_ready(self) -> None:
+        """Advance the cursor until the ready heap holds the earliest live entry"""
+        if self._ready and self._ready[0][3] is not None:
+            return
+        while True:
+            while self._ready and self._ready[0][3] is None:
+                heapq.heappop(self._ready)
+                self._size -= 1
+                self.cancelled -= 1
+            if self._ready or self._size == self.cancelled:
+                return
+            for level, (width, slots) in enumerate(self.LEVELS):
+                # Only buckets after the cursor's own slot can hold entries
+                mask = self._masks[level] >> (self.current // width % slots + 1)
+                if mask:
+                    slot = self.current // width % slots + (mask & -mask).bit_length()
+                    self._cascade(level, slot)
+                    break
+            else:
+                # Wheels are empty; pull the next overflow day range in
+                span = self._spans[-1]
+                entry = self._overflow[0]
+                self._set_cursor(max(self.current, entry[0] // span * span))
+                while self._overflow and self._overflow[0][0] // span == self.current // span:
+                    entry = heapq.heappop(self._overflow)
+                    if entry[3] is None:
+                        self._size -= 1
+                        self.cancelled -= 1
+                    else:
+                        self._place(entry)
+
+    def peek(self):
+        """Return the next event without removing it"""
+        self._fill_ready()
+        return self._ready[0][3] if self._ready else None
+
+    def pop(self):
+        """Remove and return the next event"""
+        self._fill_ready()
+        event = heapq.heappop(self._ready)[3]
+        self._size -= 1
+        event._entry = None
+        return event
+
+    def next_time(self) -> Optional[int]:
+        """Time of the next pending event"""
+        self._fill_ready()
+        return self._ready[0][0] if self._ready else None
+
+    def __len__(self) -> int:
+        return self._size - self.cancelled
+
+    def __iter__(self):
+        """Iterate over pending events in due order"""
+        entries = self._ready + self._overflow
+        for wheel in self._wheels:
+            for bucket in wheel:
+                entries.extend(bucket)
+        return (entry[3] for entry in sorted(entries) if entry[3] is not None)
@@ -1,330 +1,160 @@
 from kivy.uix.widget import Widget
-from kivy.graphics import Rectangle, Color
-from entities.business import Business, BusinessType
-from kivy.properties import ListProperty, NumericProperty, ObjectProperty, StringProperty
+from kivy.graphics import Rectangle, Color, InstructionGroup, PushMatrix, PopMatrix, Translate, Scale
 from typing import Optional, List, Dict
-from src.maps.templates.base_map import BaseMap
 from src.core.config import Config
-import importlib
-import os
-from dataclasses import dataclass
-
-@dataclass
-class Floor:
-    """Represents a floor in the tower"""
-    number: int
-    business: Optional[Business] = None
-    is_occupied: bool = False
-    maintenance_level: float = 100  # 0-100
-    traffic: int = 0  # Number of people on this floor
-
-from random import random
-from entities.business import Business, BusinessType, BusinessEvent
+from src.core.tower_core import TowerCore, Floor
 
 class Tower(Widget):
-    floors = ListProperty([])
-    max_floors = NumericProperty(100)
-    floor_width = NumericProperty(20)
-    current_map = ObjectProperty(None)
-    current_theme = StringProperty(None)
-    MAX_FLOORS = 300  # Maximum number of floors allowed
+    """Kivy view of a TowerCore.
+
+    Drawing lives here; layout and simulation state live on the core, and
+    attribute lookups that miss the widget fall through to it.
+    """
+    MAX_FLOORS = TowerCore.MAX_FLOORS
     
-    def __init__(self, map_name: str = "tokyo_tower", **kwargs):
+    def __init__(self, map_name: str = "tokyo_tower", columnar: bool = False,
+                 core: Optional[TowerCore] = None, **kwargs):
         super(Tower, self).__init__(**kwargs)
-        self.businesses = []
-        self.total_visitors = 0
-        self.elevator_capacity = 20
-        self.elevator_speed = 1.0  # floors per second
-        self.reputation = 50  # 0-100
-        self.load_map(map_name)
-        self.initialize_tower()
+        self._setup_canvas()
+        self.core = core or TowerCore(map_name, columnar=columnar)
+        self.core.on_floors_changed = self.redraw_floors
+        self.core.on_layout_reset = self._reset_graphics
+        self.core.on_theme_changed = self.redraw_all
+        self.redraw_all()
         
         # Bind to size and position changes
-        self.bind(pos=self.update_graphics, size=self.update_graphics)
-        
-    def load_map(self, map_name: str) -> None:
-        """Load a custom map by name"""
-        try:
-            # Import the map module dynamically
-            module = importlib.import_module(f"src.maps.{map_name}")
-            # Get the map class (assuming it's the only class in the module)
-            map_class = next(obj for name, obj in module.__dict__.items() 
-                           if isinstance(obj, type) and issubclass(obj, BaseMap))
-            self.current_map = map_class()
-            
-            # Apply map settings
-            self.max_floors = self.current_map.metadata.max_floors
-            self.current_theme = self.current_map.metadata.theme
-            
-            # Initialize map-specific features
-            self.current_map.initialize_map()
-            
-        except Exception as e:
-            print(f"Error loading map {map_name}: {e}")
-            # Load default empty map
-            self.max_floors = 100
-            self.current_theme = None
-    
-    def initialize_tower(self):
-        """Initialize the tower with map-specific settings"""
-        self.floors.clear()
-        # Start with 3 empty floors
-        for _ in range(3):
-            self.add_floor()
-            
-        # Apply any predefined structures from the map
-        if self.current_map and self.current_map.predefined_structures:
-            for structure in self.current_map.predefined_structures:
-                self.add_predefined_structure(structure)
-
-    def add_predefined_structure(self, structure: Dict) -> None:
-        """Add a predefined structure from the map configuration"""
-        if 'type' in structure and 'position' in structure:
-            business_type = structure['type']
-            x, y = structure['position']
-            if self.can_place_building((x, y), business_type):
-                self.add_business(business_type, (x, y))
-    
-    def add_floor(self):
-        """Add a new floor to the tower"""
-        if len(self.floors) < self.MAX_FLOORS:
-            new_floor = [None] * self.floor_width
-            self.floors.append(new_floor)
-            self.update_graphics()
-            return True
-        else:
-            print("Maximum floor limit reached!")
-        return False
+        self.bind(pos=self.update_graphics, size=self.update_graphics,
+                  parent=self.update_graphics)
+        self.update_graphics()
     
-    def update_graphics(self, *args):
-        """Update the tower's graphics with theme-specific colors"""
-        self.canvas.clear()
+    def __getattr__(self, name):
+        core = self.__dict__.get('core')
+        if core is None:
+            raise AttributeError(name)
+        return getattr(core, name)
+    
+    def _setup_canvas(self):
+        """Create the transform and containers for floor and band instruction groups"""
+        self._floor_groups: List[InstructionGroup] = []
+        self._drawn_floors = set()  # Floors whose group currently holds instructions
+        self.visible_range = (0, self.MAX_FLOORS - 1)
+        self.lod_block = 1  # Floors merged into one band; 1 draws full detail
+        self.view_zoom = 1.0
+        self.view_scroll = 0.0  # Floor at the bottom edge of the view
         with self.canvas:
-            # Apply theme-specific colors if available
-            theme_colors = self.get_theme_colors()
-            
-            # Draw floors
-            for floor_num, floor in enumerate(self.floors):
-                y = floor_num * self.parent.grid_size
-                
-                # Draw floor background with theme color
-                Color(*theme_colors.get('floor_bg', (0.95, 0.95, 0.95, 1)))
-                Rectangle(pos=(self.x, self.y + y),
-                         size=(self.floor_width * self.parent.grid_size, self.parent.grid_size))
-                
-                # Draw businesses on this floor with theme-specific colors
-                for tile_num, business in enumerate(floor):
-                    if business:
-                        business.draw(self.canvas, (tile_num, floor_num), 
-                                   self.parent.grid_size, theme_colors)
-    
-    def get_theme_colors(self) -> Dict:
-        """Get the current theme's color scheme"""
-        if self.current_theme and self.current_theme in Config.AVAILABLE_THEMES:
-            return Config.AVAILABLE_THEMES[self.current_theme]['color_scheme']
-        return {}
-    
-    def can_place_building(self, position: tuple, business_type: str) -> bool:
-        """Check if a building can be placed at the specified position"""
-        x, y = position
-        
-        # Check map-specific building restrictions
-        if self.current_map and not self.current_map.validate_build(x, y, business_type):
-            return False
-            
-        # Check if the position is within restricted areas
-        if self.current_map and any(area.contains(x, y) for area in self.current_map.restricted_areas):
-            return False
-            
-        # Continue with regular placement checks
-        if not self.is_position_valid(position):
-            return False
-            
-        # Get business size from app config
-        business_config = self.parent.config.BUSINESS_TYPES.get(business_type)
-        if not business_config:
-            return False
-            
-        width, height = business_config['size']
-        
-        # Check if space is available
-        for dx in range(width):
-            for dy in range(height):
-                check_pos = (x + dx, y + dy)
-                if not self.is_position_empty(check_pos):
-                    return False
-        
-        return True
+            PushMatrix()
+            self._translate = Translate(0, 0)
+            self._scale = Scale(1, 1, 1)
+            self._floors_group = InstructionGroup()
+            self._bands_group = InstructionGroup()
+            PopMatrix()
+    
+    def _reset_graphics(self) -> None:
+        """Drop all floor and band instructions"""
+        self._floors_group.clear()
+        self._bands_group.clear()
+        self._floor_groups.clear()
+        self._drawn_floors.clear()
+    
+    def _grid_size(self) -> float:
+        return self.parent.grid_size if self.parent else Config.TILE_SIZE
     
-    def add_business(self, business_type: BusinessType, floor_number: int) -> bool:
-        """Add a new business to the tower"""
-        if not 0 <= floor_number < self.MAX_FLOORS:
-            return False
-            
-        # Check if target floors are available
-        business = Business(business_type, floor_number)
-        required_floors = range(floor_number, floor_number + business.size)
-        
-        if not all(0 <= f < self.MAX_FLOORS and not self.floors[f].is_occupied 
-                  for f in required_floors):
-            return False
-        
-        # Occupy the floors
-        for f in required_floors:
-            self.floors[f].is_occupied = True
-            self.floors[f].business = business
-        
-        self.businesses.append(business)
+    def update_graphics(self, *args):
+        """Move and scale the tower graphics without rebuilding them"""
+        floor_pixels = self._grid_size() * self.view_zoom
+        self._translate.xy = (self.x, self.y - self.view_scroll * floor_pixels)
+        self._scale.xyz = (floor_pixels, floor_pixels, 1)
+    
+    def set_view(self, first: int, last: int, lod_block: int = 1,
+                 zoom: float = 1.0, scroll: float = 0.0) -> None:
+        """Set the visible floor range and detail level, drawing only what changed"""
+        self.view_zoom = zoom
+        self.view_scroll = scroll
         self.update_graphics()
-        return True
-    
-    def remove_business(self, floor_number: int) -> bool:
-        """Remove a business from the tower"""
-        if not 0 <= floor_number < self.MAX_FLOORS:
-            return False
-            
-        floor = self.floors[floor_number]
-        if not floor.business:
-            return False
-            
-        business = floor.business
-        # Free up all floors occupied by this business
-        for f in range(business.floor, business.floor + business.size):
-            self.floors[f].is_occupied = False
-            self.floors[f].business = None
+        if (first, last) == self.visible_range and lod_block == self.lod_block:
+            return
+        self.visible_range = (first, last)
+        self.lod_block = lod_block
         
-        self.businesses.remove(business)
-        self.update_graphics()
-        return True
-    
-    def is_position_valid(self, position):
-        """Check if the position is within tower bounds"""
-        x, y = position
-        return (0 <= y < len(self.floors) and 
-                0 <= x < self.floor_width)
-    
-    def is_position_empty(self, position):
-        """Check if the position is empty"""
-        x, y = position
-        if not self.is_position_valid(position):
-            return False
-        return self.floors[y][x] is None
-    
-    def update(self, dt: float):
-        """Update tower state"""
-        self.total_visitors = 0
-        current_hour = self.time_system.current_hour if hasattr(self, 'time_system') else 12
+        if lod_block > 1:
+            self._clear_floors(set(self._drawn_floors))
+            self._draw_bands()
+            return
         
-        # Update nearby business lists and synergies
-        for business in self.businesses:
-            nearby = self._get_nearby_businesses(business.floor, 5)  # 5 floor radius
-            business.update_synergy(nearby)
-            
-            # Random events
-            self._check_random_events(business)
-            
-            # Update business with current time
-            business.update(dt, current_hour)
-            self.total_visitors += len(business.customers)
-            
-            # Update floor traffic
-            for f in range(business.floor, business.floor + business.size):
-                self.floors[f].traffic = len(business.customers) // business.size
+        self._bands_group.clear()
+        visible = set(range(first, min(last + 1, len(self.floors))))
+        self._clear_floors(self._drawn_floors - visible)
+        theme_colors = self.get_theme_colors()
+        for floor_num in sorted(visible - self._drawn_floors):
+            self._draw_floor(self._floor_group(floor_num), floor_num, theme_colors)
+            self._drawn_floors.add(floor_num)
+    
+    def _is_visible(self, floor_num: int) -> bool:
+        first, last = self.visible_range
+        return first <= floor_num <= last
+    
+    def _floor_group(self, floor_num: int) -> InstructionGroup:
+        """Get the instruction group for a floor, creating groups as needed"""
+        while len(self._floor_groups) <= floor_num:
+            group = InstructionGroup()
+            self._floor_groups.append(group)
+            self._floors_group.add(group)
+        return self._floor_groups[floor_num]
+    
+    def _clear_floors(self, floors) -> None:
+        """Drop the instructions of floors that scrolled out of view"""
+        for floor_num in floors:
+            self._floor_groups[floor_num].clear()
+        self._drawn_floors -= set(floors)
+    
+    def redraw_floors(self, start: int, count: int = 1) -> None:
+        """Rebuild the instruction groups for floors start..start+count-1"""
+        if self.lod_block > 1:
+            self._draw_bands()
+            return
+        theme_colors = self.get_theme_colors()
+        for floor_num in range(max(0, start), min(start + count, len(self.floors))):
+            group = self._floor_group(floor_num)
+            if self._is_visible(floor_num):
+                self._draw_floor(group, floor_num, theme_colors)
+                self._drawn_floors.add(floor_num)
+            elif floor_num in self._drawn_floors:
+                self._clear_floors([floor_num])
+    
+    def redraw_all(self) -> None:
+        """Rebuild every floor, e.g. after a theme change"""
+        self.redraw_floors(0, len(self.floors))
+    
+    def _draw_bands(self) -> None:
+        """Draw visible floors as bands of lod_block floors, shaded by occupancy"""
+        self._bands_group.clear()
+        theme_colors = self.get_theme_colors()
+        empty = theme_colors.get('floor_bg', (0.95, 0.95, 0.95, 1))
+        full = theme_colors.get('band_occupied', (0.35, 0.45, 0.65, 1))
+        block = self.lod_block
+        first, last = self.visible_range
+        last = min(last, len(self.floors) - 1)
+        for start in range(first - first % block, last + 1, block):
+            size = min(block, len(self.floors) - start)
+            occupied = (self.occupancy.floor_bits >> start) & ((1 << size) - 1)
+            ratio = occupied.bit_count() / size
+            self._bands_group.add(Color(*(e + (f - e) * ratio for e, f in zip(empty, full))))
+            self._bands_group.add(Rectangle(pos=(0, start), size=(self.floor_width, size)))
+    
+    def _draw_floor(self, group: InstructionGroup, floor_num: int, theme_colors: Dict) -> None:
+        """Emit the instructions for one floor in grid units"""
+        group.clear()
         
-        # Update tower reputation based on business satisfaction and synergies
-        if self.businesses:
-            avg_satisfaction = sum(b.satisfaction for b in self.businesses) / len(self.businesses)
-            avg_synergy = sum(b.synergy_bonus for b in self.businesses) / len(self.businesses)
-            self.reputation = (self.reputation * 0.9 + 
-                             avg_satisfaction * 0.07 +
-                             avg_synergy * 100 * 0.03)
-    
-    def _get_nearby_businesses(self, floor: int, radius: int) -> List[Business]:
-        """Get list of businesses within specified floor radius"""
-        nearby = []
-        for f in range(max(0, floor - radius), min(self.MAX_FLOORS, floor + radius + 1)):
-            if f != floor and self.floors[f].business:
-                nearby.append(self.floors[f].business)
-        return nearby
-    
-    def _check_random_events(self, business: Business) -> None:
-        """Check for random business events"""
-        if random() < 0.01:  # 1% chance per update
-            event_chances = {
-                BusinessEvent.SPECIAL_PROMOTION: 0.3,
-                BusinessEvent.CELEBRITY_VISIT: 0.1,
-                BusinessEvent.STAFF_SHORTAGE: 0.2,
-                BusinessEvent.EQUIPMENT_FAILURE: 0.2,
-                BusinessEvent.HEALTH_INSPECTION: 0.15,
-                BusinessEvent.RENOVATION: 0.05
-            }
-            
-            for event, chance in event_chances.items():
-                if random() < chance:
-                    business.trigger_event(event)
-                    break
-    
-    def get_floor_stats(self, floor_number: int) -> Dict:
-        """Get statistics for a specific floor"""
-        if not 0 <= floor_number < self.MAX_FLOORS:
-            return {}
-            
-        floor = self.floors[floor_number]
-        stats = {
-            'number': floor.number,
-            'occupied': floor.is_occupied,
-            'maintenance': floor.maintenance_level,
-            'traffic': floor.traffic,
-        }
+        # Draw floor background with theme color
+        group.add(Color(*theme_colors.get('floor_bg', (0.95, 0.95, 0.95, 1))))
+        group.add(Rectangle(pos=(0, floor_num), size=(self.floor_width, 1)))
         
-        if floor.business:
-            stats.update({
-                'business_type': floor.business.type.value,
-                'business_name': floor.business.name,
-                'income': floor.business.actual_income,
-                'satisfaction': floor.business.satisfaction,
-                'customers': len(floor.business.customers),
-                'synergy_bonus': floor.business.synergy_bonus,
-                'events': floor.business.events,
-                'peak_hours': floor.business.peak_hours
-            })
-        
-        return stats
-    
-    def get_tower_stats(self) -> Dict:
-        """Get overall tower statistics"""
-        return {
-            'total_floors': self.MAX_FLOORS,
-            'occupied_floors': sum(1 for f in self.floors if f.is_occupied),
-            'total_businesses': len(self.businesses),
-            'total_visitors': self.total_visitors,
-            'reputation': self.reputation,
-            'total_income': sum(b.income for b in self.businesses),
-            'total_maintenance': sum(b.maintenance_cost for b in self.businesses)
-        }
-    
-    def get_building_cost(self, business_type):
-        """Get the cost of building a specific business type"""
-        business_config = self.parent.config.BUSINESS_TYPES.get(business_type)
-        return business_config['cost'] if business_config else 0
-
-    def get_all_businesses(self):
-        """Return a list of all business types available."""
-        return [
-            "Restaurant",
-            "Retail Store",
-            "Office",
-            "Hotel",
-            "Gym",
-            "Cinema",
-            "Arcade",
-            "Spa",
-            "Conference Room",
-            "Rooftop Bar"
-        ]
-
-    def include_all_businesses(self):
-        """Ensure all business types are included in the tower."""
-        for business_type in self.get_all_businesses():
-            if business_type not in [b.type for b in self.businesses]:
-                self.add_business(Business(type=business_type))
+        # Draw each run of tiles held by the same business as one block
+        tiles = self.floors[floor_num].tiles
+        start = 0
+        for tile_num in range(1, len(tiles) + 1):
+            if tile_num < len(tiles) and tiles[tile_num] is tiles[start]:
+                continue
+            if tiles[start]:
+                tiles[start].draw_into(group, (start, floor_num), (tile_num - start, 1), theme_colors)
+            start = tile_num
@@ -0,0 +1,521 @@
+from typing import Callable, Optional, List, Dict
+from src.core.config import Config
+from src.core.occupancy import OccupancyIndex
+from src.core.synergy import SynergyCache, PlacementScores, bulk_synergy, placement_scores
+from dataclasses import dataclass, field
+from random import Random
+from src.core.random_events import BusinessEventSampler
+from src.core.modifiers import ModifierStack
+from entities.business import (Business, BusinessType, BusinessEvent, BusinessInteraction,
+                               BUSINESS_SPECS, DEFAULT_SPEC, TYPE_INDEX)
+import importlib
+
+@dataclass
+class Floor:
+    """Represents a floor in the tower"""
+    number: int
+    business: Optional[Business] = None
+    is_occupied: bool = False
+    maintenance_level: float = 100  # 0-100
+    traffic: int = 0  # Number of people on this floor
+    tiles: List = field(default_factory=list)  # Per-tile contents for grid placement
+    
+    def __len__(self) -> int:
+        """Width of the floor in tiles"""
+        return len(self.tiles)
+
+class TowerCore:
+    """Tower layout and business simulation without any Kivy dependency.
+
+    The Tower widget wraps an instance of this class and only handles drawing,
+    so the same core can run headless for balance runs and benchmarks.
+    """
+    MAX_FLOORS = 300  # Maximum number of floors allowed
+    TICK_SECONDS = 60  # Game seconds one update step stands for, stepped or integrated
+    BULK_SYNERGY_MIN = 64  # Full rebuilds with at least this many businesses take the NumPy path
+    
+    def __init__(self, map_name: Optional[str] = "tokyo_tower", config=Config,
+                 columnar: bool = False, rng: Optional[Random] = None):
+        self.config = config
+        self.floors: List[Floor] = []
+        self.max_floors = 100
+        self.floor_width = 20
+        self.current_map = None
+        self._current_theme = None
+        self.businesses = []
+        self.business_store = None
+        if columnar:
+            # Optional NumPy backend; imported lazily so the default path has no NumPy dependency
+            from src.core.business_store import BusinessStore
+            self.business_store = BusinessStore()
+        self.total_visitors = 0
+        self.elevator_capacity = 20
+        self.elevator_speed = 1.0  # floors per second
+        self.reputation = 50  # 0-100
+        self.spawn_multiplier = 1.0  # Time-of-day and weather rate, set each frame
+        # Keyed event effects: satisfaction points on the tower average, and visitor rate
+        self.satisfaction_modifiers = ModifierStack()
+        self.visitor_modifiers = ModifierStack()
+        self.time_system = None
+        self.occupancy = OccupancyIndex(self.floor_width, self.MAX_FLOORS)
+        self.synergy_cache = SynergyCache()
+        self._placement_cache: Dict[BusinessType, tuple] = {}  # type -> (layout key, scores)
+        self.event_sampler = BusinessEventSampler(rng=rng)
+        self._skipped_event_ticks = 0.0  # Fraction of a sampler tick left over from integrate
+        
+        # View callbacks
+        self.on_floors_changed: Optional[Callable[[int, int], None]] = None
+        self.on_layout_reset: Optional[Callable[[], None]] = None
+        self.on_theme_changed: Optional[Callable[[], None]] = None
+        self.on_business_event: Optional[Callable[[Business, str], None]] = None
+        
+        if map_name:
+            self.load_map(map_name)
+        self.initialize_tower()
+        
+    @property
+    def current_theme(self) -> Optional[str]:
+        return self._current_theme
+    
+    @current_theme.setter
+    def current_theme(self, theme: Optional[str]) -> None:
+        changed = theme != self._current_theme
+        self._current_theme = theme
+        if changed and self.on_theme_changed:
+            self.on_theme_changed()
+    
+    def load_map(self, map_name: str) -> None:
+        """Load a custom map by name"""
+        from src.maps.templates.base_map import BaseMap
+        try:
+            # Import the map module dynamically
+            module = importlib.import_module(f"src.maps.{map_name}")
+            # Get the map class (assuming it's the only class in the module)
+            map_class = next(obj for name, obj in module.__dict__.items() 
+                           if isinstance(obj, type) and issubclass(obj, BaseMap) and obj is not BaseMap)
+            self.current_map = map_class()
+            
+            # Apply map settings
+            self.max_floors = self.current_map.metadata.max_floors
+            self.current_theme = self.current_map.metadata.theme
+            
+            # Initialize map-specific features
+            self.current_map.initialize_map()
+            
+        except Exception as e:
+            print(f"Error loading map {map_name}: {e}")
+            # Load default empty map
+            self.max_floors = 100
+            self.current_theme = None
+    
+    def initialize_tower(self):
+        """Initialize the tower with map-specific settings"""
+        self.floors.clear()
+        self.occupancy.clear()
+        self._placement_cache.clear()
+        if self.on_layout_reset:
+            self.on_layout_reset()
+        # Start with 3 empty floors
+        for _ in range(3):
+            self.add_floor()
+            
+        # Apply any predefined structures from the map
+        if self.current_map and self.current_map.predefined_structures:
+            for structure in self.current_map.predefined_structures:
+                self.add_predefined_structure(structure)
+
+    def add_predefined_structure(self, structure: Dict) -> None:
+        """Add a predefined structure from the map configuration"""
+        if 'type' in structure and 'position' in structure:
+            business_type = structure['type']
+            x, y = structure['position']
+            if self.can_place_building((x, y), business_type):
+                self.add_business(business_type, (x, y))
+    
+    def add_floor(self):
+        """Add a new floor to the tower"""
+        if len(self.floors) < self.MAX_FLOORS:
+            new_floor = Floor(number=len(self.floors), tiles=[None] * self.floor_width)
+            self.floors.append(new_floor)
+            self.occupancy.add_floor()
+            self._floors_changed(len(self.floors) - 1)
+            return True
+        else:
+            print("Maximum floor limit reached!")
+        return False
+    
+    def _floors_changed(self, start: int, count: int = 1) -> None:
+        """Tell the attached view which floors need redrawing"""
+        if self.on_floors_changed:
+            self.on_floors_changed(start, count)
+    
+    def get_theme_colors(self) -> Dict:
+        """Get the current theme's color scheme"""
+        if self.current_theme and self.current_theme in Config.AVAILABLE_THEMES:
+            return Config.AVAILABLE_THEMES[self.current_theme]['color_scheme']
+        return {}
+    
+    def can_place_building(self, position: tuple, business_type: str) -> bool:
+        """Check if a building can be placed at the specified position"""
+        x, y = position
+        
+        # Check map-specific building restrictions
+        if self.current_map and not self.current_map.validate_build(x, y, business_type):
+            return False
+            
+        # Check if the position is within restricted areas
+        if self.current_map and any(area.contains(x, y) for area in self.current_map.restricted_areas):
+            return False
+            
+        # Continue with regular placement checks
+        if not self.is_position_valid(position):
+            return False
+            
+        # Get business size from app config
+        business_config = self.config.BUSINESS_TYPES.get(business_type)
+        if not business_config:
+            return False
+            
+        width, height = business_config['size']
+        
+        # Check if space is available
+        return self.occupancy.fits(x, y, width, height)
+    
+    def add_business(self, business_type: BusinessType, floor_number: int) -> bool:
+        """Add a new business to the tower"""
+        if not 0 <= floor_number < self.MAX_FLOORS:
+            return False
+            
+        # Check if target floors are available
+        business = self._create_business(business_type, floor_number)
+        required_floors = range(floor_number, floor_number + business.size)
+        
+        if not self.occupancy.is_span_free(floor_number, business.size):
+            self._release_business(business)
+            return False
+        
+        # Occupy the floors
+        self.occupancy.occupy_floors(floor_number, business.size)
+        for f in required_floors:
+            self.floors[f].is_occupied = True
+            self.floors[f].business = business
+            self.floors[f].tiles[:] = [business] * len(self.floors[f].tiles)
+        
+        self.businesses.append(business)
+        self.event_sampler.add(business)
+        self.synergy_cache.invalidate(floor_number, business.size)
+        self._floors_changed(floor_number, business.size)
+        return True
+    
+    def _create_business(self, business_type: BusinessType, floor_number: int) -> Business:
+        """Create a business, backed by the columnar store when enabled"""
+        if self.business_store is not None:
+            from src.core.business_store import ColumnarBusiness
+            return ColumnarBusiness(business_type, floor_number, self.business_store)
+        return Business(business_type, floor_number)
+    
+    def _release_business(self, business: Business) -> None:
+        """Return a business's storage row, if it has one"""
+        if self.business_store is not None:
+            business.release()
+    
+    def remove_business(self, floor_number: int) -> bool:
+        """Remove a business from the tower"""
+        if not 0 <= floor_number < len(self.floors):
+            return False
+            
+        floor = self.floors[floor_number]
+        if not floor.business:
+            return False
+            
+        business = floor.business
+        # Free up all floors occupied by this business
+        self.occupancy.release_floors(business.floor, business.size)
+        for f in range(business.floor, business.floor + business.size):
+            self.floors[f].is_occupied = False
+            self.floors[f].business = None
+            self.floors[f].tiles[:] = [None] * len(self.floors[f].tiles)
+        
+        self.businesses.remove(business)
+        self.event_sampler.remove(business)
+        self._release_business(business)
+        self.synergy_cache.invalidate(business.floor, business.size)
+        self._floors_changed(business.floor, business.size)
+        return True
+    
+    def is_position_valid(self, position):
+        """Check if the position is within tower bounds"""
+        x, y = position
+        return (0 <= y < len(self.floors) and 
+                0 <= x < self.floor_width)
+    
+    def is_position_empty(self, position):
+        """Check if the position is empty"""
+        x, y = position
+        return self.occupancy.is_tile_free(x, y)
+    
+    def find_free_floors(self, size: int, start: int = 0) -> Optional[int]:
+        """Find the lowest floor at or above start with `size` empty floors above it"""
+        return self.occupancy.next_free_span(size, start)
+    
+    def update(self, dt: float, spawn_multiplier: Optional[float] = None):
+        """Update tower state"""
+        self.total_visitors = 0
+        if spawn_multiplier is not None:
+            self.spawn_multiplier = spawn_multiplier
+        current_hour = self.time_system.current_hour if self.time_system else 12
+        self._expire_modifiers()
+        
+        # Recompute synergies only for floors touched by layout changes
+        self._refresh_synergies()
+        
+        # Random events for the businesses whose next event falls on this tick
+        self._fire_random_events()
+        
+        # Time of day, weather, sales and map events scale how many customers come
+        visitor_rate = self.effective_spawn_multiplier
+        if self.business_store is not None:
+            self._update_columnar(dt, current_hour, visitor_rate)
+            return
+        
+        for business in self.businesses:
+            business.apply_combo_effects()
+            
+            # Update business with current time
+            business.update(dt, current_hour, visitor_rate)
+            self.total_visitors += len(business.customers)
+            
+            # Update floor traffic
+            for f in range(business.floor, business.floor + business.size):
+                self.floors[f].traffic = len(business.customers) // business.size
+        
+        # Update tower reputation based on business satisfaction and synergies
+        if self.businesses:
+            avg_satisfaction = sum(b.satisfaction for b in self.businesses) / len(self.businesses)
+            avg_synergy = sum(b.synergy_bonus for b in self.businesses) / len(self.businesses)
+            self._update_reputation(avg_satisfaction, avg_synergy)
+    
+    def _update_columnar(self, dt: float, current_hour: float, visitor_rate: float) -> None:
+        """Update all businesses at once through the columnar store"""
+        store = self.business_store
+        store.apply_combo_effects()
+        store.update(dt, current_hour, visitor_rate)
+        self.total_visitors = int(store.total('customers'))
+        
+        # Pull columns out once so the floor loop avoids per-attribute property lookups
+        customers = store.customers.tolist()
+        sizes = store.size.tolist()
+        for business in self.businesses:
+            sid = business._sid
+            size = sizes[sid]
+            for f in range(business.floor, business.floor + size):
+                self.floors[f].traffic = customers[sid] // size
+        
+        if self.businesses:
+            self._update_reputation(store.mean('satisfaction'), store.mean('synergy_bonus'))
+    
+    def integrate(self, seconds: float, current_hour: float) -> None:
+        """Advance all businesses over skipped game time in closed form"""
+        ticks = seconds / self.TICK_SECONDS
+        self._expire_modifiers()
+        self._refresh_synergies()
+        
+        # Events due in the skipped ticks fire now and count down over the slice below
+        self._skipped_event_ticks += ticks
+        whole = int(self._skipped_event_ticks)
+        self._skipped_event_ticks -= whole
+        self._fire_random_events(whole)
+        
+        visitor_rate = self.effective_spawn_multiplier
+        if self.business_store is not None:
+            self.business_store.integrate(ticks, current_hour, seconds, visitor_rate)
+            self.total_visitors = int(self.business_store.total('customers'))
+        else:
+            for business in self.businesses:
+                business.integrate(ticks, current_hour, seconds, visitor_rate)
+            self.total_visitors = sum(len(b.customers) for b in self.businesses)
+        
+        if not self.businesses:
+            return
+        if self.business_store is not None:
+            avg_satisfaction = self.business_store.mean('satisfaction')
+            avg_synergy = self.business_store.mean('synergy_bonus')
+        else:
+            avg_satisfaction = sum(b.satisfaction for b in self.businesses) / len(self.businesses)
+            avg_synergy = sum(b.synergy_bonus for b in self.businesses) / len(self.businesses)
+        
+        # n steps of r = 0.9r + c converge geometrically toward c / 0.1
+        avg_satisfaction = self.satisfaction_modifiers.apply(avg_satisfaction)
+        target = (avg_satisfaction * 0.07 + avg_synergy * 100 * 0.03) / 0.1
+        self.reputation = target + (self.reputation - target) * 0.9 ** ticks
+    
+    def _update_reputation(self, avg_satisfaction: float, avg_synergy: float) -> None:
+        """Blend business satisfaction and synergy into the tower reputation"""
+        avg_satisfaction = self.satisfaction_modifiers.apply(avg_satisfaction)
+        self.reputation = (self.reputation * 0.9 + 
+                         avg_satisfaction * 0.07 +
+                         avg_synergy * 100 * 0.03)
+    
+    @property
+    def effective_spawn_multiplier(self) -> float:
+        """Customer spawn rate with event modifiers applied"""
+        return self.visitor_modifiers.apply(self.spawn_multiplier)
+    
+    def add_satisfaction_modifier(self, source, amount: float, expires: Optional[int] = None) -> None:
+        """Shift average satisfaction by some points while a source is active"""
+        self.satisfaction_modifiers.set(source, additive=amount, expires=expires)
+    
+    def remove_satisfaction_modifier(self, source) -> bool:
+        return self.satisfaction_modifiers.remove(source)
+    
+    def add_visitor_modifier(self, source, multiplier: float, expires: Optional[int] = None) -> None:
+        """Scale the customer spawn rate while a source is active"""
+        self.visitor_modifiers.set(source, multiplier, expires=expires)
+    
+    def remove_visitor_modifier(self, source) -> bool:
+        return self.visitor_modifiers.remove(source)
+    
+    def set_customer_multiplier(self, multiplier: float, source='customer_multiplier') -> None:
+        """Set a plain visitor rate multiplier; 1.0 clears it"""
+        if multiplier == 1.0:
+            self.visitor_modifiers.remove(source)
+        else:
+            self.visitor_modifiers.set(source, multiplier)
+    
+    def _expire_modifiers(self) -> None:
+        if self.time_system is not None:
+            now = self.time_system.ticks
+            self.satisfaction_modifiers.expire(now)
+            self.visitor_modifiers.expire(now)
+    
+    def _refresh_synergies(self) -> None:
+        """Recompute synergy for businesses on dirty floors"""
+        if self.synergy_cache.is_clean:
+            return
+        dirty = self.synergy_cache.take_dirty()
+        if len(dirty) >= len(self.floors) and len(self.businesses) >= self.BULK_SYNERGY_MIN:
+            try:
+                self.rebuild_synergies()
+                return
+            except ImportError:
+                pass  # No NumPy; fall back to the per-business path
+        for business in self.businesses:
+            if business.floor in dirty:
+                nearby = self._get_nearby_businesses(business.floor, SynergyCache.RADIUS)
+                business.update_synergy(nearby)
+    
+    def rebuild_synergies(self) -> None:
+        """Recompute every business's synergy at once, e.g. after loading a save"""
+        businesses = self.businesses
+        synergy, competition, special, combos = bulk_synergy(
+            [(b.floor, TYPE_INDEX[b.type], b.size) for b in businesses], len(self.floors))
+        names = [name for _, _, name in BusinessInteraction.COMBO_MASKS]
+        totals = (synergy + competition + special).tolist()
+        for business, total, hits in zip(businesses, totals, combos.tolist()):
+            business.set_synergy(total, {name for name, hit in zip(names, hits) if hit})
+    
+    def placement_scores(self, business_type: BusinessType) -> PlacementScores:
+        """Expected synergy, competition and combo effects of placing a type on each free span.
+        
+        Scores come from the interaction tables rather than trial placements,
+        and are cached until the layout changes, so an overlay can ask every frame.
+        """
+        key = (self.synergy_cache.layout_version, len(self.floors))
+        cached = self._placement_cache.get(business_type)
+        if cached and cached[0] == key:
+            return cached[1]
+        spec = BUSINESS_SPECS.get(business_type, DEFAULT_SPEC)
+        scores = placement_scores([(b.floor, TYPE_INDEX[b.type], b.size) for b in self.businesses],
+                                  len(self.floors), TYPE_INDEX[business_type], spec.size,
+                                  self.occupancy.free_spans(spec.size))
+        self._placement_cache[business_type] = (key, scores)
+        return scores
+    
+    def _get_nearby_businesses(self, floor: int, radius: int) -> List[Business]:
+        """Get list of businesses within specified floor radius"""
+        nearby = []
+        for f in range(max(0, floor - radius), min(len(self.floors), floor + radius + 1)):
+            if f != floor and self.floors[f].business:
+                nearby.append(self.floors[f].business)
+        return nearby
+    
+    def _fire_random_events(self, ticks: int = 1) -> None:
+        """Trigger the random business events due in the next `ticks` ticks"""
+        for business, event in self.event_sampler.advance_by(ticks):
+            business.trigger_event(event)
+            if self.on_business_event:
+                self.on_business_event(business, event)
+    
+    def get_daily_totals(self) -> tuple:
+        """Current daily income and maintenance across all businesses"""
+        if self.business_store is not None:
+            return (self.business_store.total('actual_income'),
+                    self.business_store.total('maintenance_cost'))
+        income = sum(getattr(b, 'actual_income', 0) for b in self.businesses)
+        maintenance = sum(b.maintenance_cost for b in self.businesses)
+        return income, maintenance
+    
+    def get_floor_stats(self, floor_number: int) -> Dict:
+        """Get statistics for a specific floor"""
+        if not 0 <= floor_number < len(self.floors):
+            return {}
+            
+        floor = self.floors[floor_number]
+        stats = {
+            'number': floor.number,
+            'occupied': floor.is_occupied,
+            'maintenance': floor.maintenance_level,
+            'traffic': floor.traffic,
+        }
+        
+        if floor.business:
+            stats.update({
+                'business_type': floor.business.type.value,
+                'business_name': floor.business.name,
+                'income': floor.business.actual_income,
+                'satisfaction': floor.business.satisfaction,
+                'customers': len(floor.business.customers),
+                'synergy_bonus': floor.business.synergy_bonus,
+                'events': floor.business.events,
+                'peak_hours': floor.business.peak_hours
+            })
+        
+        return stats
+    
+    def get_tower_stats(self) -> Dict:
+        """Get overall tower statistics"""
+        return {
+            'total_floors': self.MAX_FLOORS,
+            'occupied_floors': self.occupancy.occupied_floor_count(),
+            'total_businesses': len(self.businesses),
+            'total_visitors': self.total_visitors,
+            'reputation': self.reputation,
+            'total_income': sum(b.income for b in self.businesses),
+            'total_maintenance': sum(b.maintenance_cost for b in self.businesses)
+        }
+    
+    def get_building_cost(self, business_type):
+        """Get the cost of building a specific business type"""
+        business_config = self.config.BUSINESS_TYPES.get(business_type)
+        return business_config['cost'] if business_config else 0
+
+    def get_all_businesses(self):
+        """Return a list of all business types available."""
+        return [
+            "Restaurant",
+            "Retail Store",
+            "Office",
+            "Hotel",
+            "Gym",
+            "Cinema",
+            "Arcade",
+            "Spa",
+            "Conference Room",
+            "Rooftop Bar"
+        ]
+
+    def include_all_businesses(self):
+        """Ensure all business types are included in the tower."""
+        for business_type in self.get_all_businesses():
+            if business_type not in [b.type for b in self.businesses]:
+                self.add_business(Business(type=business_type))
@@ -1,6 +1,7 @@
 import pygame
 from entities.customer import Customer
-from typing import Dict, List
+from typing import Dict, List, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 
 class BusinessType(Enum):
@@ -33,6 +34,19 @@ class BusinessEvent:
     HEALTH_INSPECTION = "health_inspection"
     RENOVATION = "renovation"
 
+# Position of each type in the dense interaction tables and combo bitmasks
+TYPE_INDEX: Dict[BusinessType, int] = {t: i for i, t in enumerate(BusinessType)}
+
+def _dense(table: Dict[BusinessType, Dict[BusinessType, float]]) -> Tuple[Tuple[float, ...], ...]:
+    """Compile a sparse {type: {nearby type: effect}} table into a square row-per-type matrix"""
+    return tuple(tuple(table.get(t, {}).get(nearby, 0.0) for nearby in BusinessType)
+                 for t in BusinessType)
+
+def _combo_masks(combos: Dict[frozenset, Dict]) -> Tuple[Tuple[int, float, str], ...]:
+    """Each special combination as (bitmask over type indices, bonus, name)"""
+    return tuple((sum(1 << TYPE_INDEX[t] for t in types), info['bonus'], info['name'])
+                 for types, info in combos.items())
+
 class BusinessInteraction:
     """Defines interactions between businesses"""
     
@@ -132,6 +146,25 @@ class BusinessInteraction:
         }
     }
     
+    # The tables above compiled for lookup by type index
+    SYNERGY_MATRIX = _dense(SYNERGIES)
+    COMPETITION_MATRIX = _dense(COMPETITION)
+    COMBO_MASKS = _combo_masks(SPECIAL_COMBOS)
+    
+    @staticmethod
+    def type_mask(businesses: List['Business']) -> int:
+        """Bitmask of the types present among some businesses"""
+        mask = 0
+        for business in businesses:
+            mask |= 1 << TYPE_INDEX[business.type]
+        return mask
+    
+    @staticmethod
+    def combos_for(mask: int) -> List[Tuple[float, str]]:
+        """(bonus, name) of every special combination fully present in a type mask"""
+        return [(bonus, name) for combo, bonus, name in BusinessInteraction.COMBO_MASKS
+                if mask & combo == combo]
+    
     @staticmethod
     def calculate_interactions(business_type: BusinessType, nearby: List['Business'], floor_distance: int) -> tuple:
         """Calculate all interaction effects for a business"""
@@ -143,193 +176,173 @@ class BusinessInteraction:
         # Calculate distance modifier (closer businesses have stronger effects)
         distance_modifier = max(0, (5 - floor_distance) / 5)
         
-        # Calculate synergies and competition
+        # Calculate synergies and competition from this type's rows of the dense tables
+        index = TYPE_INDEX[business_type]
+        synergies = BusinessInteraction.SYNERGY_MATRIX[index]
+        competitions = BusinessInteraction.COMPETITION_MATRIX[index]
+        mask = 1 << index
         for nearby_business in nearby:
-            # Synergy effects
-            synergy = BusinessInteraction.SYNERGIES.get(business_type, {}).get(nearby_business.type, 0.0)
-            synergy_bonus += synergy * distance_modifier
-            
-            # Competition effects
-            competition = BusinessInteraction.COMPETITION.get(business_type, {}).get(nearby_business.type, 0.0)
-            competition_penalty += competition * distance_modifier
+            nearby_index = TYPE_INDEX[nearby_business.type]
+            synergy_bonus += synergies[nearby_index] * distance_modifier
+            competition_penalty += competitions[nearby_index] * distance_modifier
+            mask |= 1 << nearby_index
         
         # Check for special combinations
-        nearby_types = {b.type for b in nearby} | {business_type}
-        for combo_types, combo_info in BusinessInteraction.SPECIAL_COMBOS.items():
-            if nearby_types.issuperset(combo_types):
-                special_bonus = max(special_bonus, combo_info['bonus'])
-                active_combos.add(combo_info['name'])
+        for bonus, name in BusinessInteraction.combos_for(mask):
+            special_bonus = max(special_bonus, bonus)
+            active_combos.add(name)
         
         return synergy_bonus, competition_penalty, special_bonus, active_combos
     
     @staticmethod
     def get_synergy_bonus(business_type: BusinessType, nearby_type: BusinessType) -> float:
         """Get the synergy bonus between two business types"""
-        return BusinessSynergy.SYNERGIES.get(business_type, {}).get(nearby_type, 0.0)
+        return BusinessInteraction.SYNERGY_MATRIX[TYPE_INDEX[business_type]][TYPE_INDEX[nearby_type]]
+
+PEAK_MODIFIER = 1.5  # 50% bonus during peak hours
+SHOULDER_MODIFIER = 1.2  # 20% bonus in the hour either side of a peak
+OFF_PEAK_MODIFIER = 0.7  # 30% penalty during off-peak hours
+
+def hour_modifier_table(peak_hours) -> Tuple[float, ...]:
+    """Time-of-day modifier for each hour 0-23.
+    
+    A range whose end is at or before its start, like (17, 2), runs past
+    midnight. Ranges have whole-hour bounds, so the table is exact for any
+    fractional hour within its slot.
+    """
+    table = []
+    for hour in range(24):
+        modifier = OFF_PEAK_MODIFIER
+        for start, end in peak_hours:
+            if end <= start:
+                end += 24
+            # The same hour on the day before and after catches windows that wrap midnight
+            for h in (hour - 24, hour, hour + 24):
+                if start <= h < end:
+                    modifier = max(modifier, PEAK_MODIFIER)
+                elif start - 1 <= h < end + 1:
+                    modifier = max(modifier, SHOULDER_MODIFIER)
+        table.append(modifier)
+    return tuple(table)
+
+@dataclass(frozen=True)
+class BusinessSpec:
+    """Constants shared by every business of one type"""
+    category: BusinessCategory
+    size: int
+    base_income: float
+    maintenance: float
+    staff: int
+    peak_hours: Tuple[Tuple[int, int], ...]
+    customer_types: Tuple[str, ...]
+    hour_modifiers: Tuple[float, ...] = field(init=False, repr=False)  # Indexed by hour of day
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'hour_modifiers', hour_modifier_table(self.peak_hours))
+
+# One spec per type, built once and shared by every instance of that type
+BUSINESS_SPECS: Dict[BusinessType, BusinessSpec] = {
+    BusinessType.RESTAURANT: BusinessSpec(
+        BusinessCategory.HOSPITALITY, size=1, base_income=1000, maintenance=200, staff=8,
+        peak_hours=((7, 10), (12, 14), (18, 22)),  # Breakfast, Lunch, Dinner
+        customer_types=('workers', 'tourists', 'residents')),
+    BusinessType.HOTEL: BusinessSpec(
+        BusinessCategory.HOSPITALITY, size=4, base_income=5000, maintenance=1000, staff=20,
+        peak_hours=((14, 20),),  # Check-in times
+        customer_types=('tourists', 'business')),
+    BusinessType.OFFICE: BusinessSpec(
+        BusinessCategory.OFFICE, size=2, base_income=3000, maintenance=500, staff=4,
+        peak_hours=((9, 17),),  # Work hours
+        customer_types=('workers', 'business')),
+    BusinessType.RETAIL: BusinessSpec(
+        BusinessCategory.RETAIL, size=1, base_income=800, maintenance=150, staff=4,
+        peak_hours=((11, 19),),  # Shopping hours
+        customer_types=('tourists', 'residents', 'workers')),
+    BusinessType.GYM: BusinessSpec(
+        BusinessCategory.SERVICE, size=1, base_income=600, maintenance=300, staff=6,
+        peak_hours=((6, 9), (17, 21)),  # Before/after work
+        customer_types=('residents', 'workers')),
+    BusinessType.CINEMA: BusinessSpec(
+        BusinessCategory.ENTERTAINMENT, size=2, base_income=2000, maintenance=400, staff=10,
+        peak_hours=((14, 23),),  # Afternoon/Evening
+        customer_types=('tourists', 'residents', 'youth')),
+    BusinessType.ARCADE: BusinessSpec(
+        BusinessCategory.ENTERTAINMENT, size=1, base_income=1500, maintenance=300, staff=4,
+        peak_hours=((12, 22),),  # Afternoon/Evening
+        customer_types=('youth', 'tourists')),
+    BusinessType.SPA: BusinessSpec(
+        BusinessCategory.SERVICE, size=1, base_income=1200, maintenance=250, staff=8,
+        peak_hours=((10, 20),),  # Day time
+        customer_types=('tourists', 'residents')),
+    BusinessType.CONFERENCE: BusinessSpec(
+        BusinessCategory.SERVICE, size=2, base_income=2000, maintenance=300, staff=4,
+        peak_hours=((9, 17),),  # Business hours
+        customer_types=('business',)),
+    BusinessType.OBSERVATION: BusinessSpec(
+        BusinessCategory.ENTERTAINMENT, size=1, base_income=3000, maintenance=200, staff=6,
+        peak_hours=((10, 20),),  # Day time
+        customer_types=('tourists',)),
+    BusinessType.BAR: BusinessSpec(
+        BusinessCategory.HOSPITALITY, size=1, base_income=1500, maintenance=300, staff=6,
+        peak_hours=((17, 2),),  # Evening/Night
+        customer_types=('workers', 'tourists', 'residents')),
+    BusinessType.PARKING: BusinessSpec(
+        BusinessCategory.SERVICE, size=3, base_income=500, maintenance=100, staff=2,
+        peak_hours=((0, 24),),  # All day
+        customer_types=('workers', 'visitors')),
+}
+DEFAULT_SPEC = BusinessSpec(BusinessCategory.SERVICE, size=1, base_income=1000, maintenance=200,
+                            staff=4, peak_hours=((9, 17),), customer_types=('general',))
+
+# Fill colors by category, overridable per theme with a 'business_<category>' entry
+CATEGORY_COLORS = {
+    BusinessCategory.ENTERTAINMENT: (0.85, 0.45, 0.55, 1),
+    BusinessCategory.SERVICE: (0.45, 0.7, 0.6, 1),
+    BusinessCategory.HOSPITALITY: (0.9, 0.65, 0.35, 1),
+    BusinessCategory.OFFICE: (0.5, 0.6, 0.8, 1),
+    BusinessCategory.RETAIL: (0.7, 0.55, 0.8, 1),
+}
 
 class Business:
     """Represents a business in the tower"""
+    __slots__ = ('type', 'spec', 'floor', 'name', 'popularity', 'income', 'actual_income',
+                 'maintenance_cost', 'staff', 'customers', 'size', 'is_open', 'satisfaction',
+                 'events', 'event_duration', 'nearby_businesses', 'synergy_bonus', 'active_combos')
+    
     def __init__(self, type: BusinessType, floor: int):
+        spec = BUSINESS_SPECS.get(type, DEFAULT_SPEC)
         self.type = type
+        self.spec = spec
         self.floor = floor
         self.name = ""
-        self.category = self._get_category()
         self.popularity = 50  # 0-100
-        self.income = 0
-        self.maintenance_cost = 0
-        self.staff = 0
+        self.income = spec.base_income
+        self.actual_income = 0  # Income after modifiers, set each update
+        self.maintenance_cost = spec.maintenance
+        self.staff = spec.staff
         self.customers = []
-        self.size = 1  # Size in floor units
+        self.size = spec.size  # Size in floor units
         self.is_open = True
         self.satisfaction = 100  # 0-100
         self.events = []
         self.event_duration = 0
         self.nearby_businesses = []  # List of businesses within 5 floors
         self.synergy_bonus = 0.0
-        self.peak_hours = self._get_peak_hours()
-        self.customer_types = self._get_customer_types()
-        
-        # Initialize business-specific attributes
-        self._initialize_attributes()
+        self.active_combos = set()
     
-    def _get_category(self) -> BusinessCategory:
-        """Determine business category based on type"""
-        category_map = {
-            BusinessType.RESTAURANT: BusinessCategory.HOSPITALITY,
-            BusinessType.HOTEL: BusinessCategory.HOSPITALITY,
-            BusinessType.OFFICE: BusinessCategory.OFFICE,
-            BusinessType.RETAIL: BusinessCategory.RETAIL,
-            BusinessType.GYM: BusinessCategory.SERVICE,
-            BusinessType.CINEMA: BusinessCategory.ENTERTAINMENT,
-            BusinessType.ARCADE: BusinessCategory.ENTERTAINMENT,
-            BusinessType.SPA: BusinessCategory.SERVICE,
-            BusinessType.CONFERENCE: BusinessCategory.SERVICE,
-            BusinessType.OBSERVATION: BusinessCategory.ENTERTAINMENT,
-            BusinessType.BAR: BusinessCategory.HOSPITALITY,
-            BusinessType.PARKING: BusinessCategory.SERVICE
-        }
-        return category_map.get(self.type, BusinessCategory.SERVICE)
+    @property
+    def category(self) -> BusinessCategory:
+        return self.spec.category
     
-    def _initialize_attributes(self):
-        """Initialize business-specific attributes"""
-        # Base values for different business types
-        type_configs = {
-            BusinessType.RESTAURANT: {
-                'size': 1,
-                'base_income': 1000,
-                'maintenance': 200,
-                'staff': 8
-            },
-            BusinessType.HOTEL: {
-                'size': 4,
-                'base_income': 5000,
-                'maintenance': 1000,
-                'staff': 20
-            },
-            BusinessType.OFFICE: {
-                'size': 2,
-                'base_income': 3000,
-                'maintenance': 500,
-                'staff': 4
-            },
-            BusinessType.RETAIL: {
-                'size': 1,
-                'base_income': 800,
-                'maintenance': 150,
-                'staff': 4
-            },
-            BusinessType.GYM: {
-                'size': 1,
-                'base_income': 600,
-                'maintenance': 300,
-                'staff': 6
-            },
-            BusinessType.CINEMA: {
-                'size': 2,
-                'base_income': 2000,
-                'maintenance': 400,
-                'staff': 10
-            },
-            BusinessType.ARCADE: {
-                'size': 1,
-                'base_income': 1500,
-                'maintenance': 300,
-                'staff': 4
-            },
-            BusinessType.SPA: {
-                'size': 1,
-                'base_income': 1200,
-                'maintenance': 250,
-                'staff': 8
-            },
-            BusinessType.CONFERENCE: {
-                'size': 2,
-                'base_income': 2000,
-                'maintenance': 300,
-                'staff': 4
-            },
-            BusinessType.OBSERVATION: {
-                'size': 1,
-                'base_income': 3000,
-                'maintenance': 200,
-                'staff': 6
-            },
-            BusinessType.BAR: {
-                'size': 1,
-                'base_income': 1500,
-                'maintenance': 300,
-                'staff': 6
-            },
-            BusinessType.PARKING: {
-                'size': 3,
-                'base_income': 500,
-                'maintenance': 100,
-                'staff': 2
-            }
-        }
-        
-        # Set attributes based on business type
-        config = type_configs.get(self.type, {})
-        self.size = config.get('size', 1)
-        self.income = config.get('base_income', 1000)
-        self.maintenance_cost = config.get('maintenance', 200)
-        self.staff = config.get('staff', 4)
+    @property
+    def peak_hours(self) -> Tuple[Tuple[int, int], ...]:
+        """Peak business hours"""
+        return self.spec.peak_hours
     
-    def _get_peak_hours(self) -> List[tuple]:
-        """Get peak business hours"""
-        peak_hours = {
-            BusinessType.RESTAURANT: [(7,10), (12,14), (18,22)],  # Breakfast, Lunch, Dinner
-            BusinessType.HOTEL: [(14,20)],  # Check-in times
-            BusinessType.OFFICE: [(9,17)],  # Work hours
-            BusinessType.RETAIL: [(11,19)],  # Shopping hours
-            BusinessType.GYM: [(6,9), (17,21)],  # Before/after work
-            BusinessType.CINEMA: [(14,23)],  # Afternoon/Evening
-            BusinessType.ARCADE: [(12,22)],  # Afternoon/Evening
-            BusinessType.SPA: [(10,20)],  # Day time
-            BusinessType.CONFERENCE: [(9,17)],  # Business hours
-            BusinessType.OBSERVATION: [(10,20)],  # Day time
-            BusinessType.BAR: [(17,2)],  # Evening/Night
-            BusinessType.PARKING: [(0,24)]  # All day
-        }
-        return peak_hours.get(self.type, [(9,17)])
-        
-    def _get_customer_types(self) -> List[str]:
-        """Define target customer types"""
-        customer_types = {
-            BusinessType.RESTAURANT: ['workers', 'tourists', 'residents'],
-            BusinessType.HOTEL: ['tourists', 'business'],
-            BusinessType.OFFICE: ['workers', 'business'],
-            BusinessType.RETAIL: ['tourists', 'residents', 'workers'],
-            BusinessType.GYM: ['residents', 'workers'],
-            BusinessType.CINEMA: ['tourists', 'residents', 'youth'],
-            BusinessType.ARCADE: ['youth', 'tourists'],
-            BusinessType.SPA: ['tourists', 'residents'],
-            BusinessType.CONFERENCE: ['business'],
-            BusinessType.OBSERVATION: ['tourists'],
-            BusinessType.BAR: ['workers', 'tourists', 'residents'],
-            BusinessType.PARKING: ['workers', 'visitors']
-        }
-        return customer_types.get(self.type, ['general'])
+    @property
+    def customer_types(self) -> Tuple[str, ...]:
+        """Target customer types"""
+        return self.spec.customer_types
         
     def trigger_event(self, event: str) -> None:
         """Trigger a business event"""
@@ -366,7 +379,7 @@ class Business:
         total_synergy = 0.0
         total_competition = 0.0
         total_special = 0.0
-        self.active_combos = set()
+        active_combos = set()
         
         # Group nearby businesses by distance
         distance_groups = {}
@@ -382,18 +395,24 @@ class Business:
             total_synergy += synergy
             total_competition += competition
             total_special = max(total_special, special)  # Take highest special bonus
-            self.active_combos.update(combos)
+            active_combos.update(combos)
         
+        self.set_synergy(total_synergy + total_competition + total_special, active_combos)
+    
+    def set_synergy(self, bonus: float, active_combos: set) -> None:
+        """Store a computed synergy bonus and the special combinations behind it"""
+        self.active_combos = active_combos
         # Calculate final bonus (cap at 75% total bonus)
-        self.synergy_bonus = min(0.75, max(0, total_synergy + total_competition + total_special))
+        self.synergy_bonus = min(0.75, max(0, bonus))
         
-        # Update business attributes based on interactions
+    def apply_combo_effects(self) -> None:
+        """Apply the per-tick boost from active special combinations"""
         if self.active_combos:
             self.satisfaction = min(100, self.satisfaction + 0.2)  # Small satisfaction boost
             self.popularity = min(100, self.popularity + 0.1)  # Small popularity boost
         
-    def update(self, dt: float, current_hour: float) -> None:
-        """Update business state"""
+    def update(self, dt: float, current_hour: float, visitor_rate: float = 1.0) -> None:
+        """Update business state; visitor_rate scales how many customers it draws"""
         if not self.is_open:
             return
             
@@ -415,15 +434,15 @@ class Business:
         self.actual_income = self.income * total_modifier
         
         # Update customer count
-        max_customers = self.size * 20 * time_modifier
+        max_customers = self.size * 20 * time_modifier * visitor_rate
         target_customers = int(max_customers * (self.popularity / 100))
         current_customers = len(self.customers)
         
         # Gradually adjust customer count
         if current_customers < target_customers:
-            self.customers.extend([None] * min(5, target_customers - current_customers))
+            self._adjust_customers(min(5, target_customers - current_customers))
         elif current_customers > target_customers:
-            self.customers = self.customers[:-min(5, current_customers - target_customers)]
+            self._adjust_customers(-min(5, current_customers - target_customers))
         
         # Update satisfaction based on maintenance and overcrowding
         crowd_factor = len(self.customers) / (self.size * 20)
@@ -435,14 +454,52 @@ class Business:
         else:
             self.satisfaction = max(0, self.satisfaction - 0.2)
             
+    def integrate(self, ticks: float, current_hour: float, seconds: float,
+                  visitor_rate: float = 1.0) -> None:
+        """Advance `ticks` update steps at a fixed hour in closed form"""
+        if not self.is_open:
+            return
+        
+        if self.event_duration > 0:
+            self.event_duration -= seconds
+            if self.event_duration <= 0:
+                self.events.clear()
+        
+        if self.active_combos:
+            self.satisfaction = min(100, self.satisfaction + 0.2 * ticks)
+            self.popularity = min(100, self.popularity + 0.1 * ticks)
+        
+        time_modifier = self._calculate_time_modifier(current_hour)
+        
+        # Customers move toward the target by at most 5 per tick
+        capacity = self.size * 20
+        target = int(capacity * time_modifier * visitor_rate * (self.popularity / 100))
+        current = len(self.customers)
+        step = min(int(5 * ticks), abs(target - current))
+        if current < target:
+            self._adjust_customers(step)
+        elif current > target:
+            self._adjust_customers(-step)
+        
+        # Satisfaction drifts linearly until it hits a bound
+        drift = 0.1 if self.maintenance_cost > 0 else -0.2
+        if len(self.customers) > capacity:
+            drift -= 0.5
+        self.satisfaction = max(0, min(100, self.satisfaction + drift * ticks))
+        
+        base_modifier = (self.popularity + self.satisfaction) / 200
+        self.actual_income = self.income * base_modifier * (1 + self.synergy_bonus) * time_modifier
+    
+    def _adjust_customers(self, change: int) -> None:
+        """Add or drop anonymous customers, newest first when dropping"""
+        if change > 0:
+            self.customers.extend([None] * change)
+        elif change < 0:
+            del self.customers[change:]
+    
     def _calculate_time_modifier(self, current_hour: float) -> float:
         """Calculate business modifier based on time of day"""
-        for start, end in self.peak_hours:
-            if start <= current_hour < end:
-                return 1.5  # 50% bonus during peak hours
-            elif (start-1) <= current_hour < (end+1):
-                return 1.2  # 20% bonus during shoulder hours
-        return 0.7  # 30% penalty during off-peak hours
+        return self.spec.hour_modifiers[int(current_hour) % 24]
     
     def create_placeholder_image(self):
         width = self.size[0] * self.config.TILE_SIZE
@@ -477,6 +534,16 @@ class Business:
         """Calculate current profit"""
         return self.revenue - self.expenses
     
+    def draw_into(self, group, pos: tuple, size: tuple, theme_colors: Dict) -> None:
+        """Add Kivy instructions for this business's slice of a floor to an instruction group"""
+        from kivy.graphics import Color, Rectangle  # Only the view draws; the core stays headless
+        color = theme_colors.get(f'business_{self.category.value}', CATEGORY_COLORS[self.category])
+        group.add(Color(*color))
+        x, y = pos
+        width, height = size
+        inset = 0.05  # Leave a gap so floors and neighbours stay distinguishable
+        group.add(Rectangle(pos=(x + inset, y + inset), size=(width - 2 * inset, height - 2 * inset)))
+    
     def draw(self, screen, grid_position):
         """Draw the business on the screen"""
         x = grid_position[0] * self.config.TILE_SIZE
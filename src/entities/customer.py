@@ -1,19 +1,20 @@
 import random
 
 class Customer:
-    def __init__(self, config):
+    def __init__(self, config, rng: random.Random):
         self.config = config
+        self.rng = rng
         self.satisfaction = 100
-        self.money = random.randint(50, 1000)
+        self.money = self.rng.randint(50, 1000)
         self.time_in_business = 0
-        self.max_time = random.randint(10, 60)  # Minutes to spend in business
+        self.max_time = self.rng.randint(10, 60)  # Minutes to spend in business
         
     def update(self):
         """Update customer state"""
         self.time_in_business += 1
         
         # Random satisfaction changes
-        self.satisfaction += random.randint(-1, 1)
+        self.satisfaction += self.rng.randint(-1, 1)
         self.satisfaction = max(0, min(100, self.satisfaction))
     
     def is_finished(self):
@@ -23,5 +24,5 @@ class Customer:
     def get_preferred_businesses(self):
         """Return a list of business types this customer is interested in"""
         # For now, return random selection of businesses
-        return random.sample(list(self.config.BUSINESS_TYPES.keys()), 
-                           random.randint(1, len(self.config.BUSINESS_TYPES)))
+        return self.rng.sample(list(self.config.BUSINESS_TYPES.keys()), 
+                               self.rng.randint(1, len(self.config.BUSINESS_TYPES)))
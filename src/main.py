@@ -9,7 +9,7 @@ from kivy.properties import ObjectProperty, NumericProperty
 
 from core.game import Game
 from core.config import Config
-from ui.game_ui import MenuScreen, GameScreen, NotificationItem
+from ui.game_ui import MenuScreen, GameScreen, NotificationItem, NotificationList, FloorStatsItem, FloorStatsList
 
 # Set window size for desktop development
 Window.size = (1280, 720)
@@ -37,8 +37,8 @@ class RARTowerApp(MDApp):
     
     def on_start(self):
         """Initialize game resources when app starts"""
-        # Start game loop
-        Clock.schedule_interval(self._update, 1.0/60.0)
+        # Start game loop; runs every rendered frame, the simulation ticks at its own fixed rate
+        Clock.schedule_interval(self._update, 0)
     
     def _update(self, dt):
         """Main game loop update"""
@@ -49,6 +49,8 @@ class RARTowerApp(MDApp):
         """Clean up resources when app stops"""
         # Stop game loop
         Clock.unschedule(self._update)
+        if self.game:
+            self.game.stop_simulation()
 
 if __name__ == '__main__':
     RARTowerApp().run()
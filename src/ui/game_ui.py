@@ -1,33 +1,31 @@
 from kivy.uix.screenmanager import Screen
-from kivy.uix.behaviors import ButtonBehavior
-from kivy.properties import StringProperty, DictProperty, ListProperty, NumericProperty, BooleanProperty
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.properties import (StringProperty, DictProperty, ListProperty, NumericProperty, BooleanProperty,
+                             ObjectProperty)
 from kivy.clock import Clock
 from kivy.app import App
 from kivymd.uix.card import MDCard
-from kivymd.uix.list import MDList
+from kivymd.uix.boxlayout import MDBoxLayout
 from datetime import datetime
 from core.config import EventType, Config
 
-class NotificationItem(ButtonBehavior, MDCard):
+class NotificationItem(RecycleDataViewBehavior, MDCard):
+    """Notification card (MDCard is already clickable); a small pool is reused by NotificationList"""
     title = StringProperty("")
     message = StringProperty("")
     time_str = StringProperty("")
     notification_data = DictProperty({})
+    event_type = ObjectProperty(None, allownone=True)
+    priority = NumericProperty(1)
     icon = StringProperty("information")
     icon_color = ListProperty([1, 1, 1, 1])
     
-    def __init__(self, **kwargs):
-        super(NotificationItem, self).__init__(**kwargs)
-        self.notification_data = kwargs.get('data', {})
-        self.message = kwargs.get('message', "")
-        self.title = kwargs.get('title', "")
-        notification_time = kwargs.get('time', datetime.now())
-        self.time_str = notification_time.strftime("%H:%M")
-        
+    def refresh_view_attrs(self, rv, index, data):
+        """Rebind this card to another notification's data"""
+        super(NotificationItem, self).refresh_view_attrs(rv, index, data)
         # Set colors based on event type and priority
-        event_type = kwargs.get('event_type', None)
-        priority = kwargs.get('priority', 1)
-        self._set_appearance(event_type, priority)
+        self._set_appearance(self.event_type, self.priority)
         
     def _set_appearance(self, event_type: EventType, priority: int) -> None:
         """Set the notification's visual appearance based on event type and priority"""
@@ -46,8 +44,7 @@ class NotificationItem(ButtonBehavior, MDCard):
             self.icon_color = [0.9, 0.9, 0.9, 1]
             
         # Set icon based on event type
-        if event_type:
-            self.icon = self._get_event_icon(event_type)
+        self.icon = self._get_event_icon(event_type) if event_type else "information"
             
     def _get_event_icon(self, event_type: EventType) -> str:
         """Get the appropriate icon for the event type"""
@@ -63,6 +60,20 @@ class NotificationItem(ButtonBehavior, MDCard):
         }
         return icons.get(event_type, "information")
 
+class NotificationList(RecycleView):
+    """Virtualised notification list bound to a list of data dicts"""
+    pass  # Layout and view class are set in the KV file
+
+class FloorStatsItem(RecycleDataViewBehavior, MDBoxLayout):
+    """One row of the floor stats list"""
+    floor_text = StringProperty("")
+    business_text = StringProperty("")
+    detail_text = StringProperty("")
+
+class FloorStatsList(RecycleView):
+    """Virtualised per-floor stats list; only the visible rows have widgets"""
+    pass  # Layout and view class are set in the KV file
+
 class GameScreen(Screen):
     # Properties
     money = NumericProperty(1000000)
@@ -72,36 +83,62 @@ class GameScreen(Screen):
     current_speed = StringProperty("normal")
     active_notifications = ListProperty([])
     
+    FLOOR_STATS_INTERVAL = 1.0  # Seconds between floor stats refreshes
+    
     def __init__(self, **kwargs):
         super(GameScreen, self).__init__(**kwargs)
-        self._notification_update_scheduled = False
-        Clock.schedule_interval(self.update, 1.0 / 60.0)
+        # Coalesce list changes into at most one refresh per frame
+        self._notifications_trigger = Clock.create_trigger(self._update_notifications)
+        app = App.get_running_app()
+        if app and getattr(app, 'game', None):
+            app.game.bind(active_notifications=self.setter('active_notifications'))
+        Clock.schedule_interval(self.update_floor_stats, self.FLOOR_STATS_INTERVAL)
         
-    def update(self, dt: float) -> None:
-        """Update the game screen"""
-        # Update notification list if needed
-        if self.active_notifications and not self._notification_update_scheduled:
-            self._notification_update_scheduled = True
-            Clock.schedule_once(self._update_notifications)
+    def on_active_notifications(self, instance, value) -> None:
+        self._notifications_trigger()
             
     def _update_notifications(self, dt: float) -> None:
-        """Update the notifications list"""
-        notifications_list = self.ids.notifications_list
-        notifications_list.clear_widgets()
+        """Rebind the notification lists to the latest notifications"""
+        # Most recent first; the RecycleViews reuse their existing cards
+        data = [self._notification_view_data(n) for n in reversed(self.active_notifications[-10:])]
+        for list_id in ('notifications_list', 'sidebar_notifications'):
+            if list_id in self.ids:
+                self.ids[list_id].data = data
         
-        # Add notifications, most recent first
-        for notification in reversed(self.active_notifications[-10:]):  # Show last 10
-            item = NotificationItem(
-                title=self._get_notification_title(notification),
-                message=notification.get('message', ''),
-                time=notification.get('time', datetime.now()),
-                event_type=notification.get('event_type'),
-                priority=notification.get('priority', 1),
-                data=notification
-            )
-            notifications_list.add_widget(item)
-            
-        self._notification_update_scheduled = False
+    def _notification_view_data(self, notification: dict) -> dict:
+        """Data dict for one NotificationItem"""
+        return {
+            'title': self._get_notification_title(notification),
+            'message': notification.get('message', ''),
+            'time_str': notification.get('time', datetime.now()).strftime("%H:%M"),
+            'event_type': notification.get('event_type'),
+            'priority': notification.get('priority', 1),
+            'notification_data': notification,
+        }
+        
+    def update_floor_stats(self, dt: float = 0) -> None:
+        """Refresh the floor stats list from Game.get_floor_stats, top floor first"""
+        app = App.get_running_app()
+        if 'floor_stats_list' not in self.ids or not getattr(app, 'game', None):
+            return
+        self.ids.floor_stats_list.data = [self._floor_view_data(stats)
+                                          for stats in reversed(app.game.get_floor_stats())]
+        
+    @staticmethod
+    def _floor_view_data(stats: dict) -> dict:
+        """Data dict for one FloorStatsItem"""
+        if 'business_name' in stats:
+            business = stats['business_name'] or str(stats['business_type']).replace('_', ' ').title()
+            detail = (f"{stats['customers']} customers  ${stats['income']:,.0f}/day  "
+                      f"{stats['satisfaction']:.0f}% satisfied")
+        else:
+            business = "Vacant"
+            detail = f"Traffic {stats['traffic']}"
+        return {
+            'floor_text': f"{stats['number'] + 1}F",
+            'business_text': business,
+            'detail_text': detail,
+        }
         
     def _get_notification_title(self, notification: dict) -> str:
         """Get a title for the notification based on its type"""
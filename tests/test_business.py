@@ -0,0 +1,38 @@
+from entities.business import Business, BusinessType, BusinessCategory, BUSINESS_SPECS
+
+def test_business_types_share_one_spec():
+    first, second = Business(BusinessType.HOTEL, 0), Business(BusinessType.HOTEL, 10)
+    assert first.spec is second.spec is BUSINESS_SPECS[BusinessType.HOTEL]
+    assert first.peak_hours is second.peak_hours
+    assert (first.size, first.income, first.maintenance_cost, first.staff) == (4, 5000, 1000, 20)
+    assert first.category is BusinessCategory.HOSPITALITY
+    assert set(BUSINESS_SPECS) == set(BusinessType)
+
+def test_business_has_no_instance_dict():
+    business = Business(BusinessType.BAR, 3)
+    assert not hasattr(business, '__dict__')
+    business.income *= 2  # Per-instance state stays independent of the spec
+    assert Business(BusinessType.BAR, 4).income == BUSINESS_SPECS[BusinessType.BAR].base_income
+
+def test_hour_tables_cover_wrapping_windows():
+    bar = BUSINESS_SPECS[BusinessType.BAR].hour_modifiers  # Peak 17:00-02:00
+    assert len(bar) == 24
+    assert [bar[h] for h in (16, 17, 23, 0, 1, 2, 3, 15)] == [1.2, 1.5, 1.5, 1.5, 1.5, 1.2, 0.7, 0.7]
+    assert set(BUSINESS_SPECS[BusinessType.PARKING].hour_modifiers) == {1.5}
+
+def test_hour_tables_match_range_checks():
+    def range_check(peak_hours, hour):
+        for start, end in peak_hours:
+            if start <= hour < end:
+                return 1.5
+            elif (start - 1) <= hour < (end + 1):
+                return 1.2
+        return 0.7
+    
+    for business_type, spec in BUSINESS_SPECS.items():
+        if any(end <= start for start, end in spec.peak_hours):
+            continue  # The range checks get wrap-around windows wrong
+        business = Business(business_type, 0)
+        for quarter in range(24 * 4):
+            hour = quarter / 4
+            assert business._calculate_time_modifier(hour) == range_check(spec.peak_hours, hour)
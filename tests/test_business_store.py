@@ -0,0 +1,56 @@
+import pytest
+np = pytest.importorskip("numpy")
+from entities.business import Business, BusinessType
+from core.business_store import BusinessStore, ColumnarBusiness
+
+TYPES = [BusinessType.RESTAURANT, BusinessType.HOTEL, BusinessType.BAR, BusinessType.OFFICE]
+
+def test_columnar_matches_scalar_update():
+    store = BusinessStore(capacity=2)
+    scalar = [Business(t, i) for i, t in enumerate(TYPES)]
+    columnar = [ColumnarBusiness(t, i, store) for i, t in enumerate(TYPES)]
+    for s, c in zip(scalar, columnar):
+        s.synergy_bonus = c.synergy_bonus = 0.2
+    
+    for step in range(200):
+        hour = (step / 4) % 24
+        for business in scalar:
+            business.update(0.1, hour)
+        store.update(0.1, hour)
+    
+    for s, c in zip(scalar, columnar):
+        assert c.size == s.size
+        assert len(c.customers) == len(s.customers)
+        assert c.satisfaction == pytest.approx(s.satisfaction)
+        assert c.actual_income == pytest.approx(s.actual_income)
+        
+def test_scalar_paths_write_the_customer_column():
+    store = BusinessStore(capacity=2)
+    scalar, columnar = Business(BusinessType.HOTEL, 0), ColumnarBusiness(BusinessType.HOTEL, 0, store)
+    for step in range(30):
+        for business in (scalar, columnar):
+            business.update(0.1, 19)
+    assert len(columnar.customers) == len(scalar.customers) > 0
+    
+    for business in (scalar, columnar):
+        business.integrate(4, 3, 240)
+    assert len(columnar.customers) == len(scalar.customers)
+    
+    count = len(columnar.customers)
+    assert columnar.remove_customer(None)
+    assert store.customers[columnar._sid] == count - 1
+    
+    empty = ColumnarBusiness(BusinessType.BAR, 1, store)
+    assert not empty.remove_customer(None)
+        
+def test_rows_are_reused():
+    store = BusinessStore(capacity=1)
+    first = ColumnarBusiness(BusinessType.GYM, 0, store)
+    ColumnarBusiness(BusinessType.SPA, 1, store)
+    assert store.capacity >= 2
+    
+    first.release()
+    third = ColumnarBusiness(BusinessType.BAR, 2, store)
+    assert third._sid == first._sid
+    assert third.popularity == 50
+    assert store.mean('popularity') == 50
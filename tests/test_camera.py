@@ -0,0 +1,26 @@
+import pytest
+from core.camera import Camera
+
+def test_visible_floors():
+    camera = Camera(max_floors=300)
+    
+    assert camera.visible_floors(320, 32) == (0, 10)
+    camera.scroll(100)
+    assert camera.visible_floors(320, 32) == (100, 110)
+    camera.scroll(1000)
+    assert camera.visible_floors(320, 32) == (299, 299)
+    
+def test_lod_block():
+    camera = Camera()
+    assert camera.lod_block(32) == 1
+    
+    camera.set_zoom(0.1)  # 3.2 px per floor
+    assert camera.lod_block(32) == 2
+    camera.set_zoom(0.02)  # 0.64 px per floor
+    assert camera.lod_block(32) == 8
+    
+def test_screen_to_floor():
+    camera = Camera()
+    camera.scroll(10)
+    camera.set_zoom(0.5)
+    assert camera.screen_to_floor(40, 32) == 12
@@ -0,0 +1,25 @@
+import threading
+import pytest
+
+pytest.importorskip('kivy')
+
+from core.game import Game
+
+@pytest.fixture
+def threaded_game():
+    game = Game(map_name=None, threaded=True)
+    yield game
+    game.stop_simulation()
+
+def test_event_effects_run_on_the_simulation_thread(threaded_game, monkeypatch):
+    threads = []
+    monkeypatch.setattr(threaded_game, '_update_event_effects',
+                        lambda: threads.append(threading.current_thread().name))
+    threaded_game.update(0.1)
+    threaded_game._event_effects.result(timeout=5)
+    assert threads == ['simulation']
+
+def test_floor_stats_come_from_the_snapshot(threaded_game):
+    threaded_game.stop_simulation()  # Hold the snapshot still
+    snapshot = threaded_game.sim_thread.latest()
+    assert threaded_game.get_floor_stats() == list(snapshot.floors)
@@ -0,0 +1,50 @@
+import pytest
+from entities.business import Business, BusinessInteraction, BusinessType, TYPE_INDEX
+
+TYPES = list(BusinessType)
+
+def reference_interactions(business_type, nearby, floor_distance):
+    """The original nested-dict and issuperset implementation"""
+    distance_modifier = max(0, (5 - floor_distance) / 5)
+    synergy = competition = special = 0.0
+    combos = set()
+    for business in nearby:
+        synergy += BusinessInteraction.SYNERGIES.get(business_type, {}).get(business.type, 0.0) * distance_modifier
+        competition += BusinessInteraction.COMPETITION.get(business_type, {}).get(business.type, 0.0) * distance_modifier
+    nearby_types = {b.type for b in nearby} | {business_type}
+    for combo_types, info in BusinessInteraction.SPECIAL_COMBOS.items():
+        if nearby_types.issuperset(combo_types):
+            special = max(special, info['bonus'])
+            combos.add(info['name'])
+    return synergy, competition, special, combos
+
+def test_dense_tables_match_dicts():
+    import random
+    rng = random.Random(5)
+    for _ in range(500):
+        business_type = rng.choice(TYPES)
+        nearby = [Business(rng.choice(TYPES), 0) for _ in range(rng.randrange(6))]
+        distance = rng.randrange(6)
+        got = BusinessInteraction.calculate_interactions(business_type, nearby, distance)
+        expected = reference_interactions(business_type, nearby, distance)
+        assert got[:3] == pytest.approx(expected[:3])
+        assert got[3] == expected[3]
+    assert BusinessInteraction.get_synergy_bonus(BusinessType.OFFICE, BusinessType.RESTAURANT) == 0.3
+
+def test_window_product_matches_per_business():
+    np = pytest.importorskip("numpy")
+    from core.interactions import window_effects, special_bonus
+    
+    nearby = [Business(t, 0) for t in (BusinessType.HOTEL, BusinessType.SPA, BusinessType.BAR, BusinessType.BAR)]
+    distance_modifier = 0.6
+    counts = np.zeros(len(TYPES))
+    for business in nearby:
+        counts[TYPE_INDEX[business.type]] += distance_modifier
+    synergy, competition = window_effects(counts)
+    
+    for business_type in TYPES:
+        expected = BusinessInteraction.calculate_interactions(business_type, nearby, 2)
+        assert synergy[TYPE_INDEX[business_type]] == pytest.approx(expected[0])
+        assert competition[TYPE_INDEX[business_type]] == pytest.approx(expected[1])
+        mask = BusinessInteraction.type_mask(nearby) | 1 << TYPE_INDEX[business_type]
+        assert special_bonus(mask) == pytest.approx(expected[2])
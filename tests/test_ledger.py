@@ -0,0 +1,54 @@
+import pytest
+from core.economy import Economy
+from core.ledger import TransactionLedger, DAY, HOUR, WEEK
+
+def test_rolling_totals_match_recomputed_sums():
+    ledger = TransactionLedger()
+    entries = [(t * 600, (t % 7) - 2.5, ('rent', 'food', 'repairs')[t % 3], f"floor{t % 4}")
+               for t in range(2 * WEEK // 600)]
+    for entry in entries:
+        ledger.record(*entry)
+
+    for period, length in (('hour', HOUR), ('day', DAY), ('week', WEEK)):
+        for time in (ledger.latest - 2 * DAY - 5 * HOUR, ledger.latest):
+            bucket = time // length
+            expected = sum(amount for t, amount, category, _ in entries
+                           if t // length == bucket and category != 'repairs')
+            assert ledger.total(period, ('rent', 'food'), time) == pytest.approx(expected)
+    assert ledger.total('day', ('rent',), 0) == pytest.approx(
+        sum(amount for t, amount, category, _ in entries if t < DAY and category == 'rent'))
+    # Past the ring, nothing is reported
+    assert ledger.total('hour', time=0) == 0.0
+    assert ledger.series('day', count=3) == [ledger.total('day', time=t)
+                                              for t in (ledger.latest - 2 * DAY, ledger.latest - DAY, ledger.latest)]
+
+def test_rows_merge_per_hour_and_expire():
+    ledger = TransactionLedger()
+    for second in range(0, 2 * HOUR, 10):
+        ledger.record(second, 1.0, 'businesses', 'accrual')
+        ledger.record(second, 0.5, 'maintenance', 'accrual')
+    assert len(ledger) == 4
+    assert sum(amount for _, amount, _, _ in ledger.rows()) == pytest.approx(2 * HOUR // 10 * 1.5)
+
+    # A long game keeps about a year of rows
+    for hour in range(3 * 366 * 24):
+        ledger.record(hour * HOUR, 1.0, 'businesses', 'accrual')
+    assert len(ledger) <= TransactionLedger.RETENTION // HOUR + 2 * TransactionLedger.CHUNK
+
+def test_economy_books_daily_figures():
+    economy = Economy()
+    economy.accrue(2400, 240, 3 * HOUR, time=DAY)
+    economy.add_revenue('mini_games', 50)
+    economy.add_revenue('unknown', 999)
+    assert economy.calculate_daily_revenue() == pytest.approx(350)
+    assert economy.calculate_daily_expenses() == pytest.approx(30)
+    assert economy.revenue_streams['mini_games'] == 50
+    report = economy.get_financial_report()
+    assert report['weekly_revenue'] == pytest.approx(350)
+    assert report['hourly_revenue'] == pytest.approx(350)
+
+    economy.update_balance()
+    economy.reset_daily_values()
+    assert economy.balance == pytest.approx(1000 + 350 - 30)
+    assert economy.calculate_daily_revenue() == 0
+    assert economy.transactions()[0].timestamp is not None
@@ -0,0 +1,77 @@
+import pytest
+from core.config import EventType
+from core.economy import Economy
+from core.modifiers import ModifierStack
+from core.tower_core import TowerCore
+from entities.business import BusinessType
+
+def test_stack_undoes_effects_exactly():
+    stack = ModifierStack()
+    stack.set('festival', 1.5)
+    stack.set('outage', 0.5, additive=-2)
+    stack.set('festival', 1.5)  # Re-applying replaces rather than compounds
+    assert stack.multiplier == pytest.approx(0.75)
+    assert stack.apply(10) == pytest.approx(5.5)
+
+    for _ in range(1000):
+        stack.set('sale', 0.9)
+        stack.remove('sale')
+    assert stack.remove('outage')
+    assert not stack.remove('outage')
+    assert stack.multiplier == 1.5 and stack.additive == 0.0
+
+def test_modifiers_expire():
+    stack = ModifierStack()
+    stack.set('drill', 0.5, expires=100)
+    stack.set('upgrade', 2.0)
+    assert not stack.expire(99)
+    assert stack.expire(100)
+    assert 'drill' not in stack and stack.multiplier == 2.0
+
+def test_economy_and_tower_modifiers():
+    economy = Economy()
+    economy.add_modifier('power_outage', 0.5)
+    economy.set_price_multiplier(0.8)
+    economy.apply_upgrade({'expense_reduction': 0.25})
+    economy.accrue(1000, 100, 86400, time=0)
+    assert economy.calculate_daily_revenue() == pytest.approx(400)
+    assert economy.calculate_daily_expenses() == pytest.approx(75)
+
+    economy.remove_modifier('power_outage')
+    economy.set_price_multiplier(1.0)
+    assert economy.income_modifiers.multiplier == 1.0
+
+    tower = TowerCore(None)
+    tower.add_satisfaction_modifier('maintenance', -10)
+    tower.set_customer_multiplier(1.5)
+    tower.add_visitor_modifier('festival', 2.0)
+    assert tower.effective_spawn_multiplier == pytest.approx(3.0)
+    tower._update_reputation(60, 0)
+    assert tower.reputation == pytest.approx(50 * 0.9 + 50 * 0.07)
+    tower.set_customer_multiplier(1.0)
+    tower.remove_visitor_modifier('festival')
+    assert tower.effective_spawn_multiplier == 1.0
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_visitor_modifiers_change_visitor_counts(columnar):
+    if columnar:
+        pytest.importorskip('numpy')
+    towers = [TowerCore(None, columnar=columnar) for _ in range(3)]
+    for tower in towers:
+        for _ in range(3):
+            tower.add_floor()
+        tower.add_business(BusinessType.RESTAURANT, 0)
+        tower.event_sampler.clear()  # Random events would move popularity
+    plain, festival, sale = towers
+    festival.add_visitor_modifier(EventType.FESTIVAL, 2.0)
+    sale.set_customer_multiplier(1.5)
+    
+    for _ in range(20):
+        for tower in towers:
+            tower.update(0.1)
+    assert 0 < plain.total_visitors < sale.total_visitors < festival.total_visitors
+    
+    # Skipped time draws the same extra visitors
+    for tower in towers:
+        tower.integrate(3600, 12)
+    assert plain.total_visitors < sale.total_visitors < festival.total_visitors
@@ -0,0 +1,33 @@
+from core.notifications import NotificationPipeline
+
+def business_event(event, floor, priority=1):
+    return {'type': 'business_event', 'message': f"{event} on floor {floor}", 'priority': priority,
+            'data': {'event': event, 'floor': floor}}
+
+def test_duplicates_are_merged():
+    pipeline = NotificationPipeline()
+    for floor in (12, 40, 25):
+        pipeline.submit(business_event('equipment_failure', floor))
+    pipeline.submit(business_event('staff_shortage', 3))
+    
+    batch = pipeline.flush(0.016)
+    assert [n['message'] for n in batch] == ["3 equipment failures on floors 12-40"]
+    assert len(pipeline) == 1  # The shortage waits out the business event interval
+
+def test_rate_limit_and_batch_size():
+    pipeline = NotificationPipeline(max_per_flush=2, intervals={'sale': 10.0})
+    pipeline.submit({'type': 'sale', 'message': 'Sale', 'priority': 1})
+    assert len(pipeline.flush(0.016)) == 1
+    
+    pipeline.submit({'type': 'sale', 'message': 'Sale', 'priority': 1})
+    for kind in ('vip', 'festival', 'drill'):
+        pipeline.submit({'type': kind, 'message': kind, 'priority': 2})
+    assert [n['type'] for n in pipeline.flush(0.016)] == ['vip', 'festival']
+    assert [n['type'] for n in pipeline.flush(0.016)] == ['drill']
+    assert pipeline.flush(5.0) == []
+    
+    # Critical notifications skip the rate limit
+    pipeline.submit({'type': 'sale', 'message': 'Fire sale', 'priority': 3})
+    batch = pipeline.flush(0.016)
+    assert batch[0]['count'] == 2 and batch[0]['priority'] == 3
+    assert pipeline.flush(10.0) == []
@@ -0,0 +1,44 @@
+import pytest
+from core.occupancy import OccupancyIndex
+
+def make_index(floors=10, width=20):
+    index = OccupancyIndex(width, 300)
+    for _ in range(floors):
+        index.add_floor()
+    return index
+
+def test_fits_and_occupy():
+    index = make_index()
+    
+    assert index.fits(0, 0, 3, 2)
+    index.occupy(0, 0, 3, 2)
+    
+    # Overlapping and out of bounds blocks are rejected
+    assert not index.fits(2, 1, 3, 1)
+    assert not index.fits(18, 0, 3, 1)
+    assert not index.fits(0, 9, 1, 2)
+    assert index.fits(3, 0, 3, 2)
+    
+    index.release(0, 0, 3, 2)
+    assert index.fits(0, 0, 3, 2)
+    
+def test_floor_spans():
+    index = make_index()
+    index.occupy_floors(2, 2)
+    index.occupy(5, 7, 1, 1)
+    
+    assert not index.is_span_free(1, 2)
+    assert index.is_span_free(4, 3)
+    assert index.next_free_span(2) == 0
+    assert index.next_free_span(3) == 4
+    assert index.next_free_span(3, start=5) is None
+    assert index.free_spans(2) == [0, 4, 5, 8]
+    assert index.occupied_floor_count() == 3
+    
+def test_next_free_block():
+    index = make_index(floors=2, width=8)
+    index.occupy(0, 0, 6, 1)
+    
+    assert index.next_free_block(2, 1) == (6, 0)
+    assert index.next_free_block(3, 1) == (0, 1)
+    assert index.next_free_block(3, 2) is None
@@ -0,0 +1,88 @@
+import random
+from collections import Counter
+from core.random_events import BusinessEventSampler, EVENT_RATE, EVENT_CHANCES, event_probabilities
+
+BUSINESSES = 500
+TICKS = 1000
+CHI2_CRITICAL = {6: 22.458, 8: 26.124}  # p = 0.001
+
+def chi_square(observed, expected):
+    return sum((observed[k] - expected[k]) ** 2 / expected[k] for k in expected)
+
+def legacy_counts(rng):
+    """The original per-tick coin flips from Tower._check_random_events"""
+    counts = Counter()
+    for _ in range(BUSINESSES * TICKS):
+        if rng.random() < EVENT_RATE:
+            for event, chance in EVENT_CHANCES:
+                if rng.random() < chance:
+                    counts[event] += 1
+                    break
+    return counts
+
+def sampler_counts(rng):
+    sampler = BusinessEventSampler(rng=rng)
+    businesses = [object() for _ in range(BUSINESSES)]
+    for business in businesses:
+        sampler.add(business)
+    counts = Counter()
+    for _ in range(TICKS):
+        for business, event in sampler.advance():
+            counts[event] += 1
+    return counts
+
+def with_quiet_ticks(counts):
+    counts = Counter(counts)
+    counts[None] = BUSINESSES * TICKS - sum(counts.values())
+    return counts
+
+def test_event_mix_matches_coin_flip_probabilities():
+    probabilities = event_probabilities()
+    expected = {event: p * BUSINESSES * TICKS for event, p in probabilities.items()}
+    expected[None] = BUSINESSES * TICKS - sum(expected.values())
+    
+    observed = with_quiet_ticks(sampler_counts(random.Random(7)))
+    assert chi_square(observed, expected) < CHI2_CRITICAL[6]
+
+def test_sampler_and_legacy_flips_agree():
+    # Two-sample chi-square test of homogeneity between the two generators
+    legacy = with_quiet_ticks(legacy_counts(random.Random(11)))
+    sampled = with_quiet_ticks(sampler_counts(random.Random(13)))
+    total = BUSINESSES * TICKS
+    statistic = 0.0
+    for key in legacy.keys() | sampled.keys():
+        pooled = (legacy[key] + sampled[key]) / 2
+        statistic += ((legacy[key] - pooled) ** 2 + (sampled[key] - pooled) ** 2) / pooled
+    assert statistic < CHI2_CRITICAL[6]
+
+def test_gaps_are_geometric():
+    sampler = BusinessEventSampler(rng=random.Random(5))
+    q = sampler.trigger_chance
+    gaps = [sampler._gap() for _ in range(20000)]
+    
+    # Bin the gaps and compare with the geometric distribution, P(gap >= k) = (1 - q) ** (k - 1)
+    edges = [1, 10, 25, 50, 100, 150, 200, 300, 500]
+    observed = Counter(sum(gap >= edge for edge in edges) for gap in gaps)
+    survival = [(1 - q) ** (edge - 1) for edge in edges] + [0.0]
+    expected = {i + 1: len(gaps) * (survival[i] - survival[i + 1]) for i in range(len(edges))}
+    assert chi_square(observed, expected) < CHI2_CRITICAL[8]
+
+def test_removed_businesses_stop_firing():
+    sampler = BusinessEventSampler(rate=1.0, rng=random.Random(1))
+    business = object()
+    sampler.add(business)
+    sampler.remove(business)
+    assert all(not sampler.advance() for _ in range(50))
+
+def test_advance_by_replays_single_ticks():
+    stepped = BusinessEventSampler(rng=random.Random(9))
+    skipped = BusinessEventSampler(rng=random.Random(9))
+    businesses = [object() for _ in range(20)]
+    for business in businesses:
+        stepped.add(business)
+        skipped.add(business)
+    
+    expected = [fired for _ in range(5000) for fired in stepped.advance()]
+    assert expected
+    assert skipped.advance_by(1234) + skipped.advance_by(3766) == expected
+    assert skipped.tick == stepped.tick == 5000
@@ -0,0 +1,84 @@
+import time
+import pytest
+from core.simulation import Simulation
+from core.sim_thread import SimulationThread
+from entities.business import BusinessType
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        assert time.perf_counter() < deadline, "timed out"
+        time.sleep(0.005)
+
+def test_worker_ticks_and_runs_commands(monkeypatch):
+    sim = Simulation(map_name=None)
+    # Random business events would post notifications of their own
+    monkeypatch.setattr(sim.tower, '_fire_random_events', lambda: None)
+    sim.tick_rate = 200
+    worker = SimulationThread(sim)
+    worker.start()
+    try:
+        floors = worker.submit(lambda: [sim.tower.add_floor() for _ in range(10)])
+        placed = worker.submit(sim.tower.add_business, BusinessType.RESTAURANT, 2)
+        assert placed.result(timeout=5)
+        assert len(floors.result(timeout=5)) == 10
+        
+        start = worker.latest().tick
+        wait_for(lambda: worker.latest().tick >= start + 5)
+        snapshot = worker.latest()
+        assert snapshot.state['tower']['total_businesses'] == 1
+        with pytest.raises(TypeError):
+            snapshot.state['ticks'] = 0
+        assert snapshot.render['time'] >= snapshot.previous_render['time']
+        
+        worker.submit(sim.time_system.notify, 'sale', 'Sale on floor 3')
+        wait_for(lambda: worker.latest().tick >= snapshot.tick + 3)
+        assert [n.message for n in worker.drain_notifications()] == ['Sale on floor 3']
+        assert worker.drain_notifications() == []
+    finally:
+        worker.stop()
+    assert not worker.running
+
+def test_command_errors_come_back_on_the_future():
+    worker = SimulationThread(Simulation(map_name=None))
+    worker.start()
+    try:
+        future = worker.submit(lambda: 1 / 0)
+        with pytest.raises(ZeroDivisionError):
+            future.result(timeout=5)
+    finally:
+        worker.stop()
+
+def test_snapshots_carry_floor_stats():
+    sim = Simulation(map_name=None)
+    worker = SimulationThread(sim)
+    worker.start()
+    try:
+        worker.submit(lambda: [sim.tower.add_floor() for _ in range(4)]).result(timeout=5)
+        assert worker.submit(sim.tower.add_business, BusinessType.RESTAURANT, 2).result(timeout=5)
+        placed = worker.latest().tick
+        wait_for(lambda: worker.latest().tick > placed)
+        floors = worker.latest().floors
+        assert len(floors) == len(sim.tower.floors)
+        assert floors[2]['business_type'] == BusinessType.RESTAURANT.value
+        assert 'business_type' not in floors[0]
+        with pytest.raises(TypeError):
+            floors[2]['customers'] = 0
+    finally:
+        worker.stop()
+
+def test_failed_tick_stops_the_worker_and_surfaces_the_error(monkeypatch):
+    sim = Simulation(map_name=None)
+    worker = SimulationThread(sim)
+    monkeypatch.setattr(sim, 'step', lambda dt: 1 / 0)
+    worker.start()
+    try:
+        wait_for(lambda: not worker.running)
+        with pytest.raises(ZeroDivisionError):
+            worker.latest()
+        with pytest.raises(ZeroDivisionError):
+            worker.interpolated()
+        with pytest.raises(ZeroDivisionError):
+            worker.submit(sim.tower.add_floor).result(timeout=5)
+    finally:
+        worker.stop()
@@ -0,0 +1,134 @@
+import os
+import subprocess
+import sys
+import pytest
+from datetime import timedelta
+from core.simulation import Simulation
+from entities.business import BusinessType
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_simulation_runs_headless():
+    sim = Simulation(map_name=None)
+    for _ in range(10):
+        sim.tower.add_floor()
+    assert sim.tower.add_business(BusinessType.RESTAURANT, 0)
+    assert sim.tower.add_business(BusinessType.HOTEL, 2)
+    assert not sim.tower.add_business(BusinessType.OFFICE, 3)
+    
+    start_balance = sim.economy.balance
+    sim.run_days(2)
+    
+    state = sim.get_state()
+    assert state['time'].day == 3
+    assert state['tower']['total_businesses'] == 2
+    assert sim.economy.balance != start_balance
+    
+def test_simulation_does_not_import_kivy():
+    code = ("import sys; import core.simulation; "
+            "sys.exit('kivy' in sys.modules)")
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([os.path.join(ROOT, 'src'), ROOT]))
+    assert subprocess.run([sys.executable, '-c', code], env=env).returncode == 0
+    
+def test_fast_forward_matches_stepping(monkeypatch):
+    stepped = Simulation(map_name=None)
+    skipped = Simulation(map_name=None)
+    for sim in (stepped, skipped):
+        # Random business events are not part of the closed-form path
+        monkeypatch.setattr(sim.tower, '_fire_random_events', lambda ticks=1: None)
+        for _ in range(5):
+            sim.tower.add_floor()
+        sim.tower.add_business(BusinessType.OFFICE, 0)
+        sim.tower.add_business(BusinessType.RESTAURANT, 2)
+    
+    stepped.run_days(3)
+    skipped.fast_forward(timedelta(days=3))
+    
+    assert skipped.time_system.current_time == stepped.time_system.current_time
+    for a, b in zip(stepped.tower.businesses, skipped.tower.businesses):
+        assert b.satisfaction == pytest.approx(a.satisfaction, abs=1)
+        assert abs(len(b.customers) - len(a.customers)) <= 5  # One tick of customer movement
+    assert skipped.economy.balance == pytest.approx(stepped.economy.balance, rel=0.05)
+
+def frame_until(sim, seconds, speed=120):
+    """Drive a simulation through its real-time frame loop for a span of game time"""
+    sim.time_system.speed_multiplier = speed
+    end = sim.time_system.ticks + seconds
+    while sim.time_system.ticks < end:
+        sim.frame(1 / 30)
+
+def test_fast_forward_matches_frame_loop(monkeypatch):
+    stepped = Simulation(map_name=None)
+    skipped = Simulation(map_name=None)
+    for sim in (stepped, skipped):
+        monkeypatch.setattr(sim.tower, '_fire_random_events', lambda ticks=1: None)
+        for _ in range(5):
+            sim.tower.add_floor()
+        sim.tower.add_business(BusinessType.OFFICE, 0)
+        sim.tower.add_business(BusinessType.RESTAURANT, 2)
+    
+    updates = []
+    update = stepped.tower.update
+    monkeypatch.setattr(stepped.tower, 'update', lambda dt: updates.append(dt) or update(dt))
+    frame_until(stepped, 3 * 86400)
+    skipped.fast_forward(timedelta(days=3))
+    
+    # The tower steps per game minute, not per 0.1 s frame-loop tick
+    assert len(updates) == 3 * 86400 // stepped.tower.TICK_SECONDS
+    assert skipped.time_system.current_time == stepped.time_system.current_time
+    for a, b in zip(stepped.tower.businesses, skipped.tower.businesses):
+        assert b.satisfaction == pytest.approx(a.satisfaction, abs=1)
+        assert abs(len(b.customers) - len(a.customers)) <= 5
+    assert skipped.economy.balance == pytest.approx(stepped.economy.balance, rel=0.05)
+
+def test_fast_forward_events_match_frame_loop():
+    runs = []
+    for skip in (False, True):
+        sim = Simulation(map_name=None, seed=11)
+        for _ in range(5):
+            sim.tower.add_floor()
+        sim.tower.add_business(BusinessType.RESTAURANT, 0)
+        events = []
+        sim.tower.on_business_event = lambda business, event: events.append(event)
+        if skip:
+            sim.fast_forward(timedelta(days=2))
+        else:
+            frame_until(sim, 2 * 86400)
+        runs.append(events)
+    assert runs[0] and runs[0] == runs[1]
+
+def test_fast_forward_fires_business_events():
+    sim = Simulation(map_name=None, seed=3)
+    for _ in range(5):
+        sim.tower.add_floor()
+    sim.tower.add_business(BusinessType.RESTAURANT, 0)
+    events = []
+    sim.tower.on_business_event = lambda business, event: events.append(event)
+    
+    sim.fast_forward(timedelta(days=7))
+    # One update tick per TICK_SECONDS of skipped time, as when stepping
+    assert sim.tower.event_sampler.tick == 7 * 86400 // sim.tower.TICK_SECONDS
+    assert events
+
+def test_fixed_timestep_is_independent_of_frame_rate():
+    fast, slow = Simulation(map_name=None), Simulation(map_name=None)
+    for _ in range(120):
+        fast.frame(1 / 120)
+    for _ in range(20):
+        slow.frame(1 / 20)
+    assert fast.ticks == slow.ticks == fast.tick_rate
+    
+    # A long stall only catches up MAX_FRAME_TIME worth of ticks
+    before = slow.ticks
+    alpha = slow.frame(5.0)
+    assert slow.ticks - before == int(slow.config.MAX_FRAME_TIME * slow.tick_rate)
+    assert 0 <= alpha < 1
+
+def test_interpolation_blends_between_ticks():
+    sim = Simulation(map_name=None)
+    sim.time_system.speed_multiplier = 600
+    sim.frame(1 / sim.tick_rate)
+    sim.frame(1 / sim.tick_rate)
+    start, end = sim._previous['time'], sim._current['time']
+    assert end - start == 60
+    assert sim.interpolate(0.5)['time'] == start + 30
@@ -0,0 +1,129 @@
+import pytest
+from core.synergy import SynergyCache
+from entities.business import Business
+
+def test_invalidate_marks_radius():
+    cache = SynergyCache()
+    assert cache.is_clean
+    
+    cache.invalidate(10, size=2)
+    assert cache.layout_version == 1
+    assert cache.dirty_floors == set(range(5, 17))
+    
+def test_take_dirty_clears():
+    cache = SynergyCache()
+    cache.invalidate(0)
+    
+    assert cache.take_dirty() == set(range(0, 6))
+    assert cache.is_clean
+    assert cache.take_dirty() == set()
+
+def build_tower(seed, floors=120):
+    import random
+    from core.tower_core import TowerCore
+    from entities.business import BusinessType
+    rng = random.Random(seed)
+    tower = TowerCore(None)
+    while len(tower.floors) < floors:
+        tower.add_floor()
+    if seed is None:
+        # Combos only count when their types sit at the same distance, so lay some out by hand
+        layout = [(8, BusinessType.RESTAURANT), (10, BusinessType.SPA), (12, BusinessType.HOTEL),
+                  (30, BusinessType.CINEMA), (34, BusinessType.RESTAURANT), (35, BusinessType.ARCADE)]
+        for floor, business_type in layout:
+            tower.add_business(business_type, floor)
+        return tower
+    for floor in range(floors):
+        if rng.random() < 0.7:
+            tower.add_business(rng.choice(list(BusinessType)), floor)
+    return tower
+
+@pytest.mark.parametrize("seed", [1, 2, 3, None])
+def test_bulk_synergy_matches_scalar(seed):
+    pytest.importorskip("numpy")
+    from core.synergy import bulk_synergy
+    from entities.business import BusinessInteraction, TYPE_INDEX
+    tower = build_tower(seed)
+    businesses = tower.businesses
+    assert any(b.size > 1 for b in businesses)
+    has_combo = False
+    
+    synergy, competition, special, combos = bulk_synergy(
+        [(b.floor, TYPE_INDEX[b.type], b.size) for b in businesses], len(tower.floors))
+    scalar = []
+    for i, business in enumerate(businesses):
+        nearby = tower._get_nearby_businesses(business.floor, SynergyCache.RADIUS)
+        groups = {}
+        for other in nearby:
+            groups.setdefault(abs(business.floor - other.floor), []).append(other)
+        effects = [BusinessInteraction.calculate_interactions(business.type, group, d)
+                   for d, group in groups.items() if d <= SynergyCache.RADIUS]
+        assert synergy[i] == pytest.approx(sum(e[0] for e in effects))
+        assert competition[i] == pytest.approx(sum(e[1] for e in effects))
+        assert special[i] == pytest.approx(max([e[2] for e in effects], default=0.0))
+        
+        business.update_synergy(nearby)
+        scalar.append((business.synergy_bonus, business.active_combos))
+        has_combo |= bool(business.active_combos)
+    assert combos.any() == has_combo
+    assert has_combo or seed is not None
+    
+    tower.rebuild_synergies()
+    for business, (bonus, active) in zip(businesses, scalar):
+        assert business.synergy_bonus == pytest.approx(bonus)
+        assert business.active_combos == active
+
+def test_full_invalidation_uses_bulk_path(monkeypatch):
+    pytest.importorskip("numpy")
+    tower = build_tower(4)
+    calls = []
+    monkeypatch.setattr(tower, 'rebuild_synergies', lambda: calls.append(1))
+    tower.synergy_cache.take_dirty()
+    tower.synergy_cache.invalidate_all(len(tower.floors))
+    tower._refresh_synergies()
+    assert calls == [1]
+
+@pytest.mark.parametrize("business_type", ['RESTAURANT', 'HOTEL', 'SPA', 'CINEMA'])
+def test_placement_scores_match_trial_placement(business_type):
+    pytest.importorskip("numpy")
+    from core.synergy import bulk_synergy
+    from entities.business import BusinessType, TYPE_INDEX
+    business_type = BusinessType[business_type]
+    tower = build_tower(7, floors=80)
+    while len(tower.floors) < 90:
+        tower.add_floor()  # Leave room for tall businesses at the top
+    
+    def raw_effects():
+        placements = [(b.floor, TYPE_INDEX[b.type], b.size) for b in tower.businesses]
+        synergy, competition, special, _ = bulk_synergy(placements, len(tower.floors))
+        return {b.floor: (s, c, x) for b, s, c, x in zip(tower.businesses, synergy, competition, special)}
+    
+    scores = tower.placement_scores(business_type)
+    assert len(scores.floors) == len(tower.occupancy.free_spans(Business(business_type, 0).size))
+    assert tower.placement_scores(business_type) is scores  # Cached until the layout changes
+    before = raw_effects()
+    for i, floor in enumerate(scores.floors.tolist()):
+        assert tower.add_business(business_type, floor)
+        after = raw_effects()
+        assert after[floor] == pytest.approx((scores.synergy[i], scores.competition[i], scores.special[i]))
+        assert sum(after[f][0] + after[f][1] - s - c for f, (s, c, _) in before.items()) == \
+            pytest.approx(scores.neighbour_effect[i])
+        assert sum(after[f][2] - x for f, (_, _, x) in before.items()) == pytest.approx(scores.neighbour_special[i])
+        tower.remove_business(floor)
+    
+    assert tower.placement_scores(business_type) is not scores
+    assert scores.best() in scores.floors
+
+def test_placement_scores_find_combo_spot():
+    pytest.importorskip("numpy")
+    from core.tower_core import TowerCore
+    from entities.business import BusinessType
+    tower = TowerCore(None)
+    while len(tower.floors) < 30:
+        tower.add_floor()
+    tower.add_business(BusinessType.RESTAURANT, 8)
+    tower.add_business(BusinessType.HOTEL, 12)
+    scores = tower.placement_scores(BusinessType.SPA)
+    # Halfway between them the spa completes the Luxury Resort Package for itself and both neighbours
+    assert scores.best() == 10
+    assert scores.special[list(scores.floors).index(10)] == pytest.approx(0.3)
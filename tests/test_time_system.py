@@ -0,0 +1,149 @@
+import pytest
+from datetime import datetime, timedelta
+from core.config import Config
+from core.time_system import (TimeSystem, EventQueue, GameEvent, EventPriority, NotificationBuffer,
+                              EventNotification, to_ticks)
+
+def noop(data):
+    pass
+
+def test_queue_orders_by_time_then_priority():
+    queue = EventQueue()
+    base = 0
+    late = GameEvent(base + 7200, noop)
+    low = GameEvent(base, noop, priority=EventPriority.LOW)
+    high = GameEvent(base, noop, priority=EventPriority.HIGH)
+    first_medium = GameEvent(base, noop)
+    second_medium = GameEvent(base, noop)
+    for event in (late, low, first_medium, high, second_medium):
+        queue.push(event)
+    
+    assert [queue.pop() for _ in range(5)] == [high, first_medium, second_medium, low, late]
+    
+def test_events_fire_in_order():
+    time_system = TimeSystem(Config)
+    fired = []
+    time_system.schedule_event(lambda d: fired.append(d['n']), timedelta(seconds=20), {'n': 2})
+    time_system.schedule_event(lambda d: fired.append(d['n']), timedelta(seconds=10), {'n': 1})
+    
+    time_system.update(15)
+    assert fired == [1]
+    time_system.update(10)
+    assert fired == [1, 2]
+    
+def test_recurring_event_is_rearmed():
+    time_system = TimeSystem(Config)
+    fired = []
+    time_system.schedule_recurring_event(lambda d: fired.append(time_system.current_time),
+                                         time_system.current_time + timedelta(seconds=10),
+                                         timedelta(seconds=10), EventPriority.LOW)
+    pending = len(time_system.events)
+    
+    time_system.update(35)
+    assert len(fired) == 3
+    assert len(time_system.events) == pending
+    
+def test_clock_counts_whole_ticks():
+    time_system = TimeSystem(Config)
+    start = time_system.ticks
+    assert to_ticks(time_system.current_time) == start
+    
+    for _ in range(60):
+        time_system.update(1 / 60)
+    assert time_system.ticks == start + 1
+    assert time_system.current_hour == Config.OPENING_HOUR + 1 / 3600
+    
+def test_cancel_and_reschedule():
+    time_system = TimeSystem(Config)
+    fired = []
+    cancelled = time_system.schedule_event(lambda d: fired.append('a'), timedelta(seconds=10))
+    moved = time_system.schedule_event(lambda d: fired.append('b'), timedelta(seconds=10))
+    pending = len(time_system.events)
+    
+    assert cancelled.cancel()
+    assert not cancelled.cancel()
+    assert len(time_system.events) == pending - 1
+    assert moved.reschedule(timedelta(seconds=30))
+    
+    time_system.update(20)
+    assert fired == []
+    time_system.update(20)
+    assert fired == ['b']
+    assert not moved.pending
+    
+def test_reschedule_after_cancel_or_fire_does_nothing():
+    time_system = TimeSystem(Config)
+    fired = []
+    cancelled = time_system.schedule_event(lambda d: fired.append('a'), timedelta(seconds=10))
+    done = time_system.schedule_event(lambda d: fired.append('b'), timedelta(seconds=5))
+    assert cancelled.cancel()
+    time_system.update(5)
+    assert fired == ['b']
+    pending = len(time_system.events)
+    
+    assert not cancelled.reschedule(timedelta(seconds=30))
+    assert not done.reschedule(timedelta(seconds=30))
+    assert not cancelled.pending and not done.pending
+    assert len(time_system.events) == pending
+    time_system.update(60)
+    assert fired == ['b']
+    
+def test_cancelled_entries_are_compacted():
+    queue = EventQueue()
+    events = [GameEvent(i, noop) for i in range(1000)]
+    for event in events:
+        queue.push(event)
+    for event in events[:900]:
+        queue.remove(event)
+    
+    assert len(queue) == 100
+    assert len(queue._heap) < 1000
+    assert queue.pop() is events[900]
+    
+def test_skip_jumps_to_next_event():
+    time_system = TimeSystem(Config)
+    skipped = []
+    time_system.on_time_skipped = lambda start, seconds: skipped.append(seconds)
+    fired = []
+    time_system.schedule_event(lambda d: fired.append(time_system.current_time), timedelta(minutes=30))
+    time_system.update(0)  # Fire the daily check due at the start time
+    start = time_system.current_time
+    
+    time_system.set_speed('skip')
+    time_system.update(1 / 60)
+    assert fired == [start + timedelta(minutes=30)]
+    assert skipped == [1800]
+    
+    time_system.advance(timedelta(days=2))
+    assert time_system.current_time == start + timedelta(minutes=30, days=2)
+    assert sum(skipped) == 1800 + 2 * 86400
+
+    
+def test_notification_buffer_is_bounded_per_priority():
+    buffer = NotificationBuffer(capacity=8)
+    base = datetime(2025, 1, 1)
+    critical = EventNotification('kaiju', 'Kaiju!', base, EventPriority.CRITICAL)
+    buffer.push(critical)
+    for i in range(100):
+        buffer.push(EventNotification('weather', str(i), base, EventPriority.LOW))
+    
+    assert len(buffer) == 9
+    unread = buffer.unread()
+    assert unread[0] is critical
+    assert [n.message for n in unread[1:]] == [str(i) for i in range(92, 100)]
+    assert buffer.unread(EventPriority.HIGH) == [critical]
+    
+def test_notifications_unread_cursor_and_expiry():
+    time_system = TimeSystem(Config)
+    first = time_system.notify('sale', 'Sale on floor 3')
+    second = time_system.notify('vip', 'VIP arrived', EventPriority.HIGH)
+    time_system.mark_notification_read(second)
+    assert time_system.get_notifications(unread_only=True) == [first]
+    time_system.mark_notification_read(first)
+    assert time_system.get_notifications(unread_only=True) == []
+    assert time_system.get_notifications() == [first, second]
+    
+    time_system.update(3600)
+    third = time_system.notify('sale', 'Another sale')
+    assert time_system.clear_old_notifications(timedelta(minutes=30)) == 2
+    assert time_system.get_notifications() == [third]
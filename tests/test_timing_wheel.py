@@ -0,0 +1,57 @@
+import random
+from datetime import timedelta
+from core.config import Config
+from core.time_system import TimeSystem, EventQueue, GameEvent, EventPriority
+from core.timing_wheel import TimingWheel
+
+def noop(data):
+    pass
+
+def test_wheel_matches_heap_order():
+    rng = random.Random(3)
+    priorities = list(EventPriority)
+    # Spread across every wheel level and the overflow heap
+    times = [rng.choice((0, 1, 59, 60, 3599, 3600, 86399, 86400, 86400 * 70)) + rng.randrange(5)
+             for _ in range(500)]
+    chosen = [rng.choice(priorities) for _ in times]
+    queues = (EventQueue(), TimingWheel())
+    for queue in queues:
+        # Each queue gets its own events since they hold a reference to their entry
+        events = [GameEvent(t, noop, priority=p, data={'id': i})
+                  for i, (t, p) in enumerate(zip(times, chosen))]
+        for event in events:
+            queue.push(event)
+        for event in events[::7]:
+            queue.remove(event)
+    heap, wheel = queues
+    
+    assert len(wheel) == len(heap)
+    assert [e.data for e in wheel] == [e.data for e in heap]
+    assert ([wheel.pop().data for _ in range(len(wheel))] ==
+            [heap.pop().data for _ in range(len(heap))])
+    assert wheel.next_time() is None
+
+def test_push_behind_cursor_is_still_ordered():
+    wheel = TimingWheel()
+    late = GameEvent(5000, noop)
+    wheel.push(late)
+    assert wheel.next_time() == 5000  # Cursor has moved up to the event
+    early = GameEvent(100, noop)
+    wheel.push(early)
+    
+    assert wheel.pop() is early
+    assert wheel.pop() is late
+
+def test_recurring_events_on_wheel_backend():
+    heap_system = TimeSystem(Config)
+    wheel_system = TimeSystem(Config, backend='wheel')
+    fired = {heap_system: [], wheel_system: []}
+    for system in (heap_system, wheel_system):
+        for minutes in (7, 60, 90):
+            system.schedule_recurring_event(lambda d, s=system: fired[s].append((s.ticks, d['m'])),
+                                            system.current_time, timedelta(minutes=minutes),
+                                            EventPriority.LOW, {'m': minutes})
+        system.advance(timedelta(days=2))
+    
+    assert fired[wheel_system] == fired[heap_system]
+    assert len(wheel_system.events) == len(heap_system.events)
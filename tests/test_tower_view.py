@@ -0,0 +1,40 @@
+import pytest
+
+pytest.importorskip('kivy')
+
+from kivy.graphics import Rectangle
+from src.core.tower import Tower
+from src.core.tower_core import TowerCore
+from entities.business import BusinessType
+
+def rectangles(group):
+    return [child for child in group.children if isinstance(child, Rectangle)]
+
+def make_tower(floors=6):
+    tower = Tower(core=TowerCore(None))
+    for _ in range(floors):
+        tower.add_floor()
+    return tower
+
+def test_placed_business_is_drawn_into_its_floors():
+    tower = make_tower()
+    empty = len(rectangles(tower._floor_group(4)))
+    assert tower.add_business(BusinessType.RESTAURANT, 2)
+    business = tower.floors[2].business
+    for floor_num in range(2, 2 + business.size):
+        assert tower.floors[floor_num].tiles == [business] * tower.floor_width
+        assert len(rectangles(tower._floor_group(floor_num))) == empty + 1
+    assert len(rectangles(tower._floor_group(4))) == empty
+    
+    assert tower.remove_business(2)
+    assert len(rectangles(tower._floor_group(2))) == empty
+    assert tower.floors[2].tiles == [None] * tower.floor_width
+
+def test_theme_change_redraws_floors():
+    tower = make_tower(2)
+    redrawn = []
+    tower.redraw_floors = lambda start, count=1: redrawn.append((start, count))
+    tower.core.current_theme = 'neon'
+    assert redrawn == [(0, len(tower.floors))]
+    tower.core.current_theme = 'neon'
+    assert len(redrawn) == 1